@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Benchmark of the coil and discrete input bit codec
+
+Compares packing and unpacking of the largest coil payloads by the table
+driven codec of umodbus/bits.py with the previous implementation formatting
+each byte as binary string. Run on a device, the MicroPython unix port or
+CPython from the root of this repo
+
+    micropython benchmarks/bits.py
+    python3 benchmarks/bits.py
+"""
+
+import sys
+
+try:
+    import micropython      # noqa: F401
+except ImportError:
+    # CPython, const() is the only function required by umodbus
+    class micropython:
+        @staticmethod
+        def const(value):
+            return value
+    sys.modules['micropython'] = micropython
+
+sys.path.insert(0, '.')
+
+from umodbus import bits    # noqa: E402
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    from time import perf_counter
+
+    def ticks_us():
+        return int(perf_counter() * 1000000)
+
+    def ticks_diff(end, start):
+        return end - start
+
+
+def legacy_unpack(byte_list, bit_qty):
+    bool_list = []
+
+    for byte in byte_list:
+        this_qty = bit_qty
+        if this_qty >= 8:
+            this_qty = 8
+
+        fmt = '{:0' + str(this_qty) + 'b}'
+        bool_list.extend([bool(int(x)) for x in fmt.format(byte)])
+        bit_qty -= 8
+
+    return bool_list
+
+
+def legacy_pack(value_list):
+    sectioned_list = [value_list[i:i + 8]
+                      for i in range(0, len(value_list), 8)]
+
+    output_value = []
+    for byte in sectioned_list:
+        output = 0
+        for bit in byte:
+            output = (output << 1) | bit
+        output_value.append(output)
+
+    return bytes(output_value)
+
+
+def bench(name, func, rounds):
+    func()
+
+    start = ticks_us()
+    for _ in range(rounds):
+        func()
+    duration = ticks_diff(ticks_us(), start) / rounds
+
+    print('{:<16} {:>10.1f} us'.format(name, duration))
+
+    return duration
+
+
+def main():
+    # largest read coils response
+    quantity = 2000
+    data = bytes((idx * 37) & 0xFF for idx in range(quantity // 8))
+    states = bits.unpack_bits(data=data, quantity=quantity)
+    rounds = 50
+
+    if legacy_unpack(data, quantity) != states or \
+            legacy_pack(states) != bits.pack_bits(values=states):
+        raise ValueError('codec results differ')
+
+    print('{} coils'.format(quantity))
+    old = bench('unpack legacy',
+                lambda: legacy_unpack(data, quantity),
+                rounds)
+    new = bench('unpack table',
+                lambda: bits.unpack_bits(data=data, quantity=quantity),
+                rounds)
+    print('{:<16} {:>10.1f} x'.format('speedup', old / new))
+
+    old = bench('pack legacy', lambda: legacy_pack(states), rounds)
+    new = bench('pack unrolled',
+                lambda: bits.pack_bits(values=states),
+                rounds)
+    print('{:<16} {:>10.1f} x'.format('speedup', old / new))
+
+    bitset = bits.BitSet(quantity=quantity, data=data)
+    bench('bitset access', lambda: bitset[quantity - 1], rounds)
+
+
+main()
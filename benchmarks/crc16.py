@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Benchmark of the CRC16 implementations
+
+Run on a device, the MicroPython unix port or CPython from the root of this
+repo. The CPU frequency used to calculate the cycles per byte is taken from
+machine.freq() or can be given in MHz as first argument
+
+    micropython benchmarks/crc16.py 1000
+    python3 benchmarks/crc16.py 1000
+"""
+
+import sys
+
+try:
+    import micropython      # noqa: F401
+except ImportError:
+    # CPython, const() is the only function required by umodbus
+    class micropython:
+        @staticmethod
+        def const(value):
+            return value
+    sys.modules['micropython'] = micropython
+
+sys.path.insert(0, '.')
+
+from umodbus import crc     # noqa: E402
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    from time import perf_counter
+
+    def ticks_us():
+        return int(perf_counter() * 1000000)
+
+    def ticks_diff(end, start):
+        return end - start
+
+
+def cpu_mhz():
+    try:
+        import machine
+        return machine.freq() / 1000000
+    except Exception:
+        pass
+
+    if len(sys.argv) > 1:
+        return float(sys.argv[1])
+
+    return None
+
+
+def bench(name, func, data, rounds):
+    func(data, 0, len(data), 0xFFFF)
+
+    start = ticks_us()
+    for _ in range(rounds):
+        func(data, 0, len(data), 0xFFFF)
+    duration = ticks_diff(ticks_us(), start)
+
+    us_per_byte = duration / (rounds * len(data))
+    line = '{:<8} {:>10.3f} us/byte'.format(name, us_per_byte)
+
+    mhz = cpu_mhz()
+    if mhz:
+        line += ' {:>10.1f} cycles/byte'.format(us_per_byte * mhz)
+
+    print(line)
+
+
+def main():
+    # largest Modbus RTU frame
+    data = memoryview(bytearray(range(256)))
+    rounds = 200
+
+    bench('python', crc._crc16_py, data, rounds)
+
+    if crc.NATIVE:
+        bench('viper', crc._crc16_impl, data, rounds)
+    else:
+        print('viper    not available')
+
+
+main()
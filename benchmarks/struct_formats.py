@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Benchmark of the prebuilt register struct formats
+
+Compares decoding and encoding of the largest register payloads with the
+formats of umodbus.functions.register_format against building the format
+string by repetition on every call as before. Run on a device, the
+MicroPython unix port or CPython from the root of this repo
+
+    micropython benchmarks/struct_formats.py
+    python3 benchmarks/struct_formats.py
+"""
+
+import gc
+import struct
+import sys
+
+try:
+    import micropython      # noqa: F401
+except ImportError:
+    # CPython, const() is the only function required by umodbus
+    class micropython:
+        @staticmethod
+        def const(value):
+            return value
+    sys.modules['micropython'] = micropython
+
+sys.path.insert(0, '.')
+
+from umodbus import functions   # noqa: E402
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    from time import perf_counter
+
+    def ticks_us():
+        return int(perf_counter() * 1000000)
+
+    def ticks_diff(end, start):
+        return end - start
+
+
+def legacy_to_short(byte_array, signed=True):
+    response_quantity = int(len(byte_array) / 2)
+    fmt = '>' + (('h' if signed else 'H') * response_quantity)
+
+    return struct.unpack(fmt, byte_array)
+
+
+def legacy_response(function_code, value_list, signed=True):
+    quantity = len(value_list)
+    fmt = ('h' if signed else 'H') * quantity
+
+    return struct.pack('>BB' + fmt, function_code, quantity * 2, *value_list)
+
+
+def bench(name, func, rounds):
+    func()
+
+    gc.collect()
+    mem = gc.mem_free() if hasattr(gc, 'mem_free') else None
+    start = ticks_us()
+    for _ in range(rounds):
+        func()
+    duration = ticks_diff(ticks_us(), start) / rounds
+
+    line = '{:<18} {:>10.1f} us'.format(name, duration)
+    if mem is not None:
+        # MicroPython only, bytes allocated per call
+        line += ' {:>8.0f} bytes'.format((mem - gc.mem_free()) / rounds)
+    print(line)
+
+    return duration
+
+
+def main():
+    # largest read registers response
+    quantity = 125
+    values = list(range(quantity))
+    data = functions.response(function_code=3,
+                              request_register_addr=0,
+                              request_register_qty=quantity,
+                              request_data=None,
+                              value_list=values)[2:]
+    rounds = 500
+
+    if legacy_to_short(data) != functions.to_short(byte_array=data) or \
+            legacy_response(3, values) != functions.response(
+                function_code=3,
+                request_register_addr=0,
+                request_register_qty=quantity,
+                request_data=None,
+                value_list=values):
+        raise ValueError('results differ')
+
+    print('{} registers'.format(quantity))
+    old = bench('decode legacy', lambda: legacy_to_short(data), rounds)
+    new = bench('decode prebuilt',
+                lambda: functions.to_short(byte_array=data),
+                rounds)
+    print('{:<18} {:>10.1f} x'.format('speedup', old / new))
+
+    old = bench('encode legacy', lambda: legacy_response(3, values), rounds)
+    new = bench('encode prebuilt',
+                lambda: struct.pack(
+                    functions.register_format(quantity=quantity,
+                                              prefix='>BB'),
+                    3, quantity * 2, *values),
+                rounds)
+    print('{:<18} {:>10.1f} x'.format('speedup', old / new))
+
+
+main()
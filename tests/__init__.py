@@ -2,8 +2,28 @@
 # -*- coding: UTF-8 -*-
 
 from .test_absolute_truth import *
+from .test_async_tcp import *
+from .test_bank import *
+from .test_bits import *
+from .test_cache import *
+from .test_codec import *
 from .test_const import *
+from .test_crc import *
 from .test_functions import *
+from .test_gateway import *
+from .test_index import *
+from .test_journal import *
+from .test_mbap_buffer import *
+from .test_mirror import *
+from .test_modbus import *
+from .test_planner import *
+from .test_request import *
+from .test_retry import *
+from .test_scheduler import *
+from .test_serial_framing import *
+from .test_tcp_pipeline import *
+from .test_tcp_pool import *
+from .test_tcp_server import *
 
 # TestTcpExample is a non static test and requires a running TCP client
 # from .test_tcp_example import *
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Fake host and clock shared by the unittests of the host side helpers"""
+
+import struct
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus import const as Const
+from umodbus.bits import pack_bits
+from umodbus.common import CommonModbusFunctions
+from umodbus.common import ResponseTimeoutError, SlaveExceptionError
+
+# slave not responding within the response timeout
+NOT_RESPONDING_SLAVE = 11
+# slave responding with an exception to every request
+FAILING_SLAVE = 12
+
+
+class FakeClock(object):
+    """Clock advanced by the test only, replacing the time module"""
+    def __init__(self) -> None:
+        self.ms = 0
+
+    def ticks_ms(self) -> int:
+        return self.ms
+
+    def ticks_us(self) -> int:
+        return self.ms * 1000
+
+    def ticks_add(self, ticks: int, delta: int) -> int:
+        return ticks + delta
+
+    def ticks_diff(self, end: int, start: int) -> int:
+        return end - start
+
+    def sleep_us(self, us: int) -> None:
+        self.ms += us // 1000
+
+
+class FakeHost(CommonModbusFunctions):
+    """
+    Host answering requests without a connection
+
+    Coils and discrete inputs are set at odd addresses, holding and input
+    registers contain their address or the content of ``registers``. Writes
+    are confirmed. Queued ``errors`` are raised before any response.
+
+    Each request is recorded as tuple of slave address, function code,
+    starting address and quantity in ``requests``, its PDU in ``pdus`` and
+    its response timeout in ``timeouts``.
+    """
+    def __init__(self) -> None:
+        self.requests = list()
+        self.pdus = list()
+        self.timeouts = list()
+        self.errors = list()
+        self.registers = None
+        # the clock is advanced by the timeout on each request to the not
+        # responding slave
+        self.clock = None
+        self.timeout = 0
+
+    def _send_receive(self, slave_addr, modbus_pdu, count, timeout=None):
+        function_code, address, quantity = struct.unpack_from('>BHH',
+                                                              modbus_pdu)
+        self.requests.append((slave_addr, function_code, address, quantity))
+        self.pdus.append(bytes(modbus_pdu))
+        self.timeouts.append(timeout)
+
+        if self.errors:
+            raise self.errors.pop(0)
+        if slave_addr == NOT_RESPONDING_SLAVE:
+            if self.clock is not None:
+                self.clock.ms += self.timeout
+            raise ResponseTimeoutError('no data received from slave')
+        if slave_addr == FAILING_SLAVE:
+            raise SlaveExceptionError(
+                exception_code=Const.ILLEGAL_DATA_ADDRESS)
+
+        if function_code in (Const.READ_COILS, Const.READ_DISCRETE_INPUTS):
+            return pack_bits([addr % 2
+                              for addr in range(address, address + quantity)])
+        if function_code in (Const.READ_HOLDING_REGISTERS,
+                             Const.READ_INPUT_REGISTER,
+                             Const.READ_WRITE_MULTIPLE_REGISTERS):
+            if self.registers is not None:
+                return self.registers
+            return struct.pack('>' + 'H' * quantity,
+                               *range(address, address + quantity))
+
+        # echo address and value or quantity of writes
+        return bytes(modbus_pdu[1:5])
+
+
+class HostTestCase(unittest.TestCase):
+    """Base of the unittests using a fake host"""
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+        self._host = FakeHost()
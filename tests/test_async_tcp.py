@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the asynchronous Modbus TCP client and host"""
+
+import struct
+
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus import const as Const
+from umodbus.async_tcp import AsyncModbusTCP, AsyncTCP
+from umodbus.bits import BitSet
+from umodbus.common import RetryPolicy
+from umodbus.common import ResponseTimeoutError, SlaveExceptionError
+
+LOCAL_IP = '127.0.0.1'
+# each test uses its own port, see test_tcp_server
+LOCAL_PORT = 15024
+
+
+class TestAsyncTCP(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+    def test_loopback(self) -> None:
+        """Test requests of the async host served by the async client"""
+        async def run() -> list:
+            client = AsyncModbusTCP()
+            client.add_hreg(address=10, value=[1, 2, 3])
+            client.add_coil(address=0, value=[False, False, False])
+            await client.bind(local_ip=LOCAL_IP, local_port=LOCAL_PORT)
+
+            host = AsyncTCP(slave_ip=LOCAL_IP, slave_port=LOCAL_PORT)
+            results = list()
+            try:
+                results.append(await host.read_holding_registers(
+                    slave_addr=1,
+                    starting_addr=10,
+                    register_qty=3))
+                results.append(await host.write_multiple_coils(
+                    slave_addr=1,
+                    starting_address=0,
+                    output_values=BitSet.from_list([1, 0, 1])))
+                results.append(await host.read_coils(slave_addr=1,
+                                                     starting_addr=0,
+                                                     coil_qty=3))
+                results.append(await host.read_write_multiple_registers(
+                    slave_addr=1,
+                    read_starting_addr=10,
+                    register_qty=3,
+                    write_starting_address=11,
+                    register_values=[-5]))
+
+                # requests of concurrent tasks are sent one after the other
+                results.append(await asyncio.gather(
+                    host.read_holding_registers(slave_addr=1,
+                                                starting_addr=10,
+                                                register_qty=1),
+                    host.read_holding_registers(slave_addr=1,
+                                                starting_addr=12,
+                                                register_qty=1)))
+
+                try:
+                    await host.read_holding_registers(slave_addr=1,
+                                                      starting_addr=50,
+                                                      register_qty=1)
+                except SlaveExceptionError as e:
+                    results.append(e.exception_code)
+            finally:
+                await host.close()
+                await client.close()
+
+            return results
+
+        results = asyncio.run(run())
+
+        self.assertEqual(results[0], (1, 2, 3))
+        self.assertTrue(results[1])
+        self.assertEqual(results[2], [True, False, True])
+        self.assertEqual(results[3], (1, -5, 3))
+        self.assertEqual(list(results[4]), [(1, ), (3, )])
+        self.assertEqual(results[5], Const.ILLEGAL_DATA_ADDRESS)
+
+    def test_invalid_length(self) -> None:
+        """Test closing the connection of a request with invalid length"""
+        async def run() -> tuple:
+            client = AsyncModbusTCP()
+            client.add_hreg(address=0, value=7)
+            await client.bind(local_ip=LOCAL_IP, local_port=LOCAL_PORT + 1)
+
+            try:
+                reader, writer = await asyncio.open_connection(LOCAL_IP,
+                                                               LOCAL_PORT + 1)
+                # the length exceeds the maximum ADU, the data is not awaited
+                writer.write(struct.pack('>HHH', 1, 0, 300))
+                await writer.drain()
+                closed = await asyncio.wait_for(reader.read(16), 2)
+                writer.close()
+
+                # other connections are still served
+                host = AsyncTCP(slave_ip=LOCAL_IP, slave_port=LOCAL_PORT + 1)
+                values = await host.read_holding_registers(slave_addr=1,
+                                                           starting_addr=0,
+                                                           register_qty=1)
+                await host.close()
+            finally:
+                await client.close()
+
+            return closed, values
+
+        closed, values = asyncio.run(run())
+
+        self.assertEqual(closed, b'')
+        self.assertEqual(values, (7, ))
+
+    def test_invalid_response_length(self) -> None:
+        """Test closing the connection of a response with invalid length"""
+        connections = list()
+
+        async def handle(reader, writer) -> None:
+            connections.append(writer)
+            request = await reader.readexactly(12)
+            trans_id = struct.unpack_from('>H', request, 0)[0]
+            # the length exceeds the maximum ADU, the data is not awaited
+            writer.write(struct.pack('>HHHB', trans_id, 0, 300, 1))
+            await writer.drain()
+
+        async def run() -> tuple:
+            server = await asyncio.start_server(handle,
+                                                LOCAL_IP,
+                                                LOCAL_PORT + 3)
+            host = AsyncTCP(slave_ip=LOCAL_IP,
+                            slave_port=LOCAL_PORT + 3,
+                            timeout=2)
+
+            try:
+                try:
+                    await host.read_holding_registers(slave_addr=1,
+                                                      starting_addr=0,
+                                                      register_qty=1)
+                    error = None
+                except Exception as e:
+                    error = e
+                connected = host._writer is not None
+            finally:
+                await host.close()
+                for writer in connections:
+                    writer.close()
+                server.close()
+                await server.wait_closed()
+
+            return error, connected
+
+        error, connected = asyncio.run(run())
+
+        self.assertIsInstance(error, ValueError)
+        self.assertFalse(connected)
+
+    def test_retry(self) -> None:
+        """Test retrying a request after a response timeout"""
+        connections = list()
+
+        async def handle(reader, writer) -> None:
+            connections.append(writer)
+            request = await reader.readexactly(12)
+            if len(connections) == 1:
+                # the first request is not answered
+                return
+
+            trans_id, _, _, unit_id, fc, address, _ = struct.unpack(
+                '>HHHBBHH', request)
+            writer.write(struct.pack('>HHHBBBH', trans_id, 0, 5, unit_id, fc,
+                                     2, address))
+            await writer.drain()
+
+        async def run() -> tuple:
+            server = await asyncio.start_server(handle,
+                                                LOCAL_IP,
+                                                LOCAL_PORT + 2)
+            host = AsyncTCP(slave_ip=LOCAL_IP,
+                            slave_port=LOCAL_PORT + 2,
+                            timeout=0.2)
+            policy = RetryPolicy(retries=1)
+            host.set_retry_policy(policy)
+
+            try:
+                values = await host.read_holding_registers(slave_addr=1,
+                                                           starting_addr=9,
+                                                           register_qty=1)
+
+                host.set_retry_policy(None)
+                connections.clear()
+                try:
+                    await host.read_holding_registers(slave_addr=1,
+                                                      starting_addr=9,
+                                                      register_qty=1)
+                    error = None
+                except ResponseTimeoutError as e:
+                    error = e
+            finally:
+                await host.close()
+                for writer in connections:
+                    writer.close()
+                server.close()
+                await server.wait_closed()
+
+            return values, policy, error
+
+        values, policy, error = asyncio.run(run())
+
+        self.assertEqual(values, (9, ))
+        self.assertEqual(policy.attempts, 2)
+        self.assertEqual(policy.retried, 1)
+        self.assertIsInstance(error, ResponseTimeoutError)
+
+
+if __name__ == '__main__':
+    unittest.main()
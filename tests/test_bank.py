@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing register banks of umodbus"""
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus.bank import BitBank, RegisterBank
+
+
+class TestBank(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+    def test_register_bank(self) -> None:
+        """Test getting and setting values of a register bank"""
+        bank = RegisterBank(address=100, quantity=10, value=7)
+
+        self.assertEqual(len(bank), 10)
+        self.assertIn(100, bank)
+        self.assertIn(109, bank)
+        self.assertNotIn(110, bank)
+        self.assertTrue(bank.covers(address=105, quantity=5))
+        self.assertFalse(bank.covers(address=105, quantity=6))
+        self.assertEqual(bank.get(address=109), 7)
+
+        bank.set(address=101, value=[1, 2, -1])
+        self.assertEqual(bank.get(address=101), 1)
+        self.assertEqual(bank.get(address=103), 0xFFFF)
+        self.assertEqual(list(bank.read(address=100, quantity=4)),
+                         [7, 1, 2, 0xFFFF])
+
+        with self.assertRaises(ValueError):
+            bank.set(address=108, value=[1, 2, 3])
+
+        with self.assertRaises(ValueError):
+            RegisterBank(address=0xFFFF, quantity=2)
+
+    def test_register_bank_encode_into(self) -> None:
+        """Test encoding register values of a bank into a buffer"""
+        bank = RegisterBank(address=10, quantity=4, value=[1, 258, -2, 0])
+        buf = bytearray(10)
+
+        byte_count = bank.encode_into(buf, 2, 11, 3)
+
+        self.assertEqual(byte_count, 6)
+        self.assertEqual(buf, bytearray(b'\x00\x00\x01\x02\xFF\xFE\x00\x00\x00\x00'))
+
+    def test_bit_bank(self) -> None:
+        """Test getting and setting states of a bit bank"""
+        states = [True, False, True, True, False, False, True, True,
+                  True, True, False, True, False, True, True, False,
+                  True, False, True]
+        bank = BitBank(address=10, quantity=len(states), value=states)
+
+        self.assertEqual(len(bank), 19)
+        self.assertEqual(bank.read(address=10, quantity=19), states)
+        self.assertEqual(bank.read(address=17, quantity=4), states[7:11])
+        self.assertTrue(bank.get(address=10))
+        self.assertFalse(bank.get(address=11))
+
+        bank.set(address=11, value=True)
+        bank.set(address=10, value=[False])
+        self.assertTrue(bank.get(address=11))
+        self.assertFalse(bank.get(address=10))
+
+        bank = BitBank(address=0, quantity=9, value=True)
+        self.assertEqual(bank.read(address=0, quantity=9), [True] * 9)
+
+        with self.assertRaises(ValueError):
+            bank.set(address=8, value=[True, True])
+
+    def test_bit_bank_encode_into(self) -> None:
+        """Test encoding bit states of a bank into a buffer"""
+        states = [True, False, True, True, False, False, True, True,
+                  True, True, False, True, False, True, True, False,
+                  True, False, True]
+        bank = BitBank(address=150, quantity=len(states), value=states)
+        buf = bytearray(4)
+
+        # same content as functions.response creates for this bank
+        byte_count = bank.encode_into(buf, 1, 150, 19)
+        self.assertEqual(byte_count, 3)
+        self.assertEqual(buf, bytearray(b'\x00\xCD\xAD\x03'))
+
+        byte_count = bank.encode_into(buf, 0, 150, 3)
+        self.assertEqual(byte_count, 1)
+        self.assertEqual(buf[0], 0x05)
+
+
+if __name__ == '__main__':
+    unittest.main()
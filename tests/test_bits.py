@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the bit codec of umodbus"""
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus.bits import BitSet, pack_bits, pack_bits_into, unpack_bits
+from umodbus import functions
+
+
+class TestBits(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+        self._states = [
+            True, True, False, False, True, True, False, True, False, True,
+            True
+        ]
+
+    def test_pack_bits(self) -> None:
+        """Test packing of states, MSB first in each chunk of eight"""
+        self.assertEqual(pack_bits(values=self._states), b'\xCD\x03')
+        self.assertEqual(pack_bits(values=[1, 0, 1]), b'\x05')
+        self.assertEqual(pack_bits(values=[]), b'')
+
+        buf = bytearray(4)
+        written = pack_bits_into(buf=buf, offset=1, values=self._states)
+        self.assertEqual(written, 2)
+        self.assertEqual(buf, bytearray(b'\x00\xCD\x03\x00'))
+
+    def test_unpack_bits(self) -> None:
+        """Test unpacking of states"""
+        self.assertEqual(unpack_bits(data=b'\xCD\x03', quantity=11),
+                         self._states)
+        self.assertEqual(unpack_bits(data=memoryview(b'\xFF\xCD\x03'),
+                                     quantity=11,
+                                     offset=1),
+                         self._states)
+        self.assertEqual(unpack_bits(data=b'\x05', quantity=3),
+                         [True, False, True])
+
+    def test_round_trip(self) -> None:
+        """Test packing and unpacking of any quantity"""
+        for quantity in range(1, 34):
+            states = [bool((idx * 7) % 3) for idx in range(quantity)]
+            with self.subTest(quantity=quantity):
+                data = pack_bits(values=states)
+                self.assertEqual(len(data), (quantity + 7) // 8)
+                self.assertEqual(unpack_bits(data=data, quantity=quantity),
+                                 states)
+                self.assertEqual(functions.bytes_to_bool(byte_list=data,
+                                                         bit_qty=quantity),
+                                 states)
+
+    def test_bitset(self) -> None:
+        """Test access of the states of a bit set"""
+        bitset = BitSet(quantity=11, data=b'\xCD\x03')
+
+        self.assertEqual(len(bitset), 11)
+        self.assertEqual(bitset, self._states)
+        self.assertEqual(list(bitset), self._states)
+        self.assertEqual([bitset[idx] for idx in range(11)], self._states)
+        self.assertTrue(bitset[-1])
+        self.assertEqual(bitset, BitSet.from_list(self._states))
+
+        bitset[0] = False
+        bitset[8] = True
+        self.assertFalse(bitset[0])
+        self.assertTrue(bitset[8])
+        self.assertEqual(bitset.data, b'\x4D\x07')
+
+        with self.assertRaises(IndexError):
+            bitset[11]
+
+        with self.assertRaises(ValueError):
+            BitSet(quantity=9, data=b'\x00')
+
+    def test_write_multiple_coils_bitset(self) -> None:
+        """Test writing coils of a bit set"""
+        self.assertEqual(
+            functions.write_multiple_coils(
+                starting_address=19,
+                value_list=BitSet.from_list(self._states)),
+            b'\x0F\x00\x13\x00\x0B\x02\xCD\x03')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the read response cache of umodbus"""
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus import const as Const
+from umodbus.cache import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+        self._cache = ResponseCache(max_entries=2)
+        self._hregs_pdu = b'\x03\x04\x00\x01\x00\x02'
+        self._iregs_pdu = b'\x04\x02\x00\x03'
+
+    def test_get_put(self) -> None:
+        """Test storing and getting responses"""
+        cache = self._cache
+        self.assertIsNone(cache.get(Const.READ_HOLDING_REGISTERS, 10, 2))
+
+        cache.put(Const.READ_HOLDING_REGISTERS, 'HREGS', 10, 2,
+                  self._hregs_pdu)
+        self.assertEqual(cache.get(Const.READ_HOLDING_REGISTERS, 10, 2),
+                         self._hregs_pdu)
+        self.assertIsNone(cache.get(Const.READ_HOLDING_REGISTERS, 10, 1))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+
+        with self.assertRaises(ValueError):
+            ResponseCache(max_entries=0)
+
+    def test_lru_eviction(self) -> None:
+        """Test dropping the least recently used response"""
+        cache = self._cache
+        cache.put(Const.READ_HOLDING_REGISTERS, 'HREGS', 10, 2,
+                  self._hregs_pdu)
+        cache.put(Const.READ_INPUT_REGISTER, 'IREGS', 10, 1, self._iregs_pdu)
+
+        # use the first response, the second one is dropped on the next put
+        cache.get(Const.READ_HOLDING_REGISTERS, 10, 2)
+        cache.put(Const.READ_INPUT_REGISTER, 'IREGS', 20, 1, self._iregs_pdu)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get(Const.READ_HOLDING_REGISTERS, 10, 2))
+        self.assertIsNone(cache.get(Const.READ_INPUT_REGISTER, 10, 1))
+        self.assertIsNotNone(cache.get(Const.READ_INPUT_REGISTER, 20, 1))
+
+    def test_invalidate(self) -> None:
+        """Test dropping responses of changed registers"""
+        cache = self._cache
+        cache.put(Const.READ_HOLDING_REGISTERS, 'HREGS', 10, 2,
+                  self._hregs_pdu)
+        cache.put(Const.READ_INPUT_REGISTER, 'IREGS', 10, 1, self._iregs_pdu)
+
+        # neither the register type nor the range matches
+        cache.invalidate(reg_type='HREGS', address=12, quantity=5)
+        cache.invalidate(reg_type='COILS', address=10)
+        self.assertEqual(len(cache), 2)
+
+        cache.invalidate(reg_type='HREGS', address=8, quantity=3)
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get(Const.READ_HOLDING_REGISTERS, 10, 2))
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the typed register codec of umodbus"""
+
+import struct
+
+import mpy_unittest as unittest
+from umodbus.codec import RegisterCodec, ABCD, CDAB, BADC, DCBA
+from umodbus.modbus import Modbus
+
+from .fake_host import HostTestCase
+
+
+class TestCodec(HostTestCase):
+    def test_word_orders(self) -> None:
+        """Test decoding and encoding in all word orders"""
+        # 0x3FC00000 is 1.5, 0x12345678 is 305419896
+        possibilities = [
+            (ABCD, b'\x3F\xC0\x00\x00', b'\x12\x34\x56\x78'),
+            (CDAB, b'\x00\x00\x3F\xC0', b'\x56\x78\x12\x34'),
+            (BADC, b'\xC0\x3F\x00\x00', b'\x34\x12\x78\x56'),
+            (DCBA, b'\x00\x00\xC0\x3F', b'\x78\x56\x34\x12'),
+        ]
+        for word_order, float_data, int_data in possibilities:
+            with self.subTest(word_order=word_order):
+                codec = RegisterCodec(data_type='float32',
+                                      word_order=word_order,
+                                      count=2)
+                self.assertEqual(codec.registers, 4)
+                self.assertEqual(codec.decode(data=float_data * 2),
+                                 [1.5, 1.5])
+                self.assertEqual(codec.to_bytes(values=[1.5, 1.5]),
+                                 float_data * 2)
+
+                codec = RegisterCodec(data_type='uint32',
+                                      word_order=word_order)
+                self.assertEqual(codec.decode(data=int_data), [0x12345678])
+                self.assertEqual(codec.encode(values=[0x12345678]),
+                                 list(struct.unpack('>HH', int_data)))
+
+    def test_register_values(self) -> None:
+        """Test decoding of signed and unsigned register values"""
+        codec = RegisterCodec(data_type='int32', word_order=CDAB)
+
+        self.assertEqual(codec.encode(values=[-2]), [0xFFFE, 0xFFFF])
+        self.assertEqual(codec.decode(data=[0xFFFE, 0xFFFF]), [-2])
+        self.assertEqual(codec.decode(data=(-2, -1)), [-2])
+        self.assertEqual(codec.decode(data=[0, 0xFFFE, 0xFFFF], offset=1),
+                         [-2])
+
+        codec = RegisterCodec(data_type='float64')
+        self.assertEqual(codec.registers, 4)
+        self.assertEqual(codec.decode(data=codec.encode(values=[0.5])),
+                         [0.5])
+
+        codec = RegisterCodec(data_type='uint64', word_order=DCBA)
+        self.assertEqual(codec.decode(data=codec.encode(values=[2 ** 40])),
+                         [2 ** 40])
+
+    def test_strings(self) -> None:
+        """Test decoding and encoding of strings"""
+        possibilities = [
+            (ABCD, [0x4865, 0x6C6C, 0x6F00]),
+            (CDAB, [0x6F00, 0x6C6C, 0x4865]),
+            (BADC, [0x6548, 0x6C6C, 0x006F]),
+            (DCBA, [0x006F, 0x6C6C, 0x6548]),
+        ]
+        for word_order, registers in possibilities:
+            with self.subTest(word_order=word_order):
+                codec = RegisterCodec(data_type='string',
+                                      word_order=word_order,
+                                      length=3)
+                self.assertEqual(codec.encode(values=['Hello']), registers)
+                self.assertEqual(codec.decode(data=registers), ['Hello'])
+
+    def test_invalid(self) -> None:
+        """Test invalid codec parameters"""
+        with self.assertRaises(ValueError):
+            RegisterCodec(data_type='float16')
+        with self.assertRaises(ValueError):
+            RegisterCodec(data_type='int32', word_order='ACBD')
+        with self.assertRaises(ValueError):
+            RegisterCodec(data_type='int32', count=0)
+        with self.assertRaises(ValueError):
+            RegisterCodec(data_type='string')
+
+    def test_host(self) -> None:
+        """Test reading and writing typed values by a host"""
+        host = self._host
+        codec = RegisterCodec(data_type='float32', word_order=CDAB, count=2)
+
+        host.registers = b'\x00\x00\x3F\xC0\x00\x00\xC0\x20'
+        self.assertEqual(host.read_values(slave_addr=10,
+                                          starting_addr=100,
+                                          codec=codec,
+                                          reg_type='IREGS'),
+                         [1.5, -2.5])
+        self.assertEqual(host.pdus[-1], b'\x04\x00\x64\x00\x04')
+
+        self.assertTrue(host.write_values(slave_addr=10,
+                                          starting_address=100,
+                                          codec=codec,
+                                          values=[1.5, -2.5]))
+        self.assertEqual(host.pdus[-1],
+                         b'\x10\x00\x64\x00\x04\x08' + host.registers)
+
+        with self.assertRaises(KeyError):
+            host.read_values(slave_addr=10,
+                             starting_addr=100,
+                             codec=codec,
+                             reg_type='COILS')
+
+    def test_client(self) -> None:
+        """Test typed values of client registers"""
+        client = Modbus(itf=None, addr_list=[1])
+        codec = RegisterCodec(data_type='int32', word_order=ABCD)
+
+        client.add_hreg(address=20, value=codec.encode(values=[-100000]))
+        registers = [client.get_hreg(address=20), client.get_hreg(address=21)]
+        self.assertEqual(registers, [0xFFFE, 0x7960])
+        self.assertEqual(codec.decode(data=registers), [-100000])
+
+        client.set_hregs(address=20, values=codec.encode(values=[7]))
+        self.assertEqual(client.get_hreg(address=21), 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
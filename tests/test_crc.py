@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the CRC16 calculation of umodbus"""
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus.crc import crc16, CRC16
+
+
+class TestCRC(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+        # read 2 holding registers at 1 of unit 1
+        self._frame = bytearray(b'\x01\x03\x00\x01\x00\x02\x95\xCB')
+
+    def test_crc16(self) -> None:
+        """Test calculation of the CRC16 over a range of a buffer"""
+        self.assertEqual(crc16(b'123456789'), 0x4B37)
+        self.assertEqual(crc16(self._frame, 0, 6), 0xCB95)
+        self.assertEqual(crc16(memoryview(self._frame), 0, 6), 0xCB95)
+
+        # continue a calculation
+        self.assertEqual(crc16(self._frame, 3, 6, crc16(self._frame, 0, 3)),
+                         0xCB95)
+
+        # CRC over a valid frame including its CRC
+        self.assertEqual(crc16(self._frame), 0)
+
+    def test_crc16_incremental(self) -> None:
+        """Test incremental CRC16 calculation"""
+        crc = CRC16()
+        crc.update(self._frame, 0, 2)
+        crc.update(self._frame[2:6])
+        self.assertEqual(crc.value, 0xCB95)
+        self.assertEqual(crc.digest(), b'\x95\xCB')
+        self.assertFalse(crc.valid)
+
+        crc.update(memoryview(self._frame), 6)
+        self.assertTrue(crc.valid)
+
+        crc.reset()
+        self.assertEqual(crc.value, 0xFFFF)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -226,6 +226,46 @@ class TestFunctions(unittest.TestCase):
             functions.write_multiple_registers(starting_address=42,
                                                register_values=register_values)
 
+    def test_read_write_multiple_registers(self) -> None:
+        """
+        Test creation of Modbus Protocol Data Unit for writing and reading
+        multiple registers
+        """
+        modbus_pdu = functions.read_write_multiple_registers(
+            read_starting_address=3,
+            read_quantity=6,
+            write_starting_address=14,
+            register_values=[255, -1, 0])
+
+        self.assertIsInstance(modbus_pdu, bytes)
+        self.assertEqual(len(modbus_pdu), 16)
+        self.assertEqual(modbus_pdu,
+                         b'\x17\x00\x03\x00\x06\x00\x0E\x00\x03\x06'
+                         b'\x00\xFF\xFF\xFF\x00\x00')
+
+        modbus_pdu = functions.read_write_multiple_registers(
+            read_starting_address=3,
+            read_quantity=1,
+            write_starting_address=14,
+            register_values=[0xFFFF],
+            signed=False)
+        self.assertEqual(modbus_pdu,
+                         b'\x17\x00\x03\x00\x01\x00\x0E\x00\x01\x02'
+                         b'\xFF\xFF')
+
+        with self.assertRaises(ValueError):
+            functions.read_write_multiple_registers(
+                read_starting_address=3,
+                read_quantity=126,
+                write_starting_address=14,
+                register_values=[1])
+        with self.assertRaises(ValueError):
+            functions.read_write_multiple_registers(
+                read_starting_address=3,
+                read_quantity=1,
+                write_starting_address=14,
+                register_values=[7] * 122)
+
     def test_validate_resp_data_single_coil(self) -> None:
         """Test response data validation of writing single coil"""
         # test response of writing single coil to ON
@@ -431,6 +471,21 @@ class TestFunctions(unittest.TestCase):
                 self.assertTrue(all(isinstance(x, bool) for x in result))
                 self.assertEqual(result, expectation)
 
+    def test_register_format(self) -> None:
+        """Test prebuilt struct formats of registers"""
+        self.assertEqual(functions.register_format(quantity=3), '>3h')
+        self.assertEqual(functions.register_format(quantity=3, signed=False),
+                         '>3H')
+        self.assertEqual(functions.register_format(quantity=125,
+                                                   signed=False,
+                                                   prefix='>BB'),
+                         '>BB125H')
+
+        # the same format is returned on every call
+        fmt = functions.register_format(quantity=2, prefix='>BHHB')
+        self.assertIs(functions.register_format(quantity=2, prefix='>BHHB'),
+                      fmt)
+
     def test_to_short(self) -> None:
         """Convert bytes list to integer tuple"""
         possibilities = [
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the TCP to RTU gateway of umodbus"""
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus import const as Const
+from umodbus import functions
+from umodbus.common import Request
+from umodbus.gateway import ModbusGateway
+
+
+class FakeServer(object):
+    """TCP server returning queued requests and recording the responses"""
+    def __init__(self) -> None:
+        self.requests = list()
+        self.responses = list()
+
+    def get_request(self, unit_addr_list=None, timeout=None):
+        if self.requests:
+            return Request(self, self.requests.pop(0))
+        return None
+
+    def send_pdu_response(self, slave_addr, modbus_pdu):
+        self.responses.append((slave_addr, bytes(modbus_pdu)))
+
+    def send_exception_response(self, slave_addr, function_code,
+                                exception_code):
+        self.responses.append((slave_addr,
+                               functions.exception_response(function_code,
+                                                            exception_code)))
+
+
+class FakeHost(object):
+    """RTU host answering with queued responses"""
+    def __init__(self) -> None:
+        self.requests = list()
+        self.responses = list()
+
+    def send_receive_pdu(self, slave_addr, modbus_pdu):
+        self.requests.append((slave_addr, bytes(modbus_pdu)))
+        response = self.responses.pop(0)
+        if response is None:
+            raise OSError('no data received from slave')
+        return response
+
+
+class TestModbusGateway(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+        self._server = FakeServer()
+        self._host = FakeHost()
+        self._read_pdu = functions.read_holding_registers(10, 2)
+        self._read_resp = b'\x03\x04\x00\x01\x00\x02'
+
+    def test_forward_and_cache(self) -> None:
+        """Test answering repeated read requests from the cache"""
+        server = self._server
+        host = self._host
+        gateway = ModbusGateway(server=server, host=host, max_age=60000)
+
+        self.assertFalse(gateway.process())
+
+        host.responses.append(self._read_resp)
+        server.requests.append(b'\x05' + self._read_pdu)
+        server.requests.append(b'\x05' + self._read_pdu)
+        self.assertTrue(gateway.process())
+        self.assertTrue(gateway.process())
+
+        self.assertEqual(host.requests, [(5, self._read_pdu)])
+        self.assertEqual(server.responses, [(5, self._read_resp)] * 2)
+        self.assertEqual((gateway.hits, gateway.misses), (1, 1))
+        self.assertEqual(len(gateway), 1)
+
+        # write through to the slave, dropping the cached response
+        write_pdu = functions.write_single_register(11, 7)
+        host.responses.append(write_pdu)
+        server.requests.append(b'\x05' + write_pdu)
+        gateway.process()
+        self.assertEqual(host.requests[-1], (5, write_pdu))
+        self.assertEqual(server.responses[-1], (5, write_pdu))
+        self.assertEqual(len(gateway), 0)
+
+        host.responses.append(self._read_resp)
+        server.requests.append(b'\x05' + self._read_pdu)
+        gateway.process()
+        self.assertEqual(len(host.requests), 3)
+
+    def test_read_write_multiple_registers(self) -> None:
+        """Test forwarding a request to write and read registers"""
+        server = self._server
+        host = self._host
+        gateway = ModbusGateway(server=server, host=host, max_age=60000)
+
+        host.responses.append(self._read_resp)
+        server.requests.append(b'\x05' + self._read_pdu)
+        gateway.process()
+        self.assertEqual(len(gateway), 1)
+
+        # always forwarded, dropping the cached response of the written
+        # registers
+        pdu = functions.read_write_multiple_registers(
+            read_starting_address=0,
+            read_quantity=1,
+            write_starting_address=11,
+            register_values=[7, 8])
+        response = b'\x17\x02\x00\x2A'
+        for _ in range(2):
+            host.responses.append(response)
+            server.requests.append(b'\x05' + pdu)
+            gateway.process()
+
+        self.assertEqual(host.requests[1:], [(5, pdu)] * 2)
+        self.assertEqual(server.responses[1:], [(5, response)] * 2)
+        self.assertEqual(len(gateway), 0)
+
+    def test_expired_responses(self) -> None:
+        """Test forwarding requests if the cache is disabled"""
+        server = self._server
+        host = self._host
+        gateway = ModbusGateway(server=server, host=host, max_age=0)
+
+        for _ in range(2):
+            host.responses.append(self._read_resp)
+            server.requests.append(b'\x01' + self._read_pdu)
+            gateway.process()
+
+        self.assertEqual(len(host.requests), 2)
+        self.assertEqual(len(gateway), 0)
+
+    def test_errors(self) -> None:
+        """Test exception responses of the gateway"""
+        server = self._server
+        host = self._host
+        gateway = ModbusGateway(server=server,
+                                host=host,
+                                unit_map={1: 17})
+
+        # slave not responding
+        host.responses.append(None)
+        server.requests.append(b'\x01' + self._read_pdu)
+        gateway.process()
+        self.assertEqual(host.requests, [(17, self._read_pdu)])
+        self.assertEqual(server.responses[-1], (1, functions.exception_response(
+            Const.READ_HOLDING_REGISTERS, Const.DEVICE_FAILED_TO_RESPOND)))
+        self.assertEqual(gateway.errors, 1)
+
+        # exception responses of the slave are passed on, but not cached
+        host.responses.append(b'\x83\x02')
+        server.requests.append(b'\x01' + self._read_pdu)
+        gateway.process()
+        self.assertEqual(server.responses[-1], (1, b'\x83\x02'))
+        self.assertEqual(len(gateway), 0)
+
+        # not mapped unit identifier
+        server.requests.append(b'\x02' + self._read_pdu)
+        gateway.process()
+        self.assertEqual(server.responses[-1], (2, functions.exception_response(
+            Const.READ_HOLDING_REGISTERS, Const.GATEWAY_PATH_UNAVAILABLE)))
+        self.assertEqual(len(host.requests), 2)
+
+    def test_cache_size(self) -> None:
+        """Test dropping the oldest response if the cache is full"""
+        server = self._server
+        host = self._host
+        gateway = ModbusGateway(server=server,
+                                host=host,
+                                max_age=60000,
+                                max_entries=2)
+
+        for address in range(3):
+            host.responses.append(b'\x04\x02\x00\x00')
+            server.requests.append(
+                b'\x01' + functions.read_input_registers(address, 1))
+            gateway.process()
+
+        self.assertEqual(len(gateway), 2)
+        gateway.clear_cache()
+        self.assertEqual(len(gateway), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
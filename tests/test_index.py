@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the interval index of umodbus"""
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus.index import IntervalIndex
+
+
+class TestIntervalIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+    def test_add(self) -> None:
+        """Test merging of added intervals"""
+        index = IntervalIndex()
+        index.add(start=10, end=11)
+        index.add(start=12, end=13)
+        self.assertEqual(len(index), 2)
+
+        # close the gap, all three are merged
+        index.add(start=11, end=12)
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.find(address=10), 0)
+        self.assertEqual(index.find(address=12), 0)
+        self.assertEqual(index.find(address=13), -1)
+        self.assertEqual(index.find(address=9), -1)
+
+        # intervals with an owner are never merged
+        index.add(start=13, end=20, owner='bank')
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.owner(address=15, quantity=5), 'bank')
+        self.assertIsNone(index.owner(address=15, quantity=6))
+        self.assertIsNone(index.owner(address=10))
+
+    def test_segments(self) -> None:
+        """Test splitting a range into the covering intervals"""
+        index = IntervalIndex()
+        index.add(start=10, end=13)
+        index.add(start=13, end=16, owner='bank')
+        index.add(start=16, end=17)
+        index.add(start=20, end=21)
+
+        self.assertEqual(index.segments(address=11, quantity=6),
+                         [(11, 13, None), (13, 16, 'bank'), (16, 17, None)])
+        self.assertEqual(index.segments(address=14, quantity=1),
+                         [(14, 15, 'bank')])
+
+        # gap of unmapped addresses
+        self.assertIsNone(index.segments(address=16, quantity=5))
+        self.assertIsNone(index.segments(address=18, quantity=1))
+        self.assertIsNone(index.segments(address=9, quantity=2))
+
+    def test_remove(self) -> None:
+        """Test removing a range of addresses"""
+        index = IntervalIndex()
+        index.add(start=10, end=20)
+        index.remove(start=14, end=15)
+
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.find(address=14), -1)
+        self.assertEqual(index.segments(address=10, quantity=4),
+                         [(10, 14, None)])
+        self.assertEqual(index.segments(address=15, quantity=5),
+                         [(15, 20, None)])
+
+        index.remove(start=0, end=100)
+        self.assertEqual(len(index), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
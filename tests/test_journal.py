@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the change journal of umodbus"""
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus.journal import ChangeJournal, SOURCE_LOCAL, SOURCE_REMOTE
+
+
+class TestChangeJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+        self._journal = ChangeJournal(capacity=4)
+
+    def test_record(self) -> None:
+        """Test recording and fetching changes"""
+        journal = self._journal
+        self.assertEqual(journal.sequence, 0)
+        self.assertEqual(journal.since(0), ([], 0))
+
+        seq = journal.record('HREGS', 10, -1, source=SOURCE_REMOTE, ticks=5)
+        self.assertEqual(seq, 0)
+        seq = journal.record('COILS', 3, [True, False], ticks=7)
+        self.assertEqual(seq, 2)
+        self.assertEqual(len(journal), 3)
+
+        changes, lost = journal.since(0)
+        self.assertEqual(lost, 0)
+        self.assertEqual(changes, [
+            (0, 'HREGS', 10, -1, 5, SOURCE_REMOTE),
+            (1, 'COILS', 3, True, 7, SOURCE_LOCAL),
+            (2, 'COILS', 4, False, 7, SOURCE_LOCAL),
+        ])
+
+        changes, lost = journal.since(2)
+        self.assertEqual([c[0] for c in changes], [2])
+        self.assertEqual(journal.since(journal.sequence), ([], 0))
+
+        with self.assertRaises(ValueError):
+            journal.record('FOO', 1, 1)
+        with self.assertRaises(ValueError):
+            ChangeJournal(capacity=0)
+
+    def test_overflow(self) -> None:
+        """Test detecting overwritten changes"""
+        journal = self._journal
+        journal.record('IREGS', 0, list(range(10)), ticks=1)
+
+        self.assertEqual(len(journal), 4)
+        self.assertEqual(journal.oldest, 6)
+
+        changes, lost = journal.since(3)
+        self.assertEqual(lost, 3)
+        self.assertEqual([(c[0], c[2], c[3]) for c in changes],
+                         [(6, 6, 6), (7, 7, 7), (8, 8, 8), (9, 9, 9)])
+
+
+if __name__ == '__main__':
+    unittest.main()
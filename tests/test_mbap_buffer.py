@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the Modbus TCP frame reassembly of umodbus"""
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus.tcp import MBAPBuffer
+
+
+class TestMBAPBuffer(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+        # read 1 holding register at 93 of unit 10, transaction ID 1 and 2
+        self._adu_1 = b'\x00\x01\x00\x00\x00\x06\x0A\x03\x00\x5D\x00\x01'
+        self._adu_2 = b'\x00\x02\x00\x00\x00\x06\x0A\x03\x00\x5E\x00\x01'
+
+    def test_partial_frame(self) -> None:
+        """Test reassembly of a frame received in several parts"""
+        rx_buffer = MBAPBuffer()
+
+        for part in (self._adu_1[:3], self._adu_1[3:8], self._adu_1[8:-1]):
+            rx_buffer.feed(part)
+            self.assertFalse(rx_buffer.has_adu())
+            self.assertIsNone(rx_buffer.pop_adu())
+
+        rx_buffer.feed(self._adu_1[-1:])
+        self.assertTrue(rx_buffer.has_adu())
+        self.assertEqual(rx_buffer.pop_adu(), self._adu_1)
+        self.assertEqual(len(rx_buffer), 0)
+
+    def test_concatenated_frames(self) -> None:
+        """Test splitting frames received in one segment"""
+        rx_buffer = MBAPBuffer()
+        rx_buffer.feed(self._adu_1 + self._adu_2 + self._adu_1[:4])
+
+        self.assertEqual(rx_buffer.pop_adu(), self._adu_1)
+        self.assertEqual(rx_buffer.pop_adu(), self._adu_2)
+        self.assertIsNone(rx_buffer.pop_adu())
+        self.assertEqual(len(rx_buffer), 4)
+
+        rx_buffer.clear()
+        self.assertEqual(len(rx_buffer), 0)
+
+    def test_invalid_length(self) -> None:
+        """Test invalid length field of the MBAP header"""
+        rx_buffer = MBAPBuffer()
+        rx_buffer.feed(b'\x00\x01\x00\x00\x01\x00\x0A\x03')
+
+        self.assertTrue(rx_buffer.has_adu())
+        with self.assertRaises(ValueError):
+            rx_buffer.pop_adu()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the mirror of remote registers of umodbus"""
+
+import mpy_unittest as unittest
+from umodbus import const as Const
+from umodbus.mirror import ModbusMirror
+from umodbus.modbus import Modbus
+
+from .fake_host import HostTestCase
+
+
+class TestModbusMirror(HostTestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        super().setUp()
+        self._client = Modbus(itf=None, addr_list=[1])
+        self._mirror = ModbusMirror(host=self._host,
+                                    client=self._client,
+                                    max_gap=4)
+
+    def test_mirror(self) -> None:
+        """Test reading ranges into the local register store"""
+        mirror = self._mirror
+        client = self._client
+        first = mirror.add_range(slave_addr=10,
+                                 reg_type='HREGS',
+                                 address=100,
+                                 quantity=2,
+                                 period=10000)
+        second = mirror.add_range(slave_addr=10,
+                                  reg_type='HREGS',
+                                  address=104,
+                                  quantity=2,
+                                  period=10000,
+                                  local_address=0)
+        coils = mirror.add_range(slave_addr=10,
+                                 reg_type='COILS',
+                                 address=0,
+                                 quantity=3,
+                                 period=10000)
+
+        self.assertIsNone(first.age)
+        self.assertTrue(first.is_stale(max_age=1000))
+        self.assertEqual(client.get_hreg(100), 0)
+
+        mirror.run_once()
+        mirror.run_once()
+
+        # both holding register ranges are read by a single request
+        self.assertEqual(sorted(self._host.requests),
+                         [(10, Const.READ_COILS, 0, 3),
+                          (10, Const.READ_HOLDING_REGISTERS, 100, 6)])
+        self.assertEqual([client.get_hreg(a) for a in (100, 101, 0, 1)],
+                         [100, 101, 104, 105])
+        self.assertEqual([client.get_coil(a) for a in range(3)],
+                         [False, True, False])
+        self.assertFalse(second.is_stale(max_age=1000))
+        self.assertIsNotNone(coils.age)
+        self.assertIsNone(first.last_error)
+
+        with self.assertRaises(ValueError):
+            mirror.add_range(slave_addr=10,
+                             reg_type='HREGS',
+                             address=101,
+                             quantity=1,
+                             period=10000)
+
+    def test_not_responding_slave(self) -> None:
+        """Test keeping the range stale while the slave does not respond"""
+        mirror = self._mirror
+        dead = mirror.add_range(slave_addr=11,
+                                reg_type='HREGS',
+                                address=0,
+                                quantity=1,
+                                period=10000)
+        mirror.run_once()
+
+        self.assertIsNone(dead.updated)
+        self.assertIsInstance(dead.last_error, OSError)
+
+        self.assertTrue(mirror.remove_range(dead))
+        self.assertFalse(mirror.remove_range(dead))
+        self.assertEqual(len(mirror.ranges), 0)
+        mirror.run_once()
+        self.assertEqual(len(mirror.scheduler.jobs), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the register functions of the Modbus class"""
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus import const as Const
+from umodbus import functions
+from umodbus.common import Request
+from umodbus.modbus import Modbus
+
+
+class FakeInterface(object):
+    """Interface returning queued requests and recording the responses"""
+    def __init__(self) -> None:
+        self.requests = list()
+        self.responses = list()
+
+    def get_request(self, unit_addr_list=None, timeout=None):
+        if self.requests:
+            return Request(self, self.requests.pop(0))
+        return None
+
+    def send_response(self, slave_addr, function_code, request_register_addr,
+                      request_register_qty, request_data, values=None,
+                      signed=True):
+        self.responses.append(functions.response(function_code,
+                                                 request_register_addr,
+                                                 request_register_qty,
+                                                 request_data,
+                                                 values,
+                                                 signed))
+
+    def send_pdu_response(self, slave_addr, modbus_pdu):
+        self.responses.append(bytes(modbus_pdu))
+
+    def send_exception_response(self, slave_addr, function_code,
+                                exception_code):
+        self.responses.append(functions.exception_response(function_code,
+                                                           exception_code))
+
+
+class TestModbus(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+        self._client = Modbus(itf=None, addr_list=[1])
+
+    def test_set_iregs(self) -> None:
+        """Test setting consecutive input registers at once"""
+        client = self._client
+        client.add_ireg(address=10, value=[0, 0, 0])
+        client.add_bank(reg_type='IREGS', address=13, quantity=3)
+
+        # existing registers of the dict and a bank
+        client.set_iregs(address=11, values=[1, 2, 3, 4])
+        self.assertEqual([client.get_ireg(a) for a in range(10, 16)],
+                         [0, 1, 2, 3, 4, 0])
+
+        # not existing registers are added
+        client.set_iregs(address=15, values=(5, 6, 7))
+        self.assertEqual([client.get_ireg(a) for a in range(15, 18)],
+                         [5, 6, 7])
+        self.assertIn(17, client.iregs)
+
+        # an empty list changes nothing
+        client.set_iregs(address=20, values=[])
+        self.assertNotIn(20, client.iregs)
+
+    def test_set_coils(self) -> None:
+        """Test setting consecutive coils at once"""
+        client = self._client
+        client.add_bank(reg_type='COILS', address=0, quantity=8)
+        client.add_coil(address=8, value=False)
+
+        client.set_coils(address=6, values=[True, False, True])
+        self.assertEqual([client.get_coil(a) for a in range(5, 9)],
+                         [False, True, False, True])
+
+    def test_update_registers(self) -> None:
+        """Test setting registers of several types at once"""
+        client = self._client
+        client.add_hreg(address=1, value=[0, 0])
+        client.add_ireg(address=5, value=[0, 0, 0])
+
+        client.update_registers({
+            'HREGS': {2: 22, 1: 11},
+            'IREGS': {7: 7, 5: 5},
+        })
+        self.assertEqual(client.get_hreg(1), 11)
+        self.assertEqual(client.get_hreg(2), 22)
+        self.assertEqual([client.get_ireg(a) for a in range(5, 8)],
+                         [5, 0, 7])
+
+        # nothing is set if any register type is invalid
+        with self.assertRaises(KeyError):
+            client.update_registers({'HREGS': {1: 1}, 'FOO': {1: 1}})
+        self.assertEqual(client.get_hreg(1), 11)
+
+    def test_update_registers_once(self) -> None:
+        """Test dropping responses and recording a bulk update only once"""
+        client = self._client
+        client.add_ireg(address=0, value=[0] * 10)
+        client.enable_response_cache()
+        cache = client.response_cache
+        journal = client.journal
+        cache.put(Const.READ_INPUT_REGISTER, 'IREGS', 4, 2,
+                  b'\x04\x04\x00\x00\x00\x00')
+        cache.put(Const.READ_INPUT_REGISTER, 'IREGS', 9, 1,
+                  b'\x04\x02\x00\x00')
+
+        invalidated = list()
+        recorded = list()
+        invalidate = cache.invalidate
+        record = journal.record
+
+        def count_invalidate(**kwargs) -> None:
+            invalidated.append(kwargs)
+            invalidate(**kwargs)
+
+        def count_record(**kwargs) -> int:
+            recorded.append(kwargs)
+            return record(**kwargs)
+
+        cache.invalidate = count_invalidate
+        journal.record = count_record
+        revision = client._revision
+        start = journal.sequence
+
+        # three runs of consecutive addresses
+        client.update_registers({'IREGS': {0: 1, 1: 2, 3: 4, 7: 8, 8: 9}})
+
+        self.assertEqual(client._revision, revision + 1)
+        self.assertEqual(invalidated, [{'reg_type': 'IREGS',
+                                        'address': 0,
+                                        'quantity': 9}])
+        self.assertEqual(len(recorded), 1)
+        self.assertIsNotNone(cache.get(Const.READ_INPUT_REGISTER, 9, 1))
+        self.assertIsNone(cache.get(Const.READ_INPUT_REGISTER, 4, 2))
+
+        changes, lost = journal.since(start)
+        self.assertEqual([c[1:4] for c in changes],
+                         [('IREGS', 0, 1), ('IREGS', 1, 2), ('IREGS', 3, 4),
+                          ('IREGS', 7, 8), ('IREGS', 8, 9)])
+        self.assertEqual([client.get_ireg(a) for a in range(10)],
+                         [1, 2, 0, 4, 0, 0, 0, 8, 9, 0])
+
+    def test_bulk_update_invalidates_cache(self) -> None:
+        """Test dropping cached responses on a bulk update"""
+        client = self._client
+        client.add_ireg(address=0, value=[0, 0])
+        client.enable_response_cache()
+        cache = client.response_cache
+        cache.put(Const.READ_INPUT_REGISTER, 'IREGS', 0, 2,
+                  b'\x04\x04\x00\x00\x00\x00')
+
+        client.set_iregs(address=1, values=[1])
+        self.assertIsNone(cache.get(Const.READ_INPUT_REGISTER, 0, 2))
+
+    def test_journal(self) -> None:
+        """Test recording local changes and changes of a host"""
+        client = self._client
+        client.add_hreg(address=5, value=[0, 0])
+        client.add_coil(address=0, value=False)
+        journal = client.journal
+        start = journal.sequence
+
+        client.set_hreg(address=5, value=7)
+        client.set_hregs(address=5, values=[8, 9])
+        client._set_changed_register(reg_type='COILS',
+                                     address=0,
+                                     value=[True])
+
+        changes, lost = journal.since(start)
+        self.assertEqual(lost, 0)
+        self.assertEqual([c[1:4] for c in changes],
+                         [('HREGS', 5, 7), ('HREGS', 5, 8), ('HREGS', 6, 9),
+                          ('COILS', 0, True)])
+        self.assertEqual(list(client.changed_coils.keys()), [0])
+        self.assertEqual(client.changed_hregs, {})
+
+        with self.assertRaises(KeyError):
+            client._set_changed_register(reg_type='IREGS',
+                                         address=0,
+                                         value=1)
+
+        # local changes do not push changes of a host out of changed_registers
+        client.enable_journal(capacity=2)
+        client.set_hregs(address=5, values=[1, 2])
+        client.set_hregs(address=5, values=[3, 4])
+        self.assertEqual(client.changed_coils[0]['val'], True)
+
+        # values are recorded as returned by the registers
+        client.set_hreg(address=5, value=-5)
+        client.add_bank(reg_type='HREGS', address=20, quantity=2)
+        client.set_hregs(address=20, values=[-5, 6])
+        changes, lost = client.journal.since(client.journal.oldest)
+        self.assertEqual([c[3] for c in changes], [65531, 6])
+        self.assertEqual(client.get_hreg(address=5), -5)
+        client.set_hreg(address=5, value=-5)
+        changes, lost = client.journal.since(client.journal.sequence - 1)
+        self.assertEqual(changes[0][3], -5)
+
+        client.disable_journal()
+        client.set_hreg(address=5, value=1)
+        client._set_changed_register(reg_type='HREGS', address=6, value=[3])
+        self.assertIsNone(client.journal)
+        self.assertEqual(list(client.changed_coils.keys()), [0])
+        self.assertEqual(client.changed_hregs[6]['val'], 3)
+
+        timestamp = client.changed_hregs[6]['time']
+        self.assertFalse(client._remove_changed_register(reg_type='HREGS',
+                                                         address=6,
+                                                         timestamp=-1))
+        self.assertTrue(client._remove_changed_register(reg_type='HREGS',
+                                                        address=6,
+                                                        timestamp=timestamp))
+        self.assertEqual(client.changed_hregs, {})
+
+    def test_deferred_callbacks(self) -> None:
+        """Test invoking callbacks after sending the response"""
+        itf = FakeInterface()
+        client = Modbus(itf=itf, addr_list=[1])
+        calls = list()
+
+        def on_get_cb(reg_type, address, val):
+            calls.append(('get', len(itf.responses), list(val)))
+
+        def on_set_cb(reg_type, address, val):
+            calls.append(('set', len(itf.responses), list(val)))
+
+        client.add_hreg(address=0, value=[1, 2], on_get_cb=on_get_cb,
+                        on_set_cb=on_set_cb)
+        client.enable_deferred_callbacks()
+
+        itf.requests.append(b'\x01' + functions.read_holding_registers(0, 2))
+        self.assertTrue(client.process())
+        self.assertEqual(calls, [('get', 1, [1, 2])])
+
+        itf.requests.append(b'\x01' + functions.write_single_register(0, 5))
+        self.assertTrue(client.process())
+        self.assertEqual(calls[1], ('set', 2, [5]))
+        self.assertEqual(client.get_hreg(0), 5)
+
+    def test_coalesced_callbacks(self) -> None:
+        """Test coalescing callbacks of the same registers"""
+        itf = FakeInterface()
+        client = Modbus(itf=itf, addr_list=[1])
+        calls = list()
+
+        def on_set_cb(reg_type, address, val):
+            calls.append((address, list(val)))
+
+        client.add_hreg(address=0, value=[0, 0], on_set_cb=on_set_cb)
+        client.enable_deferred_callbacks(coalesce=True)
+
+        for val in (1, 2, 3):
+            itf.requests.append(b'\x01' +
+                                functions.write_single_register(0, val))
+        itf.requests.append(b'\x01' +
+                            functions.write_single_register(1, 4))
+
+        for _ in range(4):
+            self.assertTrue(client.process())
+        self.assertEqual(calls, [])
+        self.assertEqual(len(itf.responses), 4)
+
+        # callbacks are invoked as soon as no request is pending
+        self.assertFalse(client.process())
+        self.assertEqual(sorted(calls), [(0, [3]), (1, [4])])
+
+        client.disable_deferred_callbacks()
+        itf.requests.append(b'\x01' + functions.write_single_register(0, 9))
+        client.process()
+        self.assertEqual(calls[-1], (0, [9]))
+
+    def test_get_callback_changing_values(self) -> None:
+        """Test sending values changed by a getter callback"""
+        itf = FakeInterface()
+        client = Modbus(itf=itf, addr_list=[1])
+
+        def on_get_cb(reg_type, address, val):
+            client.set_ireg(address=address, value=val[0] + 1)
+
+        client.add_ireg(address=3, value=41, on_get_cb=on_get_cb)
+        itf.requests.append(b'\x01' + functions.read_input_registers(3, 1))
+        client.process()
+
+        self.assertEqual(itf.responses, [b'\x04\x02\x00\x2a'])
+
+    def test_units(self) -> None:
+        """Test serving several logical slaves by unit address"""
+        itf = FakeInterface()
+        client = Modbus(itf=itf, addr_list=[1])
+        client.add_hreg(address=0, value=1)
+
+        unit = client.add_unit(unit_addr=2)
+        unit.add_hreg(address=0, value=2)
+        self.assertEqual(list(client.units), [2])
+        self.assertIs(client.get_unit(2), unit)
+        self.assertIsNone(client.get_unit(3))
+        self.assertEqual(client._addr_list, [1, 2])
+
+        with self.assertRaises(ValueError):
+            client.add_unit(unit_addr=2)
+        with self.assertRaises(ValueError):
+            client.add_unit(unit_addr=1)
+
+        itf.requests.append(b'\x02' + functions.read_holding_registers(0, 1))
+        itf.requests.append(b'\x01' + functions.read_holding_registers(0, 1))
+        itf.requests.append(b'\x02' + functions.write_single_register(0, 7))
+        for _ in range(3):
+            client.process()
+
+        self.assertEqual(itf.responses[0], b'\x03\x02\x00\x02')
+        self.assertEqual(itf.responses[1], b'\x03\x02\x00\x01')
+        self.assertEqual(unit.get_hreg(0), 7)
+        self.assertEqual(client.get_hreg(0), 1)
+
+        self.assertTrue(client.remove_unit(unit_addr=2))
+        self.assertFalse(client.remove_unit(unit_addr=2))
+        self.assertEqual(client._addr_list, [1])
+
+    def test_read_write_multiple_registers(self) -> None:
+        """Test writing and reading registers in one request"""
+        itf = FakeInterface()
+        client = Modbus(itf=itf, addr_list=[1])
+        calls = list()
+
+        def on_set_cb(reg_type, address, val):
+            calls.append(('set', address, val))
+
+        def on_get_cb(reg_type, address, val):
+            calls.append(('get', address, val))
+
+        client.add_hreg(address=0, value=1, on_set_cb=on_set_cb)
+        client.add_hreg(address=1, value=2, on_get_cb=on_get_cb)
+        client.add_hreg(address=2, value=[3, -4])
+        client.enable_response_cache()
+
+        itf.requests.append(b'\x01' + functions.read_holding_registers(0, 1))
+        client.process()
+        self.assertEqual(itf.responses[-1], b'\x03\x02\x00\x01')
+
+        # the written registers are read back with their new values
+        itf.requests.append(b'\x01' + functions.read_write_multiple_registers(
+            read_starting_address=1,
+            read_quantity=3,
+            write_starting_address=0,
+            register_values=[7, 0xFFFF],
+            signed=False))
+        client.process()
+
+        self.assertEqual(itf.responses[-1], b'\x17\x06\xFF\xFF\x00\x03'
+                                            b'\xFF\xFC')
+        self.assertEqual(client.get_hreg(0), 7)
+        self.assertEqual(calls, [('set', 0, [7, 0xFFFF]),
+                                 ('get', 1, [0xFFFF, 3, -4])])
+
+        # cached responses of the written registers are dropped
+        itf.requests.append(b'\x01' + functions.read_holding_registers(0, 1))
+        client.process()
+        self.assertEqual(itf.responses[-1], b'\x03\x02\x00\x07')
+
+        # nothing is written if any register to read does not exist
+        itf.requests.append(b'\x01' + functions.read_write_multiple_registers(
+            read_starting_address=3,
+            read_quantity=2,
+            write_starting_address=0,
+            register_values=[9]))
+        client.process()
+
+        self.assertEqual(itf.responses[-1], b'\x97\x02')
+        self.assertEqual(client.get_hreg(0), 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
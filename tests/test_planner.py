@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the read request planner of umodbus"""
+
+import mpy_unittest as unittest
+from umodbus import const as Const
+from umodbus.planner import plan_reads, ReadPlanner
+
+from .fake_host import HostTestCase
+
+
+class TestPlanner(HostTestCase):
+    def test_plan_reads(self) -> None:
+        """Test merging of points into read blocks"""
+        points = [
+            (10, 'HREGS', 110, 2),
+            (10, 'HREGS', 100, 4),
+            (10, 'HREGS', 102, 4),
+            (10, 'COILS', 100, 1),
+            (11, 'HREGS', 106, 1),
+        ]
+
+        blocks = plan_reads(points=points)
+        self.assertEqual(len(blocks), 4)
+        self.assertEqual(
+            [(b.slave_addr, b.reg_type, b.address, b.quantity)
+             for b in blocks],
+            [(10, 'COILS', 100, 1),
+             (10, 'HREGS', 100, 6),
+             (10, 'HREGS', 110, 2),
+             (11, 'HREGS', 106, 1)])
+        self.assertEqual(blocks[0].function_code, Const.READ_COILS)
+        self.assertEqual(sorted(blocks[1].points), [1, 2])
+
+        # a gap of four unrequested registers is bridged
+        blocks = plan_reads(points=points, max_gap=4)
+        self.assertEqual(len(blocks), 3)
+        self.assertEqual(blocks[1].address, 100)
+        self.assertEqual(blocks[1].quantity, 12)
+        self.assertEqual(sorted(blocks[1].points), [0, 1, 2])
+
+    def test_plan_reads_limits(self) -> None:
+        """Test protocol limits of merged read blocks"""
+        points = [(1, 'HREGS', addr, 1) for addr in range(0, 200)]
+        blocks = plan_reads(points=points)
+        self.assertEqual([(b.address, b.quantity) for b in blocks],
+                         [(0, 125), (125, 75)])
+
+        points = [(1, 'COILS', 0, 1500), (1, 'COILS', 1500, 1000)]
+        blocks = plan_reads(points=points)
+        self.assertEqual(len(blocks), 2)
+
+        with self.assertRaises(ValueError):
+            plan_reads(points=[(1, 'IREGS', 0, 126)])
+
+        with self.assertRaises(KeyError):
+            plan_reads(points=[(1, 'FOO', 0, 1)])
+
+    def test_read_planner_execute(self) -> None:
+        """Test scattering the results of merged reads to the points"""
+        host = self._host
+        points = [
+            (10, 'HREGS', 104, 2),
+            (10, 'COILS', 3, 3),
+            (10, 'HREGS', 100, 3),
+        ]
+        planner = ReadPlanner(host=host, points=points, max_gap=1)
+        results = planner.execute()
+
+        self.assertEqual(host.requests,
+                         [(10, Const.READ_COILS, 3, 3),
+                          (10, Const.READ_HOLDING_REGISTERS, 100, 6)])
+        self.assertEqual(results[0], (104, 105))
+        self.assertEqual(results[1], [True, False, True])
+        self.assertEqual(results[2], (100, 101, 102))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the request parsing of umodbus"""
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus import const as Const
+from umodbus.common import Request, ModbusException
+
+
+class TestRequest(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+    def test_parse(self) -> None:
+        """Test parsing read and write requests"""
+        request = Request(None, b'\x0A\x03\x00\x5D\x00\x02')
+
+        self.assertEqual(request.unit_addr, 10)
+        self.assertEqual(request.function, Const.READ_HOLDING_REGISTERS)
+        self.assertEqual(request.register_addr, 93)
+        self.assertEqual(request.quantity, 2)
+        self.assertIsNone(request.data)
+
+        request = Request(None, b'\x0A\x10\x00\x5D\x00\x02\x04\x00\x01\xFF\xFF')
+        self.assertEqual(request.quantity, 2)
+        self.assertEqual(bytes(request.data), b'\x00\x01\xFF\xFF')
+
+    def test_reuse(self) -> None:
+        """Test reusing a request for the next frame without copies"""
+        request = Request(None)
+        self.assertIsNone(request.quantity)
+
+        buf = bytearray(b'\x01\x06\x00\x01\x00\x07')
+        self.assertIs(request.parse(buf), request)
+        self.assertEqual(request.function, Const.WRITE_SINGLE_REGISTER)
+        self.assertIsNone(request.quantity)
+        self.assertEqual(bytes(request.data), b'\x00\x07')
+
+        # the data refers to the receive buffer
+        buf[5] = 0x08
+        self.assertEqual(bytes(request.data), b'\x00\x08')
+
+        request.parse(b'\x02\x01\x00\x00\x00\x0A')
+        self.assertEqual(request.unit_addr, 2)
+        self.assertEqual(request.function, Const.READ_COILS)
+        self.assertEqual(request.quantity, 10)
+        self.assertIsNone(request.data)
+
+    def test_read_write_multiple_registers(self) -> None:
+        """Test parsing a request to write and read multiple registers"""
+        request = Request(None, b'\x01' + b'\x17\x00\x03\x00\x06\x00\x0E'
+                          b'\x00\x02\x04\x00\xFF\xFF\xFF')
+
+        self.assertEqual(request.function,
+                         Const.READ_WRITE_MULTIPLE_REGISTERS)
+        self.assertEqual(request.register_addr, 3)
+        self.assertEqual(request.quantity, 6)
+        self.assertEqual(request.write_register_addr, 14)
+        self.assertEqual(request.write_quantity, 2)
+        self.assertEqual(bytes(request.data), b'\x00\xFF\xFF\xFF')
+
+        request.parse(b'\x01\x03\x00\x5D\x00\x02')
+        self.assertIsNone(request.write_register_addr)
+        self.assertIsNone(request.write_quantity)
+
+        with self.assertRaises(ModbusException):
+            # byte count does not match the write quantity
+            request.parse(b'\x01\x17\x00\x03\x00\x01\x00\x0E\x00\x01'
+                          b'\x04\x00\x01')
+
+        with self.assertRaises(ModbusException):
+            # too many registers to write
+            request.parse(b'\x01\x17\x00\x03\x00\x01\x00\x0E\x00\x7A'
+                          b'\xF4' + bytes(244))
+
+    def test_invalid(self) -> None:
+        """Test invalid requests"""
+        request = Request(None)
+
+        with self.assertRaises(ModbusException):
+            # invalid coil state
+            request.parse(b'\x01\x05\x00\x01\x12\x00')
+
+        with self.assertRaises(ModbusException):
+            # byte count does not match the quantity
+            request.parse(b'\x01\x10\x00\x01\x00\x02\x02\x00\x01')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the retry policy of umodbus hosts"""
+
+import mpy_unittest as unittest
+from umodbus.common import RetryPolicy
+from umodbus.common import ResponseTimeoutError, CRCError
+from umodbus.common import ResponseMismatchError, SlaveExceptionError
+
+from .fake_host import HostTestCase
+
+
+class TestRetry(HostTestCase):
+    def test_no_policy(self) -> None:
+        """Test requests are sent once without a policy"""
+        self.assertIsNone(self._host.retry_policy)
+
+        self._host.errors.append(CRCError('invalid response CRC'))
+        with self.assertRaises(CRCError):
+            self._host.read_holding_registers(slave_addr=10,
+                                              starting_addr=0,
+                                              register_qty=2)
+        self.assertEqual(self._host.timeouts, [None])
+
+    def test_retry(self) -> None:
+        """Test retrying retryable errors"""
+        policy = RetryPolicy(retries=2)
+        self._host.set_retry_policy(policy)
+
+        self._host.errors.append(CRCError('invalid response CRC'))
+        self._host.errors.append(ResponseMismatchError('wrong slave address'))
+        self.assertEqual(
+            self._host.read_holding_registers(slave_addr=10,
+                                              starting_addr=1,
+                                              register_qty=2),
+            (1, 2))
+        self.assertEqual(policy.attempts, 3)
+        self.assertEqual(policy.retried, 2)
+        self.assertEqual(policy.failed, 0)
+
+        # one error more than retries
+        self._host.errors.append(ResponseTimeoutError('no data'))
+        self._host.errors.append(ResponseTimeoutError('no data'))
+        self._host.errors.append(ResponseTimeoutError('no data'))
+        with self.assertRaises(ResponseTimeoutError):
+            self._host.read_holding_registers(slave_addr=10,
+                                              starting_addr=0,
+                                              register_qty=2)
+        self.assertEqual(policy.attempts, 6)
+        self.assertEqual(policy.failed, 1)
+
+    def test_not_retryable(self) -> None:
+        """Test errors not retried by the policy"""
+        policy = RetryPolicy(retries=3)
+        self._host.set_retry_policy(policy)
+
+        self._host.errors.append(SlaveExceptionError(exception_code=2))
+        with self.assertRaises(SlaveExceptionError) as context:
+            self._host.read_holding_registers(slave_addr=10,
+                                              starting_addr=0,
+                                              register_qty=2)
+        self.assertEqual(context.exception.exception_code, 2)
+        self.assertIsInstance(context.exception, ValueError)
+        self.assertEqual(policy.attempts, 1)
+
+        # retry slave exceptions as well
+        policy.retry_on = (SlaveExceptionError, )
+        self._host.errors.append(SlaveExceptionError(exception_code=6))
+        self._host.read_holding_registers(slave_addr=10,
+                                          starting_addr=0,
+                                          register_qty=2)
+        self.assertEqual(policy.retried, 1)
+
+    def test_deadline(self) -> None:
+        """Test passing the remaining time and giving up at the deadline"""
+        policy = RetryPolicy(retries=5, backoff=40, deadline=100)
+        self._host.set_retry_policy(policy)
+
+        self._host.read_holding_registers(slave_addr=10,
+                                          starting_addr=0,
+                                          register_qty=2)
+        self.assertTrue(0 < self._host.timeouts[0] <= 100)
+
+        # the second retry would wait until after the deadline
+        self._host.timeouts = list()
+        for _ in range(5):
+            self._host.errors.append(ResponseTimeoutError('no data'))
+        with self.assertRaises(ResponseTimeoutError):
+            self._host.read_holding_registers(slave_addr=10,
+                                              starting_addr=0,
+                                              register_qty=2)
+        self.assertEqual(len(self._host.timeouts), 2)
+        self.assertTrue(self._host.timeouts[1] <= 60)
+
+    def test_delay(self) -> None:
+        """Test the exponential backoff"""
+        policy = RetryPolicy(backoff=100, max_backoff=500)
+
+        self.assertEqual(policy.delay(retry=1), 100)
+        self.assertEqual(policy.delay(retry=2), 200)
+        self.assertEqual(policy.delay(retry=3), 400)
+        self.assertEqual(policy.delay(retry=4), 500)
+        self.assertEqual(policy.delay(retry=40), 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
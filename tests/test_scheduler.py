@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the poll scheduler of umodbus"""
+
+import mpy_unittest as unittest
+from umodbus import const as Const
+from umodbus import scheduler
+from umodbus.scheduler import PollScheduler
+
+from .fake_host import FakeClock, HostTestCase
+
+
+class TestScheduler(HostTestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        super().setUp()
+        self._cache = dict()
+        self._scheduler = PollScheduler(host=self._host,
+                                        cache=self._cache,
+                                        backoff=10000)
+
+    def test_priority(self) -> None:
+        """Test polling due jobs by priority"""
+        results = list()
+        self._scheduler.add_job(slave_addr=10,
+                                reg_type='HREGS',
+                                address=100,
+                                quantity=2,
+                                period=10000,
+                                priority=1)
+        job = self._scheduler.add_job(
+            slave_addr=10,
+            reg_type='HREGS',
+            address=200,
+            quantity=1,
+            period=10000,
+            priority=0,
+            callback=lambda job, values: results.append(values))
+
+        self.assertEqual(self._scheduler.run_once(), 0)
+        self.assertEqual(self._host.requests,
+                         [(10, Const.READ_HOLDING_REGISTERS, 200, 1)])
+        self.assertEqual(results, [(200, )])
+        self.assertEqual(job.values, (200, ))
+        self.assertEqual(job.polls, 1)
+
+        # the second job is due, afterwards none until the next period
+        self.assertGreater(self._scheduler.run_once(), 0)
+        self.assertEqual(self._host.requests,
+                         [(10, Const.READ_HOLDING_REGISTERS, 200, 1),
+                          (10, Const.READ_HOLDING_REGISTERS, 100, 2)])
+        self.assertEqual(self._cache[(10, 'HREGS', 101)], 101)
+
+        stats = self._scheduler.statistics()
+        self.assertEqual(len(stats), 2)
+        self.assertEqual(stats[1]['polls'], 1)
+        self.assertEqual(stats[1]['requested_rate'], 0.1)
+
+        self.assertTrue(self._scheduler.remove_job(job))
+        self.assertFalse(self._scheduler.remove_job(job))
+
+    def test_backoff(self) -> None:
+        """Test suspending jobs of a not responding slave"""
+        dead = self._scheduler.add_job(slave_addr=11,
+                                       reg_type='HREGS',
+                                       address=0,
+                                       quantity=1,
+                                       period=10000,
+                                       priority=0)
+        self._scheduler.add_job(slave_addr=11,
+                                reg_type='HREGS',
+                                address=10,
+                                quantity=1,
+                                period=10000,
+                                priority=0)
+        alive = self._scheduler.add_job(slave_addr=10,
+                                        reg_type='HREGS',
+                                        address=0,
+                                        quantity=1,
+                                        period=10000,
+                                        priority=1)
+
+        self._scheduler.run_once()
+        self._scheduler.run_once()
+        self._scheduler.run_once()
+
+        # slave 11 is suspended after its first failed poll
+        self.assertEqual(self._host.requests,
+                         [(11, Const.READ_HOLDING_REGISTERS, 0, 1),
+                          (10, Const.READ_HOLDING_REGISTERS, 0, 1)])
+        self.assertEqual(dead.errors, 1)
+        self.assertIsInstance(dead.last_error, OSError)
+        self.assertEqual(alive.polls, 1)
+
+    def test_backoff_after_timeout(self) -> None:
+        """Test starting the backoff time after a response timeout"""
+        clock = FakeClock()
+        self._host.clock = clock
+        self._host.timeout = 1500
+        system_time = scheduler.time
+        scheduler.time = clock
+
+        try:
+            sched = PollScheduler(host=self._host, backoff=1000)
+            for address in range(2):
+                sched.add_job(slave_addr=11,
+                              reg_type='HREGS',
+                              address=address,
+                              quantity=1,
+                              period=10000)
+
+            # the first poll times out after 1.5 sec, the second job of the
+            # slave is not polled until 1 sec after the timeout
+            self.assertEqual(sched.run_once(), 1000)
+            self.assertEqual(self._host.requests,
+                             [(11, Const.READ_HOLDING_REGISTERS, 0, 1)])
+            self.assertEqual(sched._suspended[11], (1, 2500))
+
+            clock.ms = 2000
+            self.assertEqual(sched.run_once(), 500)
+            self.assertEqual(len(self._host.requests), 1)
+
+            # the backoff time is doubled after the next timeout, both jobs
+            # are due again after their period
+            clock.ms = 2500
+            self.assertEqual(sched.run_once(), 6000)
+            self.assertEqual(self._host.requests,
+                             [(11, Const.READ_HOLDING_REGISTERS, 0, 1),
+                              (11, Const.READ_HOLDING_REGISTERS, 1, 1)])
+            self.assertEqual(sched._suspended[11], (2, 6000))
+        finally:
+            scheduler.time = system_time
+
+    def test_malformed_response(self) -> None:
+        """Test suspending a slave whose response can not be parsed"""
+        job = self._scheduler.add_job(slave_addr=10,
+                                      reg_type='HREGS',
+                                      address=0,
+                                      quantity=2,
+                                      period=1)
+        other = self._scheduler.add_job(slave_addr=13,
+                                        reg_type='HREGS',
+                                        address=0,
+                                        quantity=1,
+                                        period=1)
+        self._host.errors.append(IndexError('index out of range'))
+
+        # the error does not escape the scheduler
+        self._scheduler.run_once()
+        self.assertEqual(job.errors, 1)
+        self.assertIsInstance(job.last_error, IndexError)
+        self.assertEqual(self._scheduler._suspended[10][0], 1)
+
+        # jobs of other slaves are still polled
+        self._scheduler.run_once()
+        self.assertEqual(other.errors, 0)
+        self.assertEqual(self._host.requests[-1],
+                         (13, Const.READ_HOLDING_REGISTERS, 0, 1))
+
+    def test_exception_response(self) -> None:
+        """Test slaves responding with an exception are not suspended"""
+        job = self._scheduler.add_job(slave_addr=12,
+                                      reg_type='HREGS',
+                                      address=0,
+                                      quantity=1,
+                                      period=1)
+
+        self._scheduler.run_once()
+        self.assertEqual(job.errors, 1)
+        self.assertIsInstance(job.last_error, ValueError)
+        self.assertNotIn(12, self._scheduler._suspended)
+
+        with self.assertRaises(ValueError):
+            self._scheduler.add_job(slave_addr=10,
+                                    reg_type='IREGS',
+                                    address=0,
+                                    quantity=126,
+                                    period=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
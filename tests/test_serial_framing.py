@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the length based response framing of Serial"""
+
+import struct
+import time
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus import const as Const
+from umodbus import functions
+from umodbus import serial as serial_module
+from umodbus.common import CRCError, ResponseTimeoutError
+from umodbus.common import SlaveExceptionError
+from umodbus.crc import crc16
+
+# response timeout of a request in milliseconds
+TIMEOUT = 20
+
+
+class ChunkedUART(object):
+    """UART returning the queued response in chunks after each write"""
+    def __init__(self, uart_id: int, **kwargs) -> None:
+        self.responses = list()
+        self.chunk_size = 3
+        self.written = list()
+        self._chunks = list()
+
+    def any(self) -> int:
+        if self._chunks:
+            return len(self._chunks[0])
+        return 0
+
+    def readinto(self, buf) -> int:
+        chunk = self._chunks.pop(0)
+        count = min(len(chunk), len(buf))
+        buf[:count] = chunk[:count]
+        return count
+
+    def read(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = list()
+        return data
+
+    def write(self, data) -> int:
+        self.written.append(bytes(data))
+
+        if self.responses:
+            response, trailing = self.responses.pop(0)
+            for idx in range(0, len(response), self.chunk_size):
+                self._chunks.append(response[idx:idx + self.chunk_size])
+            if trailing:
+                self._chunks.append(trailing)
+
+        return len(data)
+
+
+class TestSerialFraming(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+        self._uart_class = serial_module.UART
+        serial_module.UART = ChunkedUART
+        self._host = serial_module.Serial(baudrate=115200, pins=(1, 2))
+        self._uart = self._host._uart
+
+    def tearDown(self) -> None:
+        """Run after every test method"""
+        serial_module.UART = self._uart_class
+
+    def _queue(self, pdu: bytes, trailing: bytes = b'\x00') -> None:
+        """
+        Queue the response to the next request of slave 1, followed by a
+        trailing byte not belonging to the response
+        """
+        frame = bytes([1]) + bytes(pdu)
+        frame += struct.pack('<H', crc16(frame))
+        self._uart.responses.append((frame, trailing))
+
+    def _request(self, modbus_pdu: bytes, count: bool) -> bytes:
+        """Send a request to slave 1 and get the validated response"""
+        return self._host._send_receive(modbus_pdu=modbus_pdu,
+                                        slave_addr=1,
+                                        count=count,
+                                        timeout=TIMEOUT)
+
+    def _requests(self) -> list:
+        """
+        Get a request of each function code group with its response PDU and
+        whether the response contains a byte count
+        """
+        reads = [
+            (functions.read_coils(starting_address=0, quantity=10),
+             functions.response(Const.READ_COILS, 0, 10, None,
+                                [True] * 10)),
+            (functions.read_discrete_inputs(starting_address=0, quantity=3),
+             functions.response(Const.READ_DISCRETE_INPUTS, 0, 3, None,
+                                [True, False, True])),
+            (functions.read_holding_registers(starting_address=0, quantity=3),
+             functions.response(Const.READ_HOLDING_REGISTERS, 0, 3, None,
+                                [1, 2, 3])),
+            (functions.read_input_registers(starting_address=0, quantity=1),
+             functions.response(Const.READ_INPUT_REGISTER, 0, 1, None,
+                                [4])),
+            (functions.read_write_multiple_registers(
+                read_starting_address=0,
+                read_quantity=2,
+                write_starting_address=5,
+                register_values=[7]),
+             functions.response(Const.READ_WRITE_MULTIPLE_REGISTERS, 0, 2,
+                                None, [5, 6])),
+        ]
+        writes = [
+            functions.write_single_coil(output_address=1, output_value=True),
+            functions.write_single_register(register_address=2,
+                                            register_value=3),
+            functions.write_multiple_coils(starting_address=0,
+                                           value_list=[1, 0, 1]),
+            functions.write_multiple_registers(starting_address=0,
+                                               register_values=[1, 2]),
+        ]
+
+        # write responses echo the address and the value or quantity
+        return ([(request, bytes(pdu), True) for request, pdu in reads] +
+                [(request, bytes(request[:5]), False) for request in writes])
+
+    def test_expected_length(self) -> None:
+        """Test reading responses up to their expected length"""
+        for request, pdu, count in self._requests():
+            self.assertEqual(self._host._expected_resp_len(request),
+                             len(pdu) + 1 + Const.CRC_LENGTH)
+
+            self._queue(pdu=pdu)
+            response = self._request(modbus_pdu=request, count=count)
+
+            self.assertEqual(bytes(response), pdu[2:] if count else pdu[1:])
+            # the trailing byte has not been read
+            self.assertEqual(self._uart.read(), b'\x00')
+
+        self.assertIsNone(self._host._expected_resp_len(b'\x2b\x0e\x01\x00'))
+
+    def test_exception(self) -> None:
+        """Test reading exception responses up to their length"""
+        for request, _, count in self._requests():
+            self._queue(pdu=bytes([request[0] + Const.ERROR_BIAS,
+                                   Const.ILLEGAL_DATA_ADDRESS]))
+
+            with self.assertRaises(SlaveExceptionError):
+                self._request(modbus_pdu=request, count=count)
+
+            self.assertEqual(self._uart.read(), b'\x00')
+
+    def test_short_response(self) -> None:
+        """Test ending incomplete responses after the response timeout"""
+        for request, pdu, count in self._requests():
+            # the CRC of the response is missing
+            self._uart.responses.append((bytes([1]) + pdu, b''))
+
+            start = time.ticks_ms()
+            with self.assertRaises(CRCError):
+                self._request(modbus_pdu=request, count=count)
+            self.assertTrue(time.ticks_diff(time.ticks_ms(), start) >=
+                            TIMEOUT)
+
+        with self.assertRaises(ResponseTimeoutError):
+            self._request(modbus_pdu=functions.read_coils(starting_address=0,
+                                                          quantity=1),
+                          count=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing pipelined requests of the TCP host"""
+
+import _thread
+import socket
+import struct
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus import const as Const
+from umodbus import functions
+from umodbus.common import RetryPolicy
+from umodbus.common import ResponseTimeoutError, SlaveExceptionError
+from umodbus.tcp import TCP
+
+LOCAL_IP = '127.0.0.1'
+# each test module uses its own port, see test_tcp_server
+LOCAL_PORT = 15028
+
+
+class TestTCPPipeline(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+        self._server = socket.socket()
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(socket.getaddrinfo(LOCAL_IP, LOCAL_PORT)[0][-1])
+        self._server.listen(1)
+        self._conn = None
+        self._host = None
+
+    def tearDown(self) -> None:
+        """Run after every test method"""
+        if self._host is not None:
+            self._host.close()
+        if self._conn is not None:
+            self._conn.close()
+        self._server.close()
+
+    def _connect(self, timeout: float = 2.0, max_in_flight: int = 4) -> TCP:
+        """Connect a host and accept its connection"""
+        self._host = TCP(slave_ip=LOCAL_IP,
+                         slave_port=LOCAL_PORT,
+                         timeout=timeout,
+                         max_in_flight=max_in_flight)
+        self._conn, _ = self._server.accept()
+        self._conn.settimeout(2)
+
+        return self._host
+
+    def _recv_requests(self, quantity: int) -> list:
+        """Receive read requests as tuples of TID, unit, FC, address, qty"""
+        data = b''
+        while len(data) < 12 * quantity:
+            data += self._conn.recv(256)
+
+        self.assertEqual(len(data), 12 * quantity)
+
+        requests = list()
+        for idx in range(quantity):
+            trans_id, _, _, unit_id, fc, address, qty = struct.unpack_from(
+                '>HHHBBHH', data, 12 * idx)
+            requests.append((trans_id, unit_id, fc, address, qty))
+
+        return requests
+
+    @staticmethod
+    def _response(trans_id: int,
+                  unit_id: int,
+                  function_code: int,
+                  address: int,
+                  quantity: int) -> bytes:
+        """
+        Create the response of a read request
+
+        Coils are set at odd addresses, registers return their address.
+        """
+        if function_code in [Const.READ_COILS, Const.READ_DISCRETE_INPUTS]:
+            values = [bool((address + idx) % 2) for idx in range(quantity)]
+        else:
+            values = list(range(address, address + quantity))
+
+        pdu = functions.response(function_code, address, quantity, None,
+                                 values)
+
+        return struct.pack('>HHHB', trans_id, 0, len(pdu) + 1,
+                           unit_id) + bytes(pdu)
+
+    def _serve(self, skip: list, exceptions: list) -> None:
+        """
+        Answer the requests in a thread, except the ones with a transaction
+        ID to skip. Requests with a transaction ID of the exceptions are
+        answered by an exception response.
+        """
+        conn = self._conn
+
+        def serve() -> None:
+            data = b''
+            while True:
+                try:
+                    chunk = conn.recv(256)
+                except OSError:
+                    return
+                if not chunk:
+                    return
+
+                data += chunk
+                while len(data) >= 12:
+                    trans_id, _, _, unit_id, fc, address, qty = \
+                        struct.unpack_from('>HHHBBHH', data, 0)
+                    data = data[12:]
+
+                    if trans_id in skip:
+                        continue
+                    elif trans_id in exceptions:
+                        conn.send(struct.pack('>HHHBBB', trans_id, 0, 3,
+                                              unit_id, fc + Const.ERROR_BIAS,
+                                              Const.ILLEGAL_DATA_ADDRESS))
+                    else:
+                        conn.send(self._response(trans_id, unit_id, fc,
+                                                 address, qty))
+
+        _thread.start_new_thread(serve, ())
+
+    def test_reverse_order(self) -> None:
+        """Test completing requests answered in reverse order"""
+        host = self._connect()
+
+        handles = [
+            host.submit(slave_addr=1,
+                        function_code=Const.READ_HOLDING_REGISTERS,
+                        starting_addr=10,
+                        quantity=2),
+            host.submit(slave_addr=2,
+                        function_code=Const.READ_COILS,
+                        starting_addr=0,
+                        quantity=3),
+            host.submit(slave_addr=1,
+                        function_code=Const.READ_INPUT_REGISTER,
+                        starting_addr=20,
+                        quantity=1),
+        ]
+        self.assertEqual(len(host._pending), 3)
+        self.assertFalse(any(handle.done for handle in handles))
+
+        # all requests are sent before any response has been received
+        requests = self._recv_requests(quantity=3)
+        self.assertEqual([request[0] for request in requests], [0, 1, 2])
+
+        for request in reversed(requests):
+            self._conn.send(self._response(*request))
+
+        # the result of the first request receives all responses
+        self.assertEqual(handles[0].result(), (10, 11))
+        self.assertTrue(all(handle.done for handle in handles))
+        self.assertEqual(handles[1].result(), [False, True, False])
+        self.assertEqual(handles[2].result(), (20, ))
+        self.assertEqual(host._pending, {})
+
+        with self.assertRaises(ValueError):
+            host.submit(slave_addr=1,
+                        function_code=Const.WRITE_SINGLE_REGISTER,
+                        starting_addr=0,
+                        quantity=1)
+
+    def test_read_many(self) -> None:
+        """Test collecting the results of several pipelined reads"""
+        host = self._connect()
+
+        # the responses are received before the requests are sent, the
+        # transaction IDs of the host start at 0
+        reads = [(1, Const.READ_HOLDING_REGISTERS, 5, 3),
+                 (1, Const.READ_DISCRETE_INPUTS, 1, 2),
+                 (3, Const.READ_INPUT_REGISTER, 7, 1)]
+        for trans_id in reversed(range(len(reads))):
+            self._conn.send(self._response(trans_id, *reads[trans_id]))
+
+        results = host.read_many(requests=reads, signed=False)
+
+        self.assertEqual(results, [(5, 6, 7), [True, False], (7, )])
+        self.assertEqual([request[1:] for request in self._recv_requests(3)],
+                         reads)
+
+    def test_read_many_retry(self) -> None:
+        """Test retrying pipelined reads by the retry policy of the host"""
+        host = self._connect(timeout=0.2)
+        policy = RetryPolicy(retries=1)
+        host.set_retry_policy(policy)
+        reads = [(1, Const.READ_HOLDING_REGISTERS, 5, 2),
+                 (1, Const.READ_COILS, 0, 3)]
+
+        # the first request is not answered, its retry is
+        self._serve(skip=[0], exceptions=[3])
+        results = host.read_many(requests=reads)
+
+        self.assertEqual(results, [(5, 6), [False, True, False]])
+        self.assertEqual(policy.attempts, 3)
+        self.assertEqual(policy.retried, 1)
+        self.assertEqual(policy.failed, 0)
+
+        # exception responses are not retried
+        with self.assertRaises(SlaveExceptionError):
+            host.read_many(requests=reads)
+        self.assertEqual(policy.attempts, 5)
+        self.assertEqual(policy.failed, 1)
+
+    def test_max_in_flight(self) -> None:
+        """Test draining responses before exceeding the request window"""
+        host = self._connect(max_in_flight=2)
+
+        # second request answered first, then the first one
+        self._conn.send(self._response(1, 1, Const.READ_HOLDING_REGISTERS,
+                                       1, 1))
+        self._conn.send(self._response(0, 1, Const.READ_HOLDING_REGISTERS,
+                                       0, 1))
+
+        handles = [host.submit(slave_addr=1,
+                               function_code=Const.READ_HOLDING_REGISTERS,
+                               starting_addr=address,
+                               quantity=1)
+                   for address in range(2)]
+        self.assertEqual(len(host._pending), 2)
+        self.assertFalse(any(handle.done for handle in handles))
+
+        # the window is full, the third request is sent after a response
+        handles.append(host.submit(slave_addr=1,
+                                   function_code=Const.READ_HOLDING_REGISTERS,
+                                   starting_addr=2,
+                                   quantity=1))
+        self.assertTrue(handles[0].done)
+        self.assertTrue(handles[1].done)
+        self.assertEqual(list(host._pending.keys()), [2])
+
+        requests = self._recv_requests(quantity=3)
+        self._conn.send(self._response(*requests[2]))
+
+        self.assertEqual([handle.result() for handle in handles],
+                         [(0, ), (1, ), (2, )])
+
+    def test_errors(self) -> None:
+        """Test failing single in-flight requests"""
+        host = self._connect(timeout=0.2)
+
+        handles = [host.submit(slave_addr=1,
+                               function_code=Const.READ_HOLDING_REGISTERS,
+                               starting_addr=address,
+                               quantity=1)
+                   for address in range(3)]
+        requests = self._recv_requests(quantity=3)
+
+        # exception response to the third, no response to the first request
+        self._conn.send(struct.pack('>HHHBBB', 2, 0, 3, 1,
+                                    Const.READ_HOLDING_REGISTERS +
+                                    Const.ERROR_BIAS,
+                                    Const.ILLEGAL_DATA_ADDRESS))
+        self._conn.send(self._response(*requests[1]))
+
+        with self.assertRaises(ResponseTimeoutError):
+            handles[0].result()
+        self.assertEqual(handles[1].result(), (1, ))
+        with self.assertRaises(SlaveExceptionError):
+            handles[2].result()
+        self.assertEqual(host._pending, {})
+        self.assertTrue(host.is_connected)
+
+        # a late response of a timed out request is dropped
+        self._conn.send(self._response(*requests[0]))
+        handle = host.submit(slave_addr=1,
+                             function_code=Const.READ_HOLDING_REGISTERS,
+                             starting_addr=3,
+                             quantity=1)
+        self._conn.send(self._response(*self._recv_requests(quantity=1)[0]))
+        self.assertEqual(handle.result(), (3, ))
+
+        # all in-flight requests fail if the slave closes the connection
+        handles = [host.submit(slave_addr=1,
+                               function_code=Const.READ_HOLDING_REGISTERS,
+                               starting_addr=address,
+                               quantity=1)
+                   for address in range(2)]
+        self._recv_requests(quantity=2)
+        self._conn.close()
+        self._conn = None
+
+        for handle in handles:
+            with self.assertRaises(OSError):
+                handle.result()
+        self.assertFalse(host.is_connected)
+        self.assertEqual(host._pending, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
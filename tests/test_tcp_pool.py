@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the reconnecting TCP host and connection pool"""
+
+import socket
+import struct
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus.tcp import TCP, TCPConnectionPool
+
+LOCAL_IP = '127.0.0.1'
+LOCAL_PORT = 15020
+CLOSED_PORT = 15021
+
+
+class TestTCPConnectionPool(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+        self._server = socket.socket()
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(socket.getaddrinfo(LOCAL_IP, LOCAL_PORT)[0][-1])
+        self._server.listen(2)
+
+    def tearDown(self) -> None:
+        """Run after every test method"""
+        self._server.close()
+
+    def _respond(self, conn) -> None:
+        """Answer a read holding registers request with the address"""
+        request = conn.recv(12)
+        trans_id, _, _, unit_id, fc, address, _ = struct.unpack('>HHHBBHH',
+                                                                request)
+        conn.send(struct.pack('>HHHBBBH', trans_id, 0, 5, unit_id, fc, 2,
+                              address))
+
+    def test_reconnect(self) -> None:
+        """Test connecting again after the slave closed the connection"""
+        host = TCP(slave_ip=LOCAL_IP, slave_port=LOCAL_PORT, lazy=True)
+        self.assertFalse(host.is_connected)
+
+        # the request is sent after connecting on demand
+        handle = host.submit(slave_addr=1,
+                             function_code=3,
+                             starting_addr=7,
+                             quantity=1)
+        self.assertTrue(host.is_connected)
+        conn, _ = self._server.accept()
+        self._respond(conn)
+        self.assertEqual(handle.result(), (7, ))
+
+        conn.close()
+        with self.assertRaises(OSError):
+            host.read_holding_registers(slave_addr=1,
+                                        starting_addr=8,
+                                        register_qty=1)
+        self.assertFalse(host.is_connected)
+
+        handle = host.submit(slave_addr=2,
+                             function_code=3,
+                             starting_addr=9,
+                             quantity=1)
+        conn, _ = self._server.accept()
+        self._respond(conn)
+        self.assertEqual(handle.result(), (9, ))
+        self.assertEqual(host.connects, 2)
+
+        host.close()
+        conn.close()
+
+    def test_backoff(self) -> None:
+        """Test failing immediately during the reconnect backoff time"""
+        host = TCP(slave_ip=LOCAL_IP,
+                   slave_port=CLOSED_PORT,
+                   lazy=True,
+                   backoff=60000)
+
+        with self.assertRaises(OSError):
+            host.connect()
+        self.assertEqual(host._failures, 1)
+
+        with self.assertRaises(OSError):
+            host.read_holding_registers(slave_addr=1,
+                                        starting_addr=0,
+                                        register_qty=1)
+        # no further connection attempt within the backoff time
+        self.assertEqual(host._failures, 1)
+        self.assertEqual(host.connects, 0)
+
+    def test_pool(self) -> None:
+        """Test sharing a host by all slaves of an IP and port"""
+        pool = TCPConnectionPool(timeout=1.0)
+        host = pool.get(slave_ip=LOCAL_IP, slave_port=LOCAL_PORT)
+
+        self.assertIs(pool.get(slave_ip=LOCAL_IP, slave_port=LOCAL_PORT),
+                      host)
+        self.assertIsNot(pool.get(slave_ip=LOCAL_IP, slave_port=CLOSED_PORT),
+                         host)
+        self.assertEqual(len(pool), 2)
+        self.assertFalse(host.is_connected)
+
+        pool.close(slave_ip=LOCAL_IP, slave_port=CLOSED_PORT)
+        self.assertEqual(len(pool), 1)
+        pool.close()
+        self.assertEqual(len(pool), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the multi client mode of the TCP server"""
+
+import socket
+import struct
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus import const as Const
+from umodbus import functions
+from umodbus.tcp import TCPServer
+
+LOCAL_IP = '127.0.0.1'
+# each test uses its own port, the server can not bind a port again while
+# closed connections of the previous test are in the TIME_WAIT state
+LOCAL_PORT = 15022
+
+
+class TestTCPServer(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+        self._server = TCPServer()
+        self._port = None
+        self._clients = list()
+
+    def tearDown(self) -> None:
+        """Run after every test method"""
+        for client in self._clients:
+            client.close()
+        self._server._sock.close()
+        for connection in self._server._connections.values():
+            connection.sock.close()
+
+    def _bind(self, port: int) -> None:
+        """Bind the server in multi client mode"""
+        self._port = port
+        self._server.bind(local_ip=LOCAL_IP,
+                          local_port=port,
+                          max_connections=2,
+                          multi_client=True)
+
+    def _connect(self) -> socket.socket:
+        """Connect a new client to the server"""
+        client = socket.socket()
+        client.settimeout(2)
+        client.connect(socket.getaddrinfo(LOCAL_IP, self._port)[0][-1])
+        self._clients.append(client)
+
+        return client
+
+    def _get_requests(self, quantity: int) -> list:
+        """Get the next requests of any client"""
+        requests = list()
+
+        for _ in range(50):
+            request = self._server.get_request(timeout=20)
+            if request is not None:
+                requests.append(request)
+                if len(requests) == quantity:
+                    break
+
+        return requests
+
+    def test_interleaved_clients(self) -> None:
+        """Test answering requests of two clients after receiving both"""
+        self._bind(port=LOCAL_PORT)
+        client_a = self._connect()
+        client_b = self._connect()
+        pdu = functions.read_holding_registers(starting_address=5, quantity=1)
+
+        client_a.send(struct.pack('>HHHB', 0x1111, 0, len(pdu) + 1, 1) + pdu)
+        request_a = self._get_requests(quantity=1)[0]
+        client_b.send(struct.pack('>HHHB', 0x2222, 0, len(pdu) + 1, 2) + pdu)
+        request_b = self._get_requests(quantity=1)[0]
+
+        self.assertIsNot(request_a, request_b)
+        self.assertEqual(request_a.unit_addr, 1)
+        self.assertEqual(request_b.unit_addr, 2)
+
+        # the request of client A is answered after the one of client B has
+        # been received, each client gets the transaction ID of its request
+        request_a.send_response(values=[0x0A])
+        request_b.send_exception(Const.ILLEGAL_DATA_ADDRESS)
+
+        self.assertEqual(client_a.recv(16),
+                         struct.pack('>HHHBBBH', 0x1111, 0, 5, 1,
+                                     Const.READ_HOLDING_REGISTERS, 2, 0x0A))
+        self.assertEqual(client_b.recv(16),
+                         struct.pack('>HHHBBB', 0x2222, 0, 3, 2,
+                                     Const.READ_HOLDING_REGISTERS +
+                                     Const.ERROR_BIAS,
+                                     Const.ILLEGAL_DATA_ADDRESS))
+
+    def test_closed_client(self) -> None:
+        """Test serving a client after another one closed its connection"""
+        self._bind(port=LOCAL_PORT + 1)
+        client_a = self._connect()
+        client_b = self._connect()
+        pdu = functions.read_coils(starting_address=0, quantity=1)
+
+        client_a.send(struct.pack('>HHHB', 7, 0, len(pdu) + 1, 1) + pdu)
+        self._get_requests(quantity=1)
+        self.assertEqual(len(self._server._connections), 2)
+
+        client_a.close()
+        self._clients.remove(client_a)
+        client_b.send(struct.pack('>HHHB', 8, 0, len(pdu) + 1, 1) + pdu)
+        request = self._get_requests(quantity=1)[0]
+        self.assertEqual(len(self._server._connections), 1)
+
+        request.send_response(values=[True])
+        self.assertEqual(client_b.recv(16),
+                         struct.pack('>HHHBBBB', 8, 0, 4, 1,
+                                     Const.READ_COILS, 1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
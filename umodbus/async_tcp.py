@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Asynchronous Modbus TCP
+
+Modbus TCP host and client implementations based on asyncio (uasyncio on
+MicroPython). Requests are served and sent without blocking other tasks of the
+event loop, there is no need to call ``process`` in a tight loop.
+"""
+
+# system packages
+import struct
+import time
+
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
+
+# custom packages
+from . import const as Const
+from .common import Request, CommonModbusFunctions
+from .common import ModbusException
+from .common import ResponseTimeoutError
+from .modbus import Modbus
+from .tcp import TCP, TCPConnection, TCPServer
+
+# typing not natively supported on MicroPython
+from .typing import Any, Callable, Optional
+
+
+class AsyncModbusTCP(Modbus):
+    """Asynchronous Modbus TCP client class"""
+    def __init__(self):
+        super().__init__(
+            # set itf to AsyncTCPServer object, addr_list to None
+            AsyncTCPServer(),
+            None
+        )
+
+    async def bind(self,
+                   local_ip: str,
+                   local_port: int = 502,
+                   max_connections: int = 10) -> None:
+        """
+        Bind IP and port and start serving incomming requests
+
+        :param      local_ip:         IP of this device listening for requests
+        :type       local_ip:         str
+        :param      local_port:       Port of this device
+        :type       local_port:       int
+        :param      max_connections:  Number of maximum connections
+        :type       max_connections:  int
+        """
+        await self._itf.bind(local_ip=local_ip,
+                             local_port=local_port,
+                             max_connections=max_connections,
+                             request_handler=self._process_request)
+
+    async def serve_forever(self) -> None:
+        """Serve incomming requests until the server is closed"""
+        await self._itf.serve_forever()
+
+    async def close(self) -> None:
+        """Stop serving and close all client connections"""
+        await self._itf.close()
+
+    def get_bound_status(self) -> bool:
+        """
+        Get the IP and port binding status.
+
+        :returns:   The bound status, True if already bound, False otherwise.
+        :rtype:     bool
+        """
+        return self._itf.is_bound
+
+
+class AsyncTCPServer(TCPServer):
+    """Asynchronous Modbus TCP host class"""
+    def __init__(self):
+        super().__init__()
+        self._server = None
+        self._writers = list()
+        self._request_handler = None
+
+    async def bind(self,
+                   local_ip: str,
+                   local_port: int = 502,
+                   max_connections: int = 10,
+                   request_handler: Callable[[Request], None] = None) -> None:
+        """
+        Bind IP and port and start serving incomming requests
+
+        :param      local_ip:         IP of this device listening for requests
+        :type       local_ip:         str
+        :param      local_port:       Port of this device
+        :type       local_port:       int
+        :param      max_connections:  Number of maximum connections
+        :type       max_connections:  int
+        :param      request_handler:  Callback processing a decoded request
+        :type       request_handler:  Callable[[Request], None]
+        """
+        await self.close()
+
+        self._max_connections = max_connections
+        self._request_handler = request_handler
+        self._server = await asyncio.start_server(self._handle_client,
+                                                  local_ip,
+                                                  local_port,
+                                                  backlog=max_connections)
+        self._is_bound = True
+
+    async def serve_forever(self) -> None:
+        """Serve incomming requests until the server is closed"""
+        while self._server is not None:
+            await asyncio.sleep(1)
+
+    async def close(self) -> None:
+        """Stop serving and close all client connections"""
+        server = self._server
+        self._server = None
+        if server is not None:
+            server.close()
+
+        for writer in self._writers:
+            writer.close()
+
+        if server is not None:
+            await server.wait_closed()
+
+        # let the client tasks finish before the event loop may be stopped,
+        # each task removes its writer
+        for _ in range(10):
+            if not self._writers:
+                break
+            await asyncio.sleep(0)
+        self._writers = list()
+
+        self._is_bound = False
+
+    async def _handle_client(self, reader, writer) -> None:
+        """
+        Read, process and answer all requests of a connected client
+
+        :param      reader:  The stream reader of the client
+        :type       reader:  asyncio.StreamReader
+        :param      writer:  The stream writer of the client
+        :type       writer:  asyncio.StreamWriter
+        """
+        if len(self._writers) >= self._max_connections:
+            writer.close()
+            return
+
+        self._writers.append(writer)
+        connection = TCPConnection(server=self,
+                                   sock=writer,
+                                   address=writer.get_extra_info('peername'))
+
+        try:
+            while True:
+                header = await reader.readexactly(Const.MBAP_HDR_LENGTH - 1)
+                req_tid, req_pid, req_len = struct.unpack('>HHH', header)
+
+                # the length counts the unit identifier and the PDU, do not
+                # wait for the data of an invalid length
+                if not (2 <= req_len <= Const.MAX_PDU_LENGTH + 1):
+                    # print("Modbus request error: invalid length")
+                    break
+
+                req_uid_and_pdu = await reader.readexactly(req_len)
+
+                if (req_pid != 0):
+                    # print("Modbus request error: PID not 0")
+                    break
+
+                # no await until the response has been written to the stream,
+                # the frame buffer is not shared with other client tasks
+                connection.tid = req_tid
+
+                try:
+                    request = connection.request.parse(req_uid_and_pdu)
+                except ModbusException as e:
+                    connection.send_exception_response(req_uid_and_pdu[0],
+                                                       e.function_code,
+                                                       e.exception_code)
+                else:
+                    if self._request_handler is not None:
+                        self._request_handler(request)
+
+                await writer.drain()
+        except (EOFError, OSError):
+            # connection closed by client
+            pass
+        finally:
+            if writer in self._writers:
+                self._writers.remove(writer)
+            writer.close()
+
+    def _send_adu(self, length: int, connection: TCPConnection) -> None:
+        """
+        Write the Modbus Application Data Unit of the frame buffer to the
+        stream of a client
+
+        :param      length:      The length of the ADU
+        :type       length:      int
+        :param      connection:  The connection of the client
+        :type       connection:  TCPConnection
+        """
+        connection.sock.write(bytes(self._tx_view[:length]))
+
+    def get_request(self,
+                    unit_addr_list: Optional[list] = None,
+                    timeout: int = None) -> None:
+        """
+        Requests are processed by the event loop, see bind
+
+        :returns:   Always None
+        :rtype:     None
+        """
+        return None
+
+
+class AsyncTCP(CommonModbusFunctions):
+    """
+    Asynchronous TCP class handling a connection to a Modbus TCP client
+
+    The connection is opened on the first request or by calling
+    :py:meth:`connect`. Requests of concurrent tasks are sent one after the
+    other.
+
+    All functions of :py:class:`umodbus.common.CommonModbusFunctions` return
+    awaitables, requests are retried according to the retry policy without
+    blocking other tasks.
+
+    :param      slave_ip:    IP of the device providing the requested data
+    :type       slave_ip:    str
+    :param      slave_port:  Port of the device
+    :type       slave_port:  int
+    :param      timeout:     Response timeout in seconds
+    :type       timeout:     float
+    """
+    # reuse header creation and validation of the blocking implementation
+    _create_mbap_hdr = TCP._create_mbap_hdr
+    _validate_resp_hdr = TCP._validate_resp_hdr
+
+    def __init__(self,
+                 slave_ip: str,
+                 slave_port: int = 502,
+                 timeout: float = 5.0):
+        self._slave_ip = slave_ip
+        self._slave_port = slave_port
+        self._timeout = timeout
+        self._reader = None
+        self._writer = None
+        self._lock = asyncio.Lock()
+        self.trans_id_ctr = 0
+
+    async def connect(self) -> None:
+        """Open the connection to the Modbus TCP client"""
+        self._reader, self._writer = await asyncio.open_connection(
+            self._slave_ip, self._slave_port)
+
+    async def close(self) -> None:
+        """Close the connection to the Modbus TCP client"""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = None
+        self._writer = None
+
+    async def _request(self,
+                       slave_addr: int,
+                       modbus_pdu: bytes,
+                       count: bool) -> bytes:
+        """
+        Send a request and receive the response according to the retry
+        policy.
+
+        :param      slave_addr:  The slave address
+        :type       slave_addr:  int
+        :param      modbus_pdu:  The modbus Protocol Data Unit
+        :type       modbus_pdu:  bytes
+        :param      count:       The count
+        :type       count:       bool
+
+        :raise      ResponseTimeoutError:  Deadline exceeded
+        :returns:   Validated response content
+        :rtype:     bytes
+        """
+        policy = self._retry_policy
+        if policy is None:
+            return await self._send_receive(slave_addr=slave_addr,
+                                            modbus_pdu=modbus_pdu,
+                                            count=count)
+
+        start = time.ticks_ms()
+        retry = 0
+
+        while True:
+            timeout = policy.start_attempt(start=start)
+            try:
+                return await self._send_receive(slave_addr=slave_addr,
+                                                modbus_pdu=modbus_pdu,
+                                                count=count,
+                                                timeout=timeout)
+            except Exception as e:
+                retry += 1
+                delay = policy.retry_delay(error=e, retry=retry, start=start)
+
+            if delay:
+                await asyncio.sleep(delay / 1000)
+
+    async def _transact(self,
+                        slave_addr: int,
+                        modbus_pdu: bytes,
+                        count: bool,
+                        decode: Callable[[bytes], Any]) -> Any:
+        """
+        Send a request and decode the validated response content.
+
+        :param      slave_addr:  The slave address
+        :type       slave_addr:  int
+        :param      modbus_pdu:  The modbus Protocol Data Unit
+        :type       modbus_pdu:  bytes
+        :param      count:       The count
+        :type       count:       bool
+        :param      decode:      Function decoding the response content
+        :type       decode:      Callable[[bytes], Any]
+
+        :returns:   The decoded response
+        :rtype:     Any
+        """
+        return decode(await self._request(slave_addr=slave_addr,
+                                          modbus_pdu=modbus_pdu,
+                                          count=count))
+
+    async def _send_receive(self,
+                            slave_addr: int,
+                            modbus_pdu: bytes,
+                            count: bool,
+                            timeout: Optional[int] = None) -> bytes:
+        """
+        Send a modbus message and receive the reponse.
+
+        :param      slave_addr:    The slave identifier
+        :type       slave_addr:    int
+        :param      modbus_pdu:  The modbus PDU
+        :type       modbus_pdu:  bytes
+        :param      count:       The count
+        :type       count:       bool
+        :param      timeout:     Maximum response timeout in milliseconds,
+                                 default the response timeout of the host
+        :type       timeout:     Optional[int]
+
+        :raise      ResponseTimeoutError:  No response received in time
+        :returns:   Modbus data
+        :rtype:     bytes
+        """
+        if timeout is None:
+            timeout = self._timeout
+        else:
+            timeout = min(self._timeout, timeout / 1000)
+
+        async with self._lock:
+            if self._writer is None:
+                await self.connect()
+
+            mbap_hdr, trans_id = self._create_mbap_hdr(slave_addr=slave_addr,
+                                                       modbus_pdu=modbus_pdu)
+
+            try:
+                self._writer.write(mbap_hdr + modbus_pdu)
+                await self._writer.drain()
+
+                response = await asyncio.wait_for(self._read_adu(), timeout)
+            except asyncio.TimeoutError:
+                # the stream state is unknown, reconnect on the next request
+                await self.close()
+                raise ResponseTimeoutError('no response received from slave')
+            except Exception as e:
+                await self.close()
+                raise e
+
+        return self._validate_resp_hdr(response=response,
+                                       trans_id=trans_id,
+                                       slave_addr=slave_addr,
+                                       function_code=modbus_pdu[0],
+                                       count=count)
+
+    async def _read_adu(self) -> bytes:
+        """
+        Read a complete Modbus Application Data Unit
+
+        :raise      ValueError:  Invalid length field of the MBAP header
+        :returns:   Received ADU
+        :rtype:     bytes
+        """
+        header = await self._reader.readexactly(Const.MBAP_HDR_LENGTH - 1)
+        length = struct.unpack_from('>H', header, 4)[0]
+
+        if not (2 <= length <= Const.MAX_PDU_LENGTH + 1):
+            # the caller closes the connection, the stream is out of sync
+            raise ValueError('Invalid MBAP length {}'.format(length))
+
+        return header + await self._reader.readexactly(length)
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Contiguous register banks
+
+Store a block of registers or coils in one preallocated buffer instead of a
+dictionary per address. Holding and input registers are kept in an unsigned
+16 bit array (2 bytes per register), coils and discrete inputs in a packed
+bitset (1 bit per coil).
+"""
+
+# system packages
+from array import array
+
+# typing not natively supported on MicroPython
+from .typing import Callable, List, Optional, Union
+
+
+class RegisterBank(object):
+    """
+    Contiguous block of 16 bit registers (HREGS, IREGS)
+
+    Values are stored unsigned, negative values are converted to their two's
+    complement representation.
+
+    :param      address:    The address of the first register
+    :type       address:    int
+    :param      quantity:   The amount of registers
+    :type       quantity:   int
+    :param      value:      The initial value(s)
+    :type       value:      Union[int, List[int]], optional
+    :param      on_set_cb:  Callback on setting a register of this bank
+    :type       on_set_cb:  Callable[[str, int, List[int]], None]
+    :param      on_get_cb:  Callback on getting a register of this bank
+    :type       on_get_cb:  Callable[[str, int, List[int]], None]
+    """
+    def __init__(self,
+                 address: int,
+                 quantity: int,
+                 value: Union[int, List[int]] = 0,
+                 on_set_cb: Optional[Callable] = None,
+                 on_get_cb: Optional[Callable] = None) -> None:
+        if quantity < 1 or address < 0 or (address + quantity) > 0x10000:
+            raise ValueError('Invalid bank address range')
+
+        self.address = address
+        self.quantity = quantity
+        self.on_set_cb = on_set_cb
+        self.on_get_cb = on_get_cb
+        self._data = array('H', bytearray(2 * quantity))
+
+        if isinstance(value, (list, tuple)):
+            self.set(address=address, value=value)
+        elif value:
+            for idx in range(quantity):
+                self._data[idx] = value & 0xFFFF
+
+    def __contains__(self, address: int) -> bool:
+        return self.address <= address < (self.address + self.quantity)
+
+    def __len__(self) -> int:
+        return self.quantity
+
+    def covers(self, address: int, quantity: int = 1) -> bool:
+        """
+        Check whether a range of registers is fully part of this bank.
+
+        :param      address:   The address of the first register
+        :type       address:   int
+        :param      quantity:  The amount of registers
+        :type       quantity:  int
+
+        :returns:   True if all registers are part of this bank
+        :rtype:     bool
+        """
+        return (self.address <= address and
+                (address + quantity) <= (self.address + self.quantity))
+
+    def get(self, address: int) -> int:
+        """
+        Get the value of a single register.
+
+        :param      address:  The address (ID) of the register
+        :type       address:  int
+
+        :returns:   Register value
+        :rtype:     int
+        """
+        return self._data[address - self.address]
+
+    def set(self, address: int, value: Union[int, List[int]]) -> None:
+        """
+        Set the value of one or several consecutive registers.
+
+        :param      address:  The address (ID) of the first register
+        :type       address:  int
+        :param      value:    The value(s)
+        :type       value:    Union[int, List[int]]
+
+        :raise      ValueError:  Registers are not part of this bank
+        """
+        if not isinstance(value, (list, tuple, array)):
+            value = (value, )
+
+        if not self.covers(address=address, quantity=len(value)):
+            raise ValueError('Registers exceed bank range')
+
+        offset = address - self.address
+        for idx, val in enumerate(value):
+            self._data[offset + idx] = val & 0xFFFF
+
+    def read(self, address: int, quantity: int) -> array:
+        """
+        Get the values of consecutive registers as slice of the bank.
+
+        :param      address:   The address of the first register
+        :type       address:   int
+        :param      quantity:  The amount of registers
+        :type       quantity:  int
+
+        :returns:   Register values
+        :rtype:     array
+        """
+        offset = address - self.address
+        return self._data[offset:offset + quantity]
+
+    def encode_into(self,
+                    buf: bytearray,
+                    offset: int,
+                    address: int,
+                    quantity: int) -> int:
+        """
+        Write the big endian register values into a buffer.
+
+        :param      buf:       The buffer
+        :type       buf:       bytearray
+        :param      offset:    The offset of the first byte inside the buffer
+        :type       offset:    int
+        :param      address:   The address of the first register
+        :type       address:   int
+        :param      quantity:  The amount of registers
+        :type       quantity:  int
+
+        :returns:   Amount of bytes written
+        :rtype:     int
+        """
+        data = self._data
+        start = address - self.address
+
+        for idx in range(start, start + quantity):
+            val = data[idx]
+            buf[offset] = val >> 8
+            buf[offset + 1] = val & 0xFF
+            offset += 2
+
+        return quantity * 2
+
+
+class BitBank(object):
+    """
+    Contiguous block of single bits (COILS, ISTS)
+
+    The bits are packed LSB first, eight bits per byte.
+
+    :param      address:    The address of the first bit
+    :type       address:    int
+    :param      quantity:   The amount of bits
+    :type       quantity:   int
+    :param      value:      The initial value(s)
+    :type       value:      Union[bool, List[bool]], optional
+    :param      on_set_cb:  Callback on setting a bit of this bank
+    :type       on_set_cb:  Callable[[str, int, List[bool]], None]
+    :param      on_get_cb:  Callback on getting a bit of this bank
+    :type       on_get_cb:  Callable[[str, int, List[bool]], None]
+    """
+    def __init__(self,
+                 address: int,
+                 quantity: int,
+                 value: Union[bool, List[bool]] = False,
+                 on_set_cb: Optional[Callable] = None,
+                 on_get_cb: Optional[Callable] = None) -> None:
+        if quantity < 1 or address < 0 or (address + quantity) > 0x10000:
+            raise ValueError('Invalid bank address range')
+
+        self.address = address
+        self.quantity = quantity
+        self.on_set_cb = on_set_cb
+        self.on_get_cb = on_get_cb
+        self._data = bytearray((quantity + 7) // 8)
+
+        if isinstance(value, (list, tuple)):
+            self.set(address=address, value=value)
+        elif value:
+            for idx in range(quantity):
+                self._data[idx >> 3] |= 1 << (idx & 7)
+
+    def __contains__(self, address: int) -> bool:
+        return self.address <= address < (self.address + self.quantity)
+
+    def __len__(self) -> int:
+        return self.quantity
+
+    def covers(self, address: int, quantity: int = 1) -> bool:
+        """
+        Check whether a range of bits is fully part of this bank.
+
+        :param      address:   The address of the first bit
+        :type       address:   int
+        :param      quantity:  The amount of bits
+        :type       quantity:  int
+
+        :returns:   True if all bits are part of this bank
+        :rtype:     bool
+        """
+        return (self.address <= address and
+                (address + quantity) <= (self.address + self.quantity))
+
+    def get(self, address: int) -> bool:
+        """
+        Get the state of a single bit.
+
+        :param      address:  The address (ID) of the bit
+        :type       address:  int
+
+        :returns:   Bit state
+        :rtype:     bool
+        """
+        idx = address - self.address
+        return bool(self._data[idx >> 3] & (1 << (idx & 7)))
+
+    def set(self, address: int, value: Union[bool, List[bool]]) -> None:
+        """
+        Set the state of one or several consecutive bits.
+
+        :param      address:  The address (ID) of the first bit
+        :type       address:  int
+        :param      value:    The state(s)
+        :type       value:    Union[bool, List[bool]]
+
+        :raise      ValueError:  Bits are not part of this bank
+        """
+        if not isinstance(value, (list, tuple)):
+            value = (value, )
+
+        if not self.covers(address=address, quantity=len(value)):
+            raise ValueError('Bits exceed bank range')
+
+        idx = address - self.address
+        for val in value:
+            if val:
+                self._data[idx >> 3] |= 1 << (idx & 7)
+            else:
+                self._data[idx >> 3] &= ~(1 << (idx & 7)) & 0xFF
+            idx += 1
+
+    def read(self, address: int, quantity: int) -> List[bool]:
+        """
+        Get the states of consecutive bits.
+
+        :param      address:   The address of the first bit
+        :type       address:   int
+        :param      quantity:  The amount of bits
+        :type       quantity:  int
+
+        :returns:   Bit states
+        :rtype:     List[bool]
+        """
+        data = self._data
+        start = address - self.address
+
+        return [bool(data[idx >> 3] & (1 << (idx & 7)))
+                for idx in range(start, start + quantity)]
+
+    def encode_into(self,
+                    buf: bytearray,
+                    offset: int,
+                    address: int,
+                    quantity: int) -> int:
+        """
+        Write the packed bit states into a buffer.
+
+        The byte and bit order is the same as of a response created by
+        :py:func:`umodbus.functions.response` for the values of
+        :py:meth:`umodbus.modbus.Modbus._create_response`.
+
+        :param      buf:       The buffer
+        :type       buf:       bytearray
+        :param      offset:    The offset of the first byte inside the buffer
+        :type       offset:    int
+        :param      address:   The address of the first bit
+        :type       address:   int
+        :param      quantity:  The amount of bits
+        :type       quantity:  int
+
+        :returns:   Amount of bytes written
+        :rtype:     int
+        """
+        data = self._data
+        start = address - self.address
+        byte_count = (quantity + 7) // 8
+        head = 8 if quantity > 8 else quantity
+
+        for idx in range(offset, offset + byte_count):
+            buf[idx] = 0
+
+        # the first (up to) eight states are transmitted in reverse order,
+        # followed by all remaining states in reverse order, each byte
+        # filled MSB first, see Modbus._reorder_bits
+        for pos in range(quantity):
+            if pos < head:
+                bit_idx = start + head - 1 - pos
+            else:
+                bit_idx = start + quantity - 1 - (pos - 8)
+
+            if data[bit_idx >> 3] & (1 << (bit_idx & 7)):
+                chunk_len = quantity - (pos & ~7)
+                if chunk_len > 8:
+                    chunk_len = 8
+                buf[offset + (pos >> 3)] |= 1 << (chunk_len - 1 - (pos & 7))
+
+        return byte_count
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Bit codec of coil and discrete input payloads
+
+Pack and unpack the states of coils and discrete inputs directly from and to
+``bytes``, ``bytearray`` or ``memoryview`` objects without formatting each
+byte as binary string.
+
+The bit order is the one of :py:func:`umodbus.functions.write_multiple_coils`
+and :py:func:`umodbus.functions.response`. The states are split into chunks
+of eight, each chunk is sent as one byte filled MSB first. A last chunk of
+less than eight states fills the lowest bits of its byte.
+"""
+
+# typing not natively supported on MicroPython
+from .typing import Iterator, List, Optional, Union
+
+# states of each nibble, MSB first
+_NIBBLES = tuple(tuple(bool(nibble & (0x08 >> bit)) for bit in range(4))
+                 for nibble in range(16))
+
+
+def unpack_bits(data: Union[bytes, bytearray, memoryview],
+                quantity: int,
+                offset: int = 0) -> List[bool]:
+    """
+    Unpack the states of coils or discrete inputs.
+
+    :param      data:      The packed states
+    :type       data:      Union[bytes, bytearray, memoryview]
+    :param      quantity:  The amount of states
+    :type       quantity:  int
+    :param      offset:    The offset of the first byte inside the data
+    :type       offset:    int
+
+    :returns:   The states
+    :rtype:     List[bool]
+    """
+    states = []
+    extend = states.extend
+    nibbles = _NIBBLES
+    full = quantity >> 3
+
+    for byte in memoryview(data)[offset:offset + full]:
+        extend(nibbles[byte >> 4])
+        extend(nibbles[byte & 0x0F])
+
+    rest = quantity & 7
+    if rest:
+        byte = data[offset + full]
+        for bit in range(rest - 1, -1, -1):
+            states.append(bool(byte & (1 << bit)))
+
+    return states
+
+
+def pack_bits_into(buf: Union[bytearray, memoryview],
+                   offset: int,
+                   values: List[Union[bool, int]]) -> int:
+    """
+    Pack the states of coils or discrete inputs into a buffer.
+
+    :param      buf:     The buffer
+    :type       buf:     Union[bytearray, memoryview]
+    :param      offset:  The offset of the first byte inside the buffer
+    :type       offset:  int
+    :param      values:  The states, 0/1 or bool
+    :type       values:  List[Union[bool, int]]
+
+    :returns:   Amount of bytes written
+    :rtype:     int
+    """
+    quantity = len(values)
+    full = quantity >> 3
+    v = values
+    idx = 0
+
+    for pos in range(offset, offset + full):
+        buf[pos] = ((v[idx] << 7) | (v[idx + 1] << 6) | (v[idx + 2] << 5) |
+                    (v[idx + 3] << 4) | (v[idx + 4] << 3) |
+                    (v[idx + 5] << 2) | (v[idx + 6] << 1) | v[idx + 7])
+        idx += 8
+
+    if idx < quantity:
+        byte = 0
+        for bit in range(idx, quantity):
+            byte = (byte << 1) | v[bit]
+        buf[offset + full] = byte
+        full += 1
+
+    return full
+
+
+def pack_bits(values: List[Union[bool, int]]) -> bytes:
+    """
+    Pack the states of coils or discrete inputs.
+
+    :param      values:  The states, 0/1 or bool
+    :type       values:  List[Union[bool, int]]
+
+    :returns:   The packed states
+    :rtype:     bytes
+    """
+    buf = bytearray((len(values) + 7) >> 3)
+    pack_bits_into(buf=buf, offset=0, values=values)
+
+    return bytes(buf)
+
+
+class BitSet(object):
+    """
+    Compact sequence of coil or discrete input states
+
+    The states are kept packed as received or sent, one bit per state, and
+    are only unpacked on access.
+
+    :param      quantity:  The amount of states
+    :type       quantity:  int
+    :param      data:      The packed states, all states are False by default
+    :type       data:      Optional[Union[bytes, bytearray, memoryview]]
+    """
+    def __init__(self,
+                 quantity: int,
+                 data: Optional[Union[bytes, bytearray, memoryview]] = None
+                 ) -> None:
+        byte_count = (quantity + 7) >> 3
+
+        if data is None:
+            self._data = bytearray(byte_count)
+        else:
+            if len(data) < byte_count:
+                raise ValueError('{} bytes required for {} states'.
+                                 format(byte_count, quantity))
+            self._data = bytearray(data[:byte_count])
+
+        self._quantity = quantity
+
+    @classmethod
+    def from_list(cls, values: List[Union[bool, int]]) -> 'BitSet':
+        """
+        Create a bit set of a list of states.
+
+        :param      values:  The states, 0/1 or bool
+        :type       values:  List[Union[bool, int]]
+
+        :returns:   The bit set
+        :rtype:     BitSet
+        """
+        bitset = cls(quantity=len(values))
+        pack_bits_into(buf=bitset._data, offset=0, values=values)
+
+        return bitset
+
+    @property
+    def data(self) -> bytes:
+        """
+        Get the packed states.
+
+        :returns:   The packed states
+        :rtype:     bytes
+        """
+        return bytes(self._data)
+
+    def _position(self, index: int) -> tuple:
+        """
+        Get the byte index and bit mask of a state.
+
+        :param      index:  The index of the state
+        :type       index:  int
+
+        :raise      IndexError:  Index out of range
+        :returns:   The byte index and bit mask
+        :rtype:     tuple
+        """
+        if index < 0:
+            index += self._quantity
+        if not (0 <= index < self._quantity):
+            raise IndexError('BitSet index out of range')
+
+        chunk_len = self._quantity - (index & ~7)
+        if chunk_len > 8:
+            chunk_len = 8
+
+        return index >> 3, 1 << (chunk_len - 1 - (index & 7))
+
+    def __len__(self) -> int:
+        return self._quantity
+
+    def __getitem__(self, index: int) -> bool:
+        byte_idx, mask = self._position(index)
+
+        return bool(self._data[byte_idx] & mask)
+
+    def __setitem__(self, index: int, value: Union[bool, int]) -> None:
+        byte_idx, mask = self._position(index)
+
+        if value:
+            self._data[byte_idx] |= mask
+        else:
+            self._data[byte_idx] &= ~mask & 0xFF
+
+    def __iter__(self) -> Iterator:
+        return iter(self.to_list())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BitSet):
+            return (self._quantity == other._quantity and
+                    self._data == other._data)
+
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == list(other)
+
+        return False
+
+    def __repr__(self) -> str:
+        return 'BitSet({})'.format(self.to_list())
+
+    def to_list(self) -> List[bool]:
+        """
+        Get all states.
+
+        :returns:   The states
+        :rtype:     List[bool]
+        """
+        return unpack_bits(data=self._data, quantity=self._quantity)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Read response cache
+
+Keep the encoded response PDUs of recently served read requests. Repeated
+reads of unchanged registers are answered with the stored PDU, any change of a
+register invalidates all responses containing it.
+"""
+
+# typing not natively supported on MicroPython
+from .typing import Optional
+
+
+class ResponseCache(object):
+    """
+    Bounded cache of read response PDUs with least recently used eviction
+
+    :param      max_entries:  The maximum number of cached responses
+    :type       max_entries:  int
+    """
+    def __init__(self, max_entries: int = 16) -> None:
+        if max_entries < 1:
+            raise ValueError('Invalid cache size {}'.format(max_entries))
+
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # register type, first and after last address and PDU by request key
+        self._entries = dict()
+        # request keys, least recently used first
+        self._order = list()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self,
+            function_code: int,
+            address: int,
+            quantity: int) -> Optional[bytes]:
+        """
+        Get the cached response PDU of a read request.
+
+        :param      function_code:  The function code
+        :type       function_code:  int
+        :param      address:        The address of the first register
+        :type       address:        int
+        :param      quantity:       The amount of registers
+        :type       quantity:       int
+
+        :returns:   The response PDU, None if not cached
+        :rtype:     Optional[bytes]
+        """
+        key = (function_code, address, quantity)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if self._order[-1] != key:
+            self._order.remove(key)
+            self._order.append(key)
+
+        return entry[3]
+
+    def put(self,
+            function_code: int,
+            reg_type: str,
+            address: int,
+            quantity: int,
+            pdu: bytes) -> None:
+        """
+        Store the response PDU of a read request.
+
+        The least recently used response is dropped if the cache is full.
+
+        :param      function_code:  The function code
+        :type       function_code:  int
+        :param      reg_type:       The register type
+        :type       reg_type:       str
+        :param      address:        The address of the first register
+        :type       address:        int
+        :param      quantity:       The amount of registers
+        :type       quantity:       int
+        :param      pdu:            The response PDU
+        :type       pdu:            bytes
+        """
+        key = (function_code, address, quantity)
+
+        if key in self._entries:
+            self._order.remove(key)
+        elif len(self._entries) >= self.max_entries:
+            self._entries.pop(self._order.pop(0))
+
+        self._entries[key] = (reg_type, address, address + quantity, pdu)
+        self._order.append(key)
+
+    def invalidate(self, reg_type: str, address: int, quantity: int = 1) -> None:
+        """
+        Drop all responses containing any of the specified registers.
+
+        :param      reg_type:  The register type
+        :type       reg_type:  str
+        :param      address:   The address of the first register
+        :type       address:   int
+        :param      quantity:  The amount of registers
+        :type       quantity:  int
+        """
+        end = address + quantity
+        keys = [key for key, entry in self._entries.items()
+                if (entry[0] == reg_type and
+                    entry[1] < end and
+                    address < entry[2])]
+
+        for key in keys:
+            self._entries.pop(key)
+            self._order.remove(key)
+
+    def clear(self) -> None:
+        """Drop all responses"""
+        self._entries = dict()
+        self._order = list()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Typed values spanning several registers
+
+Decode and encode 16, 32 and 64 bit integers, floats and ASCII strings stored
+in consecutive 16 bit registers. The struct formats of a codec are built once
+on creation, a whole block of values is decoded by a single
+``struct.unpack_from`` call.
+
+The word order names the order of the bytes ``A`` (most significant) to
+``D`` (least significant) of a 32 bit value as transmitted:
+
+- ``ABCD`` big endian, most significant register first
+- ``CDAB`` least significant register first, big endian registers
+- ``BADC`` most significant register first, byte swapped registers
+- ``DCBA`` little endian
+
+The same word order applies to the four registers of 64 bit values and to
+all registers of a string.
+"""
+
+# system packages
+import struct
+
+# typing not natively supported on MicroPython
+from .typing import List, Union
+
+ABCD = 'ABCD'
+CDAB = 'CDAB'
+BADC = 'BADC'
+DCBA = 'DCBA'
+
+# struct format character and registers of each data type
+_DATA_TYPES = {
+    'int16': ('h', 1),
+    'uint16': ('H', 1),
+    'int32': ('i', 2),
+    'uint32': ('I', 2),
+    'float32': ('f', 2),
+    'int64': ('q', 4),
+    'uint64': ('Q', 4),
+    'float64': ('d', 4),
+}
+
+
+class RegisterCodec(object):
+    """
+    Codec of a block of typed values
+
+    Floats of type ``float64`` are rounded to single precision on
+    MicroPython ports without double precision support.
+
+    :param      data_type:   The data type, one of ``int16``, ``uint16``,
+                             ``int32``, ``uint32``, ``float32``, ``int64``,
+                             ``uint64``, ``float64`` or ``string``
+    :type       data_type:   str
+    :param      word_order:  The word order, one of ``ABCD``, ``CDAB``,
+                             ``BADC`` or ``DCBA``
+    :type       word_order:  str
+    :param      count:       The amount of values of the block
+    :type       count:       int
+    :param      length:      The amount of registers of each string, two
+                             characters per register
+    :type       length:      int
+
+    :raise      ValueError:  Invalid data type, word order, count or length
+    """
+    def __init__(self,
+                 data_type: str,
+                 word_order: str = ABCD,
+                 count: int = 1,
+                 length: int = 0) -> None:
+        if data_type == 'string':
+            if length < 1:
+                raise ValueError('Invalid string length {}'.format(length))
+            fmt_char = '{}s'.format(2 * length)
+            words = length
+        elif data_type in _DATA_TYPES:
+            fmt_char, words = _DATA_TYPES[data_type]
+        else:
+            raise ValueError('Invalid data type {}'.format(data_type))
+
+        if word_order not in (ABCD, CDAB, BADC, DCBA):
+            raise ValueError('Invalid word order {}'.format(word_order))
+
+        if count < 1:
+            raise ValueError('Invalid count {}'.format(count))
+
+        self.data_type = data_type
+        self.word_order = word_order
+        self.count = count
+
+        #: Amount of registers of each value
+        self.words = words
+        #: Amount of registers of the block
+        self.registers = words * count
+        #: Amount of bytes of the block
+        self.size = 2 * self.registers
+
+        # the registers of each value are reversed before decoding and after
+        # encoding. The bytes of each register are swapped by the format of
+        # numbers, but have to be swapped explicitly for strings
+        if data_type == 'string':
+            self._reverse = words > 1 and word_order in (CDAB, DCBA)
+            self._byte_swap = word_order in (BADC, DCBA)
+            self._fmt = fmt_char * count
+        else:
+            self._reverse = words > 1 and word_order in (CDAB, BADC)
+            self._byte_swap = False
+            self._fmt = '{}{}{}'.format(
+                '<' if word_order in (BADC, DCBA) else '>', count, fmt_char)
+        self._reorder = self._reverse or self._byte_swap
+        self._reg_fmt = '>{}H'.format(self.registers)
+        self._buf = bytearray(self.size)
+
+    def _reorder_words(self, data: Union[bytes, bytearray, memoryview],
+                       offset: int) -> bytearray:
+        """
+        Copy the block into the buffer in the order of the format.
+
+        The registers of each value are reversed and the bytes of each
+        register are swapped as required by the word order.
+
+        :param      data:    The block
+        :type       data:    Union[bytes, bytearray, memoryview]
+        :param      offset:  The offset of the block inside the data
+        :type       offset:  int
+
+        :returns:   The buffer
+        :rtype:     bytearray
+        """
+        buf = self._buf
+        value_size = 2 * self.words
+        high = 1 if self._byte_swap else 0
+
+        for start in range(0, self.size, value_size):
+            end = start + value_size
+            for pos in range(start, end, 2):
+                if self._reverse:
+                    src = offset + end - 2 - (pos - start)
+                else:
+                    src = offset + pos
+                buf[pos] = data[src + high]
+                buf[pos + 1] = data[src + 1 - high]
+
+        return buf
+
+    def decode(self,
+               data: Union[bytes, bytearray, memoryview, List[int]],
+               offset: int = 0) -> list:
+        """
+        Decode a block of values.
+
+        :param      data:    The raw bytes of the registers as received, or
+                             the register values, signed or unsigned
+        :type       data:    Union[bytes, bytearray, memoryview, List[int]]
+        :param      offset:  The offset of the first byte or register
+        :type       offset:  int
+
+        :returns:   The values, strings without trailing NUL characters
+        :rtype:     list
+        """
+        if isinstance(data, (list, tuple)):
+            struct.pack_into(self._reg_fmt,
+                             self._buf,
+                             0,
+                             *[val & 0xFFFF for val in
+                               data[offset:offset + self.registers]])
+            data = bytes(self._buf) if self._reorder else self._buf
+            offset = 0
+
+        if self._reorder:
+            data = self._reorder_words(data=data, offset=offset)
+            offset = 0
+
+        values = struct.unpack_from(self._fmt, data, offset)
+
+        if self.data_type == 'string':
+            return [val.rstrip(b'\x00').decode() for val in values]
+
+        return list(values)
+
+    def to_bytes(self, values: list) -> bytes:
+        """
+        Encode a block of values into the raw bytes of the registers.
+
+        :param      values:  The values, ``count`` of them
+        :type       values:  list
+
+        :returns:   The bytes of the registers as transmitted
+        :rtype:     bytes
+        """
+        if self.data_type == 'string':
+            values = [val.encode() for val in values]
+
+        data = struct.pack(self._fmt, *values)
+
+        if self._reorder:
+            return bytes(self._reorder_words(data=data, offset=0))
+
+        return data
+
+    def encode(self, values: list) -> List[int]:
+        """
+        Encode a block of values into unsigned register values.
+
+        The registers can be written by ``write_multiple_registers`` with
+        ``signed=False`` or be used as value of ``add_hreg`` and ``set_hregs``
+        of a client.
+
+        :param      values:  The values, ``count`` of them
+        :type       values:  list
+
+        :returns:   The register values
+        :rtype:     List[int]
+        """
+        return list(struct.unpack(self._reg_fmt,
+                                  self.to_bytes(values=values)))
@@ -10,65 +10,138 @@
 
 # system packages
 import struct
+import time
 
 # custom packages
 from . import const as Const
 from . import functions
+from .codec import RegisterCodec
 
 # typing not natively supported on MicroPython
-from .typing import List, Optional, Tuple, Union
+from .typing import Any, Callable, List, Optional, Tuple, Union
 
 
 class Request(object):
-    """Deconstruct request data received via TCP or Serial"""
-    def __init__(self, interface, data: bytearray) -> None:
+    """
+    Deconstruct request data received via TCP or Serial
+
+    An interface reuses a single request for each received frame, see
+    :py:meth:`parse`. The ``data`` of a request is a memoryview into the
+    receive buffer of the interface, it is only valid until the next request
+    has been received.
+
+    A request to read and write multiple registers contains the address and
+    quantity of the registers to read as ``register_addr`` and ``quantity``,
+    those of the registers to write as ``write_register_addr`` and
+    ``write_quantity``.
+
+    :param      interface:  The interface receiving the request
+    :type       interface:  Union[Serial, TCPServer]
+    :param      data:       The unit address and PDU of the request, None to
+                            parse a frame later on
+    :type       data:       Optional[Union[bytes, bytearray, memoryview]]
+
+    :raise      ModbusException:  Invalid request
+    """
+    __slots__ = ('_itf',
+                 'unit_addr',
+                 'function',
+                 'register_addr',
+                 'quantity',
+                 'write_register_addr',
+                 'write_quantity',
+                 'data')
+
+    def __init__(self,
+                 interface,
+                 data: Optional[Union[bytes, bytearray, memoryview]] = None
+                 ) -> None:
         self._itf = interface
+        self.unit_addr = 0
+        self.function = 0
+        self.register_addr = 0
+        self.quantity = None
+        self.write_register_addr = None
+        self.write_quantity = None
+        self.data = None
+
+        if data is not None:
+            self.parse(data)
+
+    def parse(self,
+              data: Union[bytes, bytearray, memoryview]) -> 'Request':
+        """
+        Replace the content of this request by a received frame.
+
+        The frame is not copied, the data of write requests refers to it.
+
+        :param      data:  The unit address and PDU of the request
+        :type       data:  Union[bytes, bytearray, memoryview]
+
+        :raise      ModbusException:  Invalid request
+        :returns:   This request
+        :rtype:     Request
+        """
+        view = memoryview(data)
         self.unit_addr = data[0]
         self.function, self.register_addr = struct.unpack_from('>BH', data, 1)
+        self.quantity = None
+        self.write_register_addr = None
+        self.write_quantity = None
+        self.data = None
 
         if self.function in [Const.READ_COILS, Const.READ_DISCRETE_INPUTS]:
             self.quantity = struct.unpack_from('>H', data, 4)[0]
 
             if self.quantity < 0x0001 or self.quantity > 0x07D0:
                 raise ModbusException(self.function, Const.ILLEGAL_DATA_VALUE)
-
-            self.data = None
         elif self.function in [Const.READ_HOLDING_REGISTERS, Const.READ_INPUT_REGISTER]:
             self.quantity = struct.unpack_from('>H', data, 4)[0]
 
             if self.quantity < 0x0001 or self.quantity > 0x007D:
                 raise ModbusException(self.function, Const.ILLEGAL_DATA_VALUE)
-
-            self.data = None
         elif self.function == Const.WRITE_SINGLE_COIL:
-            self.quantity = None
-            self.data = data[4:6]
+            self.data = view[4:6]
 
             # allowed values: 0x0000 or 0xFF00
             if (self.data[0] not in [0x00, 0xFF]) or self.data[1] != 0x00:
                 raise ModbusException(self.function, Const.ILLEGAL_DATA_VALUE)
         elif self.function == Const.WRITE_SINGLE_REGISTER:
-            self.quantity = None
-            self.data = data[4:6]
+            self.data = view[4:6]
             # all values allowed
         elif self.function == Const.WRITE_MULTIPLE_COILS:
             self.quantity = struct.unpack_from('>H', data, 4)[0]
             if self.quantity < 0x0001 or self.quantity > 0x07D0:
                 raise ModbusException(self.function, Const.ILLEGAL_DATA_VALUE)
-            self.data = data[7:]
+            self.data = view[7:]
             if len(self.data) != ((self.quantity - 1) // 8) + 1:
                 raise ModbusException(self.function, Const.ILLEGAL_DATA_VALUE)
         elif self.function == Const.WRITE_MULTIPLE_REGISTERS:
             self.quantity = struct.unpack_from('>H', data, 4)[0]
             if self.quantity < 0x0001 or self.quantity > 0x007B:
                 raise ModbusException(self.function, Const.ILLEGAL_DATA_VALUE)
-            self.data = data[7:]
+            self.data = view[7:]
             if len(self.data) != self.quantity * 2:
                 raise ModbusException(self.function, Const.ILLEGAL_DATA_VALUE)
+        elif self.function == Const.READ_WRITE_MULTIPLE_REGISTERS:
+            # register address and quantity of the read operation, followed
+            # by the address, quantity and values of the write operation
+            (self.quantity,
+             self.write_register_addr,
+             self.write_quantity) = struct.unpack_from('>HHH', data, 4)
+            if self.quantity < 0x0001 or self.quantity > 0x007D:
+                raise ModbusException(self.function, Const.ILLEGAL_DATA_VALUE)
+            if self.write_quantity < 0x0001 or self.write_quantity > 0x0079:
+                raise ModbusException(self.function, Const.ILLEGAL_DATA_VALUE)
+            self.data = view[11:]
+            if (data[10] != self.write_quantity * 2 or
+                    len(self.data) != self.write_quantity * 2):
+                raise ModbusException(self.function, Const.ILLEGAL_DATA_VALUE)
         else:
             # Not implemented functions
-            self.quantity = None
-            self.data = data[4:]
+            self.data = view[4:]
+
+        return self
 
     def send_response(self,
                       values: Optional[list] = None,
@@ -89,6 +162,28 @@ class Request(object):
                                 values,
                                 signed)
 
+    def send_bank_response(self, bank) -> None:
+        """
+        Send a read response encoded directly from a register bank.
+
+        :param      bank:  The bank containing all requested registers
+        :type       bank:  Union[BitBank, RegisterBank]
+        """
+        self._itf.send_bank_response(self.unit_addr,
+                                     self.function,
+                                     self.register_addr,
+                                     self.quantity,
+                                     bank)
+
+    def send_pdu_response(self, modbus_pdu: bytes) -> None:
+        """
+        Send an already encoded response.
+
+        :param      modbus_pdu:  The response Protocol Data Unit
+        :type       modbus_pdu:  bytes
+        """
+        self._itf.send_pdu_response(self.unit_addr, modbus_pdu)
+
     def send_exception(self, exception_code: int) -> None:
         """
         Send an exception response.
@@ -108,11 +203,249 @@ class ModbusException(Exception):
         self.exception_code = exception_code
 
 
+class ResponseTimeoutError(OSError):
+    """No response received from the slave in time"""
+    pass
+
+
+class CRCError(OSError):
+    """Response with an invalid CRC received"""
+    pass
+
+
+class ResponseMismatchError(ValueError):
+    """Response of another request, slave or protocol received"""
+    pass
+
+
+class SlaveExceptionError(ValueError):
+    """
+    Exception response received from the slave
+
+    :param      exception_code:  The exception code
+    :type       exception_code:  int
+    """
+    def __init__(self, exception_code: int) -> None:
+        super().__init__('slave returned exception code: {:d}'.
+                         format(exception_code))
+        self.exception_code = exception_code
+
+
+class RetryPolicy(object):
+    """
+    Retry and deadline policy of the requests of a host
+
+    A failed request is sent again up to ``retries`` times if its error is an
+    instance of one of the ``retry_on`` error classes. Before each further
+    attempt the host waits for the backoff time, doubled on every attempt up
+    to ``max_backoff``. The ``deadline`` limits the total time of a request
+    including all its attempts, the response timeout of each attempt is
+    limited to the remaining time.
+
+    :param      retries:      Maximum number of further attempts
+    :type       retries:      int
+    :param      backoff:      Time to wait before the first retry in
+                              milliseconds
+    :type       backoff:      int
+    :param      max_backoff:  Maximum time to wait before a retry in
+                              milliseconds
+    :type       max_backoff:  int
+    :param      deadline:     Maximum time of a request in milliseconds, None
+                              for the response timeout of the host per attempt
+    :type       deadline:     Optional[int]
+    :param      retry_on:     The retryable error classes, by default
+                              timeouts, CRC errors and responses of other
+                              requests
+    :type       retry_on:     Optional[tuple]
+    """
+    def __init__(self,
+                 retries: int = 0,
+                 backoff: int = 0,
+                 max_backoff: int = 1000,
+                 deadline: Optional[int] = None,
+                 retry_on: Optional[tuple] = None) -> None:
+        if retry_on is None:
+            retry_on = (ResponseTimeoutError,
+                        CRCError,
+                        ResponseMismatchError)
+
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.retry_on = retry_on
+
+        # statistics
+        self.attempts = 0
+        self.retried = 0
+        self.failed = 0
+
+    def delay(self, retry: int) -> int:
+        """
+        Get the time to wait before a retry.
+
+        :param      retry:  The number of the retry, starting at 1
+        :type       retry:  int
+
+        :returns:   The delay in milliseconds
+        :rtype:     int
+        """
+        delay = self.backoff * (1 << min(retry - 1, 15))
+
+        return delay if delay < self.max_backoff else self.max_backoff
+
+    def start_attempt(self, start: int) -> Optional[int]:
+        """
+        Start an attempt of a request.
+
+        :param      start:  The start time of the request in milliseconds
+        :type       start:  int
+
+        :raise      ResponseTimeoutError:  Deadline exceeded
+        :returns:   The response timeout of the attempt in milliseconds,
+                    None without a deadline
+        :rtype:     Optional[int]
+        """
+        timeout = None
+        if self.deadline is not None:
+            timeout = self.deadline - time.ticks_diff(time.ticks_ms(), start)
+            if timeout <= 0:
+                self.failed += 1
+                raise ResponseTimeoutError('request deadline of {} ms '
+                                           'exceeded'.format(self.deadline))
+
+        self.attempts += 1
+
+        return timeout
+
+    def retry_delay(self, error: Exception, retry: int, start: int) -> int:
+        """
+        Get the time to wait before retrying a failed attempt.
+
+        :param      error:  The error of the failed attempt
+        :type       error:  Exception
+        :param      retry:  The number of the retry, starting at 1
+        :type       retry:  int
+        :param      start:  The start time of the request in milliseconds
+        :type       start:  int
+
+        :raise      Exception:  The error, if the request is not retried
+        :returns:   The delay in milliseconds
+        :rtype:     int
+        """
+        if retry > self.retries or not isinstance(error, self.retry_on):
+            self.failed += 1
+            raise error
+
+        delay = self.delay(retry=retry)
+        if (self.deadline is not None and
+                time.ticks_diff(time.ticks_ms(), start) + delay >=
+                self.deadline):
+            # no time left for another attempt
+            self.failed += 1
+            raise error
+
+        self.retried += 1
+
+        return delay
+
+
 class CommonModbusFunctions(object):
     """Common Modbus functions"""
+    # retry and deadline policy, see set_retry_policy
+    _retry_policy = None
+
     def __init__(self):
         pass
 
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """
+        Get the retry policy of all requests.
+
+        :returns:   The policy, None if requests are not retried
+        :rtype:     Optional[RetryPolicy]
+        """
+        return self._retry_policy
+
+    def set_retry_policy(self, policy: Optional[RetryPolicy]) -> None:
+        """
+        Set the retry policy of all requests.
+
+        :param      policy:  The policy, None to send each request once
+        :type       policy:  Optional[RetryPolicy]
+        """
+        self._retry_policy = policy
+
+    def _request(self,
+                 slave_addr: int,
+                 modbus_pdu: bytes,
+                 count: bool) -> bytes:
+        """
+        Send a request and receive the response according to the retry
+        policy.
+
+        :param      slave_addr:  The slave address
+        :type       slave_addr:  int
+        :param      modbus_pdu:  The modbus Protocol Data Unit
+        :type       modbus_pdu:  bytes
+        :param      count:       The count
+        :type       count:       bool
+
+        :raise      ResponseTimeoutError:  Deadline exceeded
+        :returns:   Validated response content
+        :rtype:     bytes
+        """
+        policy = self._retry_policy
+        if policy is None:
+            return self._send_receive(slave_addr=slave_addr,
+                                      modbus_pdu=modbus_pdu,
+                                      count=count)
+
+        start = time.ticks_ms()
+        retry = 0
+
+        while True:
+            timeout = policy.start_attempt(start=start)
+            try:
+                return self._send_receive(slave_addr=slave_addr,
+                                          modbus_pdu=modbus_pdu,
+                                          count=count,
+                                          timeout=timeout)
+            except Exception as e:
+                retry += 1
+                delay = policy.retry_delay(error=e, retry=retry, start=start)
+
+            if delay:
+                time.sleep_ms(delay)
+
+    def _transact(self,
+                  slave_addr: int,
+                  modbus_pdu: bytes,
+                  count: bool,
+                  decode: Callable[[bytes], Any]) -> Any:
+        """
+        Send a request and decode the validated response content.
+
+        Asynchronous hosts return an awaitable of the decoded response
+        instead, see :py:class:`umodbus.async_tcp.AsyncTCP`.
+
+        :param      slave_addr:  The slave address
+        :type       slave_addr:  int
+        :param      modbus_pdu:  The modbus Protocol Data Unit
+        :type       modbus_pdu:  bytes
+        :param      count:       The count
+        :type       count:       bool
+        :param      decode:      Function decoding the response content
+        :type       decode:      Callable[[bytes], Any]
+
+        :returns:   The decoded response
+        :rtype:     Any
+        """
+        return decode(self._request(slave_addr=slave_addr,
+                                    modbus_pdu=modbus_pdu,
+                                    count=count))
+
     def read_coils(self,
                    slave_addr: int,
                    starting_addr: int,
@@ -133,14 +466,14 @@ class CommonModbusFunctions(object):
         modbus_pdu = functions.read_coils(starting_address=starting_addr,
                                           quantity=coil_qty)
 
-        response = self._send_receive(slave_addr=slave_addr,
-                                      modbus_pdu=modbus_pdu,
-                                      count=True)
-
-        status_pdu = functions.bytes_to_bool(byte_list=response,
-                                             bit_qty=coil_qty)
+        def decode(response: bytes) -> List[bool]:
+            return functions.bytes_to_bool(byte_list=response,
+                                           bit_qty=coil_qty)
 
-        return status_pdu
+        return self._transact(slave_addr=slave_addr,
+                              modbus_pdu=modbus_pdu,
+                              count=True,
+                              decode=decode)
 
     def read_discrete_inputs(self,
                              slave_addr: int,
@@ -163,14 +496,14 @@ class CommonModbusFunctions(object):
             starting_address=starting_addr,
             quantity=input_qty)
 
-        response = self._send_receive(slave_addr=slave_addr,
-                                      modbus_pdu=modbus_pdu,
-                                      count=True)
+        def decode(response: bytes) -> List[bool]:
+            return functions.bytes_to_bool(byte_list=response,
+                                           bit_qty=input_qty)
 
-        status_pdu = functions.bytes_to_bool(byte_list=response,
-                                             bit_qty=input_qty)
-
-        return status_pdu
+        return self._transact(slave_addr=slave_addr,
+                              modbus_pdu=modbus_pdu,
+                              count=True,
+                              decode=decode)
 
     def read_holding_registers(self,
                                slave_addr: int,
@@ -196,13 +529,13 @@ class CommonModbusFunctions(object):
             starting_address=starting_addr,
             quantity=register_qty)
 
-        response = self._send_receive(slave_addr=slave_addr,
-                                      modbus_pdu=modbus_pdu,
-                                      count=True)
-
-        register_value = functions.to_short(byte_array=response, signed=signed)
+        def decode(response: bytes) -> Tuple[int, ...]:
+            return functions.to_short(byte_array=response, signed=signed)
 
-        return register_value
+        return self._transact(slave_addr=slave_addr,
+                              modbus_pdu=modbus_pdu,
+                              count=True,
+                              decode=decode)
 
     def read_input_registers(self,
                              slave_addr: int,
@@ -228,13 +561,13 @@ class CommonModbusFunctions(object):
             starting_address=starting_addr,
             quantity=register_qty)
 
-        response = self._send_receive(slave_addr=slave_addr,
-                                      modbus_pdu=modbus_pdu,
-                                      count=True)
+        def decode(response: bytes) -> Tuple[int, ...]:
+            return functions.to_short(byte_array=response, signed=signed)
 
-        register_value = functions.to_short(byte_array=response, signed=signed)
-
-        return register_value
+        return self._transact(slave_addr=slave_addr,
+                              modbus_pdu=modbus_pdu,
+                              count=True,
+                              decode=decode)
 
     def write_single_coil(self,
                           slave_addr: int,
@@ -256,21 +589,21 @@ class CommonModbusFunctions(object):
         modbus_pdu = functions.write_single_coil(output_address=output_address,
                                                  output_value=output_value)
 
-        response = self._send_receive(slave_addr=slave_addr,
-                                      modbus_pdu=modbus_pdu,
-                                      count=False)
+        def decode(response: bytes) -> bool:
+            if response is None:
+                return False
 
-        if response is None:
-            return False
+            return functions.validate_resp_data(
+                data=response,
+                function_code=Const.WRITE_SINGLE_COIL,
+                address=output_address,
+                value=output_value,
+                signed=False)
 
-        operation_status = functions.validate_resp_data(
-            data=response,
-            function_code=Const.WRITE_SINGLE_COIL,
-            address=output_address,
-            value=output_value,
-            signed=False)
-
-        return operation_status
+        return self._transact(slave_addr=slave_addr,
+                              modbus_pdu=modbus_pdu,
+                              count=False,
+                              decode=decode)
 
     def write_single_register(self,
                               slave_addr: int,
@@ -297,21 +630,21 @@ class CommonModbusFunctions(object):
             register_value=register_value,
             signed=signed)
 
-        response = self._send_receive(slave_addr=slave_addr,
-                                      modbus_pdu=modbus_pdu,
-                                      count=False)
-
-        if response is None:
-            return False
+        def decode(response: bytes) -> bool:
+            if response is None:
+                return False
 
-        operation_status = functions.validate_resp_data(
-            data=response,
-            function_code=Const.WRITE_SINGLE_REGISTER,
-            address=register_address,
-            value=register_value,
-            signed=signed)
+            return functions.validate_resp_data(
+                data=response,
+                function_code=Const.WRITE_SINGLE_REGISTER,
+                address=register_address,
+                value=register_value,
+                signed=signed)
 
-        return operation_status
+        return self._transact(slave_addr=slave_addr,
+                              modbus_pdu=modbus_pdu,
+                              count=False,
+                              decode=decode)
 
     def write_multiple_coils(self,
                              slave_addr: int,
@@ -324,7 +657,8 @@ class CommonModbusFunctions(object):
         :type       slave_addr:        int
         :param      starting_address:  The address of the first coil
         :type       starting_address:  int
-        :param      output_values:     The output values
+        :param      output_values:     The output values, a list or a
+                                       :py:class:`umodbus.bits.BitSet`
         :type       output_values:     List[Union[int, bool]]
 
         :returns:   Result of operation
@@ -334,20 +668,20 @@ class CommonModbusFunctions(object):
             starting_address=starting_address,
             value_list=output_values)
 
-        response = self._send_receive(slave_addr=slave_addr,
-                                      modbus_pdu=modbus_pdu,
-                                      count=False)
-
-        if response is None:
-            return False
+        def decode(response: bytes) -> bool:
+            if response is None:
+                return False
 
-        operation_status = functions.validate_resp_data(
-            data=response,
-            function_code=Const.WRITE_MULTIPLE_COILS,
-            address=starting_address,
-            quantity=len(output_values))
+            return functions.validate_resp_data(
+                data=response,
+                function_code=Const.WRITE_MULTIPLE_COILS,
+                address=starting_address,
+                quantity=len(output_values))
 
-        return operation_status
+        return self._transact(slave_addr=slave_addr,
+                              modbus_pdu=modbus_pdu,
+                              count=False,
+                              decode=decode)
 
     def write_multiple_registers(self,
                                  slave_addr: int,
@@ -374,19 +708,132 @@ class CommonModbusFunctions(object):
             register_values=register_values,
             signed=signed)
 
-        response = self._send_receive(slave_addr=slave_addr,
-                                      modbus_pdu=modbus_pdu,
-                                      count=False)
+        def decode(response: bytes) -> bool:
+            if response is None:
+                return False
+
+            return functions.validate_resp_data(
+                data=response,
+                function_code=Const.WRITE_MULTIPLE_REGISTERS,
+                address=starting_address,
+                quantity=len(register_values),
+                signed=signed)
+
+        return self._transact(slave_addr=slave_addr,
+                              modbus_pdu=modbus_pdu,
+                              count=False,
+                              decode=decode)
+
+    def read_write_multiple_registers(self,
+                                      slave_addr: int,
+                                      read_starting_addr: int,
+                                      register_qty: int,
+                                      write_starting_address: int,
+                                      register_values: List[int],
+                                      signed: bool = True) -> Tuple[int, ...]:
+        """
+        Update multiple registers and read registers in one transaction.
+
+        The slave writes the registers before reading them, written registers
+        are read back with their new values.
+
+        :param      slave_addr:              The slave address
+        :type       slave_addr:              int
+        :param      read_starting_addr:      The holding register starting
+                                             address to read
+        :type       read_starting_addr:      int
+        :param      register_qty:            The amount of holding registers
+                                             to read
+        :type       register_qty:            int
+        :param      write_starting_address:  The holding register starting
+                                             address to write
+        :type       write_starting_address:  int
+        :param      register_values:         The register values to write
+        :type       register_values:         List[int]
+        :param      signed:                  Indicates if signed
+        :type       signed:                  bool
+
+        :returns:   State of read holding register as tuple
+        :rtype:     Tuple[int, ...]
+        """
+        modbus_pdu = functions.read_write_multiple_registers(
+            read_starting_address=read_starting_addr,
+            read_quantity=register_qty,
+            write_starting_address=write_starting_address,
+            register_values=register_values,
+            signed=signed)
+
+        def decode(response: bytes) -> Tuple[int, ...]:
+            return functions.to_short(byte_array=response, signed=signed)
 
-        if response is None:
-            return False
+        return self._transact(slave_addr=slave_addr,
+                              modbus_pdu=modbus_pdu,
+                              count=True,
+                              decode=decode)
 
-        operation_status = functions.validate_resp_data(
-            data=response,
-            function_code=Const.WRITE_MULTIPLE_REGISTERS,
-            address=starting_address,
-            quantity=len(register_values),
-            signed=signed
-        )
+    def read_values(self,
+                    slave_addr: int,
+                    starting_addr: int,
+                    codec: RegisterCodec,
+                    reg_type: str = 'HREGS') -> list:
+        """
+        Read a block of typed values of holding or input registers.
 
-        return operation_status
+        :param      slave_addr:     The slave address
+        :type       slave_addr:     int
+        :param      starting_addr:  The starting address
+        :type       starting_addr:  int
+        :param      codec:          The codec of the values
+        :type       codec:          RegisterCodec
+        :param      reg_type:       The register type, HREGS or IREGS
+        :type       reg_type:       str
+
+        :raise      KeyError:  Invalid register type
+        :returns:   The decoded values
+        :rtype:     list
+        """
+        if reg_type == 'HREGS':
+            modbus_pdu = functions.read_holding_registers(
+                starting_address=starting_addr,
+                quantity=codec.registers)
+        elif reg_type == 'IREGS':
+            modbus_pdu = functions.read_input_registers(
+                starting_address=starting_addr,
+                quantity=codec.registers)
+        else:
+            raise KeyError('{} can not be read as typed values'.
+                           format(reg_type))
+
+        def decode(response: bytes) -> list:
+            return codec.decode(data=response)
+
+        return self._transact(slave_addr=slave_addr,
+                              modbus_pdu=modbus_pdu,
+                              count=True,
+                              decode=decode)
+
+    def write_values(self,
+                     slave_addr: int,
+                     starting_address: int,
+                     codec: RegisterCodec,
+                     values: list) -> bool:
+        """
+        Write a block of typed values to holding registers.
+
+        :param      slave_addr:        The slave address
+        :type       slave_addr:        int
+        :param      starting_address:  The starting address
+        :type       starting_address:  int
+        :param      codec:             The codec of the values
+        :type       codec:             RegisterCodec
+        :param      values:            The values
+        :type       values:            list
+
+        :returns:   Result of operation
+        :rtype:     bool
+        """
+        return self.write_multiple_registers(
+            slave_addr=slave_addr,
+            starting_address=starting_address,
+            register_values=codec.encode(values=values),
+            signed=False)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+CRC16 of Modbus RTU frames
+
+The CRC is calculated over a range of any object supporting the buffer
+protocol without creating a copy of it, and can be updated incrementally while
+the bytes of a frame are received. The viper implementation of
+:py:mod:`umodbus.crc_viper` is used where the native code emitter is
+available, a pure Python implementation otherwise.
+
+As the CRC is appended low byte first, the CRC over a complete frame
+including its CRC is zero if the frame is valid.
+"""
+
+# custom packages
+from . import const as Const
+
+# typing not natively supported on MicroPython
+from .typing import Optional
+
+
+def _crc16_py(data, start: int, end: int, crc: int) -> int:
+    """
+    Update a CRC16 with a range of bytes, pure Python implementation.
+
+    :param      data:   The data
+    :type       data:   Union[bytes, bytearray, memoryview]
+    :param      start:  The index of the first byte
+    :type       start:  int
+    :param      end:    The index after the last byte
+    :type       end:    int
+    :param      crc:    The CRC of the previous bytes
+    :type       crc:    int
+
+    :returns:   The updated CRC
+    :rtype:     int
+    """
+    table = Const.CRC16_TABLE
+
+    for idx in range(start, end):
+        crc = (crc >> 8) ^ table[(crc ^ data[idx]) & 0xFF]
+
+    return crc
+
+
+try:
+    from .crc_viper import crc16_viper as _crc16_impl
+
+    # the viper decorator may be a no-op, e.g. on CPython, check the result
+    if _crc16_impl(b'123456789', 0, 9, 0xFFFF) != 0x4B37:
+        raise ValueError('invalid viper CRC16 result')
+    #: Indicates whether the viper implementation is used
+    NATIVE = True
+except Exception:
+    _crc16_impl = _crc16_py
+    NATIVE = False
+
+
+def crc16(data,
+          start: int = 0,
+          end: Optional[int] = None,
+          crc: int = 0xFFFF) -> int:
+    """
+    Calculate the CRC16 of a range of bytes.
+
+    :param      data:   The data
+    :type       data:   Union[bytes, bytearray, memoryview]
+    :param      start:  The index of the first byte
+    :type       start:  int
+    :param      end:    The index after the last byte, default end of data
+    :type       end:    Optional[int]
+    :param      crc:    The CRC of previous bytes, to continue a calculation
+    :type       crc:    int
+
+    :returns:   The CRC
+    :rtype:     int
+    """
+    if end is None:
+        end = len(data)
+
+    return _crc16_impl(data, start, end, crc)
+
+
+class CRC16(object):
+    """Incremental CRC16 calculation of a Modbus RTU frame"""
+    def __init__(self) -> None:
+        self.value = 0xFFFF
+
+    def reset(self) -> None:
+        """Reset the CRC to start a new frame"""
+        self.value = 0xFFFF
+
+    def update(self, data, start: int = 0, end: Optional[int] = None) -> int:
+        """
+        Update the CRC with received bytes.
+
+        :param      data:   The data
+        :type       data:   Union[bytes, bytearray, memoryview]
+        :param      start:  The index of the first byte
+        :type       start:  int
+        :param      end:    The index after the last byte, default end of data
+        :type       end:    Optional[int]
+
+        :returns:   The updated CRC
+        :rtype:     int
+        """
+        self.value = crc16(data, start, end, self.value)
+        return self.value
+
+    def digest(self) -> bytes:
+        """
+        Get the CRC in frame byte order, low byte first.
+
+        :returns:   The CRC
+        :rtype:     bytes
+        """
+        return bytes((self.value & 0xFF, self.value >> 8))
+
+    @property
+    def valid(self) -> bool:
+        """
+        Check a frame of which all bytes, including its CRC, were added.
+
+        :returns:   True if the CRC of the frame is correct
+        :rtype:     bool
+        """
+        return self.value == 0
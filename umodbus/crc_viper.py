@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+CRC16 calculation compiled by the MicroPython viper code emitter
+
+Importing this module fails on ports without native code emitter, use
+:py:func:`umodbus.crc.crc16` which falls back to a pure Python implementation.
+"""
+
+# system packages
+from array import array
+import micropython
+
+# custom packages
+from .const import CRC16_TABLE
+
+# lookup table as buffer, accessible by a viper pointer
+_TABLE = array('H', CRC16_TABLE)
+
+
+@micropython.viper
+def crc16_viper(data, start: int, end: int, crc: int) -> int:
+    """
+    Update a CRC16 with a range of bytes.
+
+    :param      data:   The data, any object supporting the buffer protocol
+    :type       data:   Union[bytes, bytearray, memoryview]
+    :param      start:  The index of the first byte
+    :type       start:  int
+    :param      end:    The index after the last byte
+    :type       end:    int
+    :param      crc:    The CRC of the previous bytes
+    :type       crc:    int
+
+    :returns:   The updated CRC
+    :rtype:     int
+    """
+    buf = ptr8(data)
+    table = ptr16(_TABLE)
+    idx = start
+
+    while idx < end:
+        crc = (crc >> 8) ^ table[(crc ^ buf[idx]) & 0xFF]
+        idx += 1
+
+    return crc
@@ -13,10 +13,51 @@ import struct
 
 # custom packages
 from . import const as Const
+from .bits import BitSet, pack_bits, unpack_bits
 
 # typing not natively supported on MicroPython
 from .typing import List, Optional, Union
 
+# prebuilt struct formats of registers by prefix, quantity and signedness
+_REGISTER_FORMATS = dict()
+# maximum number of formats per prefix
+_MAX_REGISTER_FORMATS = 64
+
+
+def register_format(quantity: int,
+                    signed: bool = True,
+                    prefix: str = '>') -> str:
+    """
+    Get the struct format of a prefix followed by 16 bit registers.
+
+    Formats are built once and reused, up to a limited number of different
+    formats.
+
+    :param      quantity:  The amount of registers
+    :type       quantity:  int
+    :param      signed:    Indicates if signed
+    :type       signed:    bool
+    :param      prefix:    The byte order and formats before the registers
+    :type       prefix:    str
+
+    :returns:   The struct format, e.g. '>BB3h'
+    :rtype:     str
+    """
+    # small integer keys, a key does not allocate memory on MicroPython
+    formats = _REGISTER_FORMATS.get(prefix)
+    if formats is None:
+        formats = _REGISTER_FORMATS[prefix] = dict()
+
+    key = (quantity << 1) | (1 if signed else 0)
+    fmt = formats.get(key)
+
+    if fmt is None:
+        fmt = '{}{}{}'.format(prefix, quantity, 'h' if signed else 'H')
+        if len(formats) < _MAX_REGISTER_FORMATS:
+            formats[key] = fmt
+
+    return fmt
+
 
 def read_coils(starting_address: int, quantity: int) -> bytes:
     """
@@ -143,53 +184,42 @@ def write_single_register(register_address: int,
     :returns:   Packed Modbus message
     :rtype:     bytes
     """
-    fmt = 'h' if signed else 'H'
-
-    return struct.pack('>BH' + fmt,
+    return struct.pack('>BHh' if signed else '>BHH',
                        Const.WRITE_SINGLE_REGISTER,
                        register_address,
                        register_value)
 
 
 def write_multiple_coils(starting_address: int,
-                         value_list: List[Union[int, bool]]) -> bytes:
+                         value_list: Union[List[Union[int, bool]], BitSet]
+                         ) -> bytes:
     """
     Create Modbus message to update multiple coils
 
     :param      starting_address:  The starting address
     :type       starting_address:  int
     :param      value_list:        The list of output values
-    :type       value_list:        List[Union[int, bool]]
+    :type       value_list:        Union[List[Union[int, bool]], BitSet]
 
     :returns:   Packed Modbus message
     :rtype:     bytes
     """
-    if not (1 <= len(value_list) <= 0x07B0):
-        raise ValueError('Invalid quantity of outputs')
-
-    sectioned_list = [value_list[i:i + 8] for i in range(0, len(value_list), 8)]    # noqa: E501
+    quantity = len(value_list)
 
-    output_value = []
-    for index, byte in enumerate(sectioned_list):
-        # see https://github.com/brainelectronics/micropython-modbus/issues/22
-        # output = sum(v << i for i, v in enumerate(byte))
-        output = 0
-        for bit in byte:
-            output = (output << 1) | bit
-        output_value.append(output)
+    if not (1 <= quantity <= 0x07B0):
+        raise ValueError('Invalid quantity of outputs')
 
-    fmt = 'B' * len(output_value)
-    quantity = len(value_list)
-    byte_count = quantity // 8
-    if quantity % 8:
-        byte_count += 1
+    # see https://github.com/brainelectronics/micropython-modbus/issues/22
+    if isinstance(value_list, BitSet):
+        output_value = value_list.data
+    else:
+        output_value = pack_bits(values=value_list)
 
-    return struct.pack('>BHHB' + fmt,
+    return struct.pack('>BHHB',
                        Const.WRITE_MULTIPLE_COILS,
                        starting_address,
                        quantity,
-                       byte_count,
-                       *output_value)
+                       len(output_value)) + output_value
 
 
 def write_multiple_registers(starting_address: int,
@@ -212,14 +242,58 @@ def write_multiple_registers(starting_address: int,
         raise ValueError('Invalid number of registers')
 
     quantity = len(register_values)
-    byte_count = quantity * 2
-    fmt = ('h' if signed else 'H') * quantity
 
-    return struct.pack('>BHHB' + fmt,
+    return struct.pack(register_format(quantity=quantity,
+                                       signed=signed,
+                                       prefix='>BHHB'),
                        Const.WRITE_MULTIPLE_REGISTERS,
                        starting_address,
                        quantity,
-                       byte_count,
+                       quantity * 2,
+                       *register_values)
+
+
+def read_write_multiple_registers(read_starting_address: int,
+                                  read_quantity: int,
+                                  write_starting_address: int,
+                                  register_values: List[int],
+                                  signed: bool = True) -> bytes:
+    """
+    Create Modbus message to write and read multiple registers
+
+    The registers are written before they are read by the slave.
+
+    :param      read_starting_address:   The starting address to read
+    :type       read_starting_address:   int
+    :param      read_quantity:           Quantity of registers to read
+    :type       read_quantity:           int
+    :param      write_starting_address:  The starting address to write
+    :type       write_starting_address:  int
+    :param      register_values:         The list of register values to write
+    :type       register_values:         List[int]
+    :param      signed:                  Flag whether data is signed or not
+    :type       signed:                  bool
+
+    :returns:   Packed Modbus message
+    :rtype:     bytes
+    """
+    if not (1 <= read_quantity <= 125):
+        raise ValueError('Invalid number of registers to read')
+
+    if not (1 <= len(register_values) <= 121):
+        raise ValueError('Invalid number of registers to write')
+
+    quantity = len(register_values)
+
+    return struct.pack(register_format(quantity=quantity,
+                                       signed=signed,
+                                       prefix='>BHHHHB'),
+                       Const.READ_WRITE_MULTIPLE_REGISTERS,
+                       read_starting_address,
+                       read_quantity,
+                       write_starting_address,
+                       quantity,
+                       quantity * 2,
                        *register_values)
 
 
@@ -248,7 +322,7 @@ def validate_resp_data(data: bytes,
     :returns:   True if valid, False otherwise
     :rtype:     bool
     """
-    fmt = '>H' + ('h' if signed else 'H')
+    fmt = '>Hh' if signed else '>HH'
 
     if function_code in [Const.WRITE_SINGLE_COIL, Const.WRITE_SINGLE_REGISTER]:
         resp_addr, resp_value = struct.unpack(fmt, data)
@@ -301,39 +375,32 @@ def response(function_code: int,
     :rtype:     bytes
     """
     if function_code in [Const.READ_COILS, Const.READ_DISCRETE_INPUTS]:
-        sectioned_list = [value_list[i:i + 8] for i in range(0, len(value_list), 8)]    # noqa: E501
-
-        output_value = []
-        for index, byte in enumerate(sectioned_list):
-            # see https://github.com/brainelectronics/micropython-modbus/issues/22
-            # output = sum(v << i for i, v in enumerate(byte))
-            # see https://github.com/brainelectronics/micropython-modbus/issues/38
-            output = 0
-            for bit in byte:
-                output = (output << 1) | bit
-            output_value.append(output)
-
-        fmt = 'B' * len(output_value)
-        return struct.pack('>BB' + fmt,
+        # see https://github.com/brainelectronics/micropython-modbus/issues/22
+        # see https://github.com/brainelectronics/micropython-modbus/issues/38
+        output_value = pack_bits(values=value_list)
+
+        return struct.pack('>BB',
                            function_code,
-                           ((len(value_list) - 1) // 8) + 1,
-                           *output_value)
+                           len(output_value)) + output_value
 
     elif function_code in [Const.READ_HOLDING_REGISTERS,
-                           Const.READ_INPUT_REGISTER]:
+                           Const.READ_INPUT_REGISTER,
+                           Const.READ_WRITE_MULTIPLE_REGISTERS]:
         quantity = len(value_list)
 
         if not (0x0001 <= quantity <= 0x007D):
             raise ValueError('invalid number of registers')
 
         if signed is True or signed is False:
-            fmt = ('h' if signed else 'H') * quantity
+            fmt = register_format(quantity=quantity,
+                                  signed=signed,
+                                  prefix='>BB')
         else:
-            fmt = ''
+            fmt = '>BB'
             for s in signed:
                 fmt += 'h' if s else 'H'
 
-        return struct.pack('>BB' + fmt,
+        return struct.pack(fmt,
                            function_code,
                            quantity * 2,
                            *value_list)
@@ -380,22 +447,8 @@ def bytes_to_bool(byte_list: bytes, bit_qty: Optional[int] = 1) -> List[bool]:
     :returns:   Boolean representation
     :rtype:     List[bool]
     """
-    bool_list = []
-
-    for index, byte in enumerate(byte_list):
-        this_qty = bit_qty
-
-        if this_qty >= 8:
-            this_qty = 8
-
-        # evil hack for missing keyword support in MicroPython format()
-        fmt = '{:0' + str(this_qty) + 'b}'
-
-        bool_list.extend([bool(int(x)) for x in fmt.format(byte)])
-
-        bit_qty -= 8
-
-    return bool_list
+    return unpack_bits(data=byte_list,
+                       quantity=min(bit_qty, 8 * len(byte_list)))
 
 
 def to_short(byte_array: bytes, signed: bool = True) -> bytes:
@@ -410,10 +463,9 @@ def to_short(byte_array: bytes, signed: bool = True) -> bytes:
     :returns:   Integer representation
     :rtype:     bytes
     """
-    response_quantity = int(len(byte_array) / 2)
-    fmt = '>' + (('h' if signed else 'H') * response_quantity)
-
-    return struct.unpack(fmt, byte_array)
+    return struct.unpack(register_format(quantity=len(byte_array) >> 1,
+                                         signed=signed),
+                         byte_array)
 
 
 def float_to_bin(num: float) -> bin:
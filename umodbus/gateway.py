@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Modbus TCP to RTU gateway
+
+Forward the requests of Modbus TCP hosts to slaves on a serial bus. Responses
+of read requests are cached for a maximum age, so several TCP hosts reading
+the same registers are answered without waiting for the serial bus. Write
+requests are always forwarded and drop the cached responses of the written
+registers.
+"""
+
+# system packages
+import struct
+import time
+
+# custom packages
+from . import const as Const
+
+# typing not natively supported on MicroPython
+from .typing import Optional
+
+_READ_FUNCTIONS = (Const.READ_COILS,
+                   Const.READ_DISCRETE_INPUTS,
+                   Const.READ_HOLDING_REGISTERS,
+                   Const.READ_INPUT_REGISTER)
+
+# read function code of the registers changed by each write function code
+_WRITE_FUNCTIONS = {
+    Const.WRITE_SINGLE_COIL: Const.READ_COILS,
+    Const.WRITE_MULTIPLE_COILS: Const.READ_COILS,
+    Const.WRITE_SINGLE_REGISTER: Const.READ_HOLDING_REGISTERS,
+    Const.WRITE_MULTIPLE_REGISTERS: Const.READ_HOLDING_REGISTERS,
+    Const.READ_WRITE_MULTIPLE_REGISTERS: Const.READ_HOLDING_REGISTERS,
+}
+
+
+class ModbusGateway(object):
+    """
+    Gateway between Modbus TCP hosts and RTU slaves
+
+    :param      server:       The bound TCP server receiving the requests
+    :type       server:       TCPServer
+    :param      host:         The RTU host forwarding the requests
+    :type       host:         Serial
+    :param      max_age:      Maximum age of a cached response in
+                              milliseconds, 0 to disable the cache
+    :type       max_age:      int
+    :param      max_entries:  Maximum number of cached responses
+    :type       max_entries:  int
+    :param      unit_map:     RTU slave address of each TCP unit identifier,
+                              requests of other unit identifiers are answered
+                              with ``GATEWAY_PATH_UNAVAILABLE``. By default
+                              the unit identifier is used as slave address
+    :type       unit_map:     Optional[dict]
+    """
+    def __init__(self,
+                 server,
+                 host,
+                 max_age: int = 1000,
+                 max_entries: int = 32,
+                 unit_map: Optional[dict] = None) -> None:
+        self._server = server
+        self._host = host
+        self._max_age = max_age
+        self._max_entries = max_entries
+        self._unit_map = unit_map
+
+        # receive time and response of each request by slave address,
+        # function code, address and quantity
+        self._cache = dict()
+
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def process(self) -> bool:
+        """
+        Forward the next request of a TCP host, if any.
+
+        :returns:   Result of processing, True if a request was answered
+        :rtype:     bool
+        """
+        request = self._server.get_request(unit_addr_list=None, timeout=0)
+        if request is None:
+            return False
+
+        self._forward(request=request)
+
+        return True
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses"""
+        self._cache = dict()
+
+    def _forward(self, request) -> None:
+        """
+        Answer a request by the cache or by the response of the RTU slave.
+
+        :param      request:  The request
+        :type       request:  Request
+        """
+        slave_addr = request.unit_addr
+        if self._unit_map is not None:
+            slave_addr = self._unit_map.get(slave_addr)
+            if slave_addr is None:
+                request.send_exception(Const.GATEWAY_PATH_UNAVAILABLE)
+                return
+
+        modbus_pdu = self._encode_request(request=request)
+        if modbus_pdu is None:
+            request.send_exception(Const.ILLEGAL_FUNCTION)
+            return
+
+        function_code = request.function
+        key = None
+
+        if function_code in _READ_FUNCTIONS and self._max_age > 0:
+            key = (slave_addr,
+                   function_code,
+                   request.register_addr,
+                   request.quantity)
+            entry = self._cache.get(key)
+
+            if (entry is not None and
+                    time.ticks_diff(time.ticks_ms(), entry[0]) <
+                    self._max_age):
+                self.hits += 1
+                request.send_pdu_response(entry[1])
+                return
+
+            self.misses += 1
+
+        try:
+            response = self._host.send_receive_pdu(slave_addr=slave_addr,
+                                                   modbus_pdu=modbus_pdu)
+        except (OSError, ValueError):
+            response = None
+        finally:
+            # the slave might have processed the write even without a valid
+            # response
+            if function_code == Const.READ_WRITE_MULTIPLE_REGISTERS:
+                self._invalidate(slave_addr=slave_addr,
+                                 function_code=_WRITE_FUNCTIONS[function_code],
+                                 address=request.write_register_addr,
+                                 quantity=request.write_quantity)
+            elif function_code in _WRITE_FUNCTIONS:
+                self._invalidate(slave_addr=slave_addr,
+                                 function_code=_WRITE_FUNCTIONS[function_code],
+                                 address=request.register_addr,
+                                 quantity=request.quantity or 1)
+
+        if response is None:
+            self.errors += 1
+            request.send_exception(Const.DEVICE_FAILED_TO_RESPOND)
+            return
+
+        if key is not None and response[0] == function_code:
+            self._put(key=key, response=response)
+
+        request.send_pdu_response(response)
+
+    @staticmethod
+    def _encode_request(request) -> Optional[bytes]:
+        """
+        Encode the PDU of a request to be forwarded.
+
+        :param      request:  The request
+        :type       request:  Request
+
+        :returns:   The request Protocol Data Unit, None if the function is
+                    not supported
+        :rtype:     Optional[bytes]
+        """
+        function_code = request.function
+
+        if function_code in _READ_FUNCTIONS:
+            return struct.pack('>BHH',
+                               function_code,
+                               request.register_addr,
+                               request.quantity)
+        elif function_code in (Const.WRITE_SINGLE_COIL,
+                               Const.WRITE_SINGLE_REGISTER):
+            return struct.pack('>BH',
+                               function_code,
+                               request.register_addr) + bytes(request.data)
+        elif function_code in (Const.WRITE_MULTIPLE_COILS,
+                               Const.WRITE_MULTIPLE_REGISTERS):
+            return struct.pack('>BHHB',
+                               function_code,
+                               request.register_addr,
+                               request.quantity,
+                               len(request.data)) + bytes(request.data)
+        elif function_code == Const.READ_WRITE_MULTIPLE_REGISTERS:
+            return struct.pack('>BHHHHB',
+                               function_code,
+                               request.register_addr,
+                               request.quantity,
+                               request.write_register_addr,
+                               request.write_quantity,
+                               len(request.data)) + bytes(request.data)
+
+        return None
+
+    def _put(self, key: tuple, response: bytes) -> None:
+        """
+        Cache a response, dropping expired or the oldest responses if full.
+
+        :param      key:       The slave address, function code, address and
+                               quantity of the request
+        :type       key:       tuple
+        :param      response:  The response Protocol Data Unit
+        :type       response:  bytes
+        """
+        cache = self._cache
+        now = time.ticks_ms()
+
+        if key not in cache and len(cache) >= self._max_entries:
+            oldest = None
+            for other, entry in list(cache.items()):
+                age = time.ticks_diff(now, entry[0])
+                if age >= self._max_age:
+                    cache.pop(other)
+                elif oldest is None or age > oldest[1]:
+                    oldest = (other, age)
+
+            if len(cache) >= self._max_entries:
+                cache.pop(oldest[0])
+
+        cache[key] = (now, response)
+
+    def _invalidate(self,
+                    slave_addr: int,
+                    function_code: int,
+                    address: int,
+                    quantity: int) -> None:
+        """
+        Drop the cached responses containing any of the written registers.
+
+        :param      slave_addr:     The slave address
+        :type       slave_addr:     int
+        :param      function_code:  The read function code of the registers
+        :type       function_code:  int
+        :param      address:        The first written address
+        :type       address:        int
+        :param      quantity:       The amount of written registers
+        :type       quantity:       int
+        """
+        end = address + quantity
+
+        for key in [k for k in self._cache
+                    if k[0] == slave_addr and
+                    k[1] == function_code and
+                    k[2] < end and
+                    address < k[2] + k[3]]:
+            self._cache.pop(key)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Interval index of register addresses
+
+Keep the address ranges of all registers of one register type as sorted list
+of non overlapping intervals. Any address is resolved by a binary search, a
+range of addresses is split into the intervals covering it, gaps of unmapped
+addresses are detected without checking every single address.
+"""
+
+# typing not natively supported on MicroPython
+from .typing import Any, List, Optional, Tuple
+
+
+class IntervalIndex(object):
+    """
+    Sorted index of address intervals
+
+    Each interval ``[start, end)`` has an owner, e.g. a register bank, or
+    None for registers stored one by one. Adjacent or overlapping intervals
+    without owner are merged into one interval.
+    """
+    def __init__(self) -> None:
+        self._starts = list()
+        self._ends = list()
+        self._owners = list()
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _bisect(self, address: int) -> int:
+        """
+        Get the position of the last interval starting at or before address.
+
+        :param      address:  The address
+        :type       address:  int
+
+        :returns:   The position, -1 if all intervals start after the address
+        :rtype:     int
+        """
+        starts = self._starts
+        lo = 0
+        hi = len(starts)
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if starts[mid] <= address:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return lo - 1
+
+    def find(self, address: int) -> int:
+        """
+        Get the position of the interval containing an address.
+
+        :param      address:  The address
+        :type       address:  int
+
+        :returns:   The position, -1 if the address is not mapped
+        :rtype:     int
+        """
+        pos = self._bisect(address)
+
+        if pos >= 0 and address < self._ends[pos]:
+            return pos
+
+        return -1
+
+    def owner(self, address: int, quantity: int = 1) -> Any:
+        """
+        Get the owner of the interval containing all addresses of a range.
+
+        :param      address:   The first address
+        :type       address:   int
+        :param      quantity:  The amount of addresses
+        :type       quantity:  int
+
+        :returns:   The owner, None if the range is not part of a single
+                    interval or the interval has no owner
+        :rtype:     Any
+        """
+        pos = self.find(address)
+
+        if pos >= 0 and address + quantity <= self._ends[pos]:
+            return self._owners[pos]
+
+        return None
+
+    def segments(self,
+                 address: int,
+                 quantity: int) -> Optional[List[Tuple[int, int, Any]]]:
+        """
+        Split a range of addresses into the intervals covering it.
+
+        :param      address:   The first address
+        :type       address:   int
+        :param      quantity:  The amount of addresses
+        :type       quantity:  int
+
+        :returns:   Start, end and owner of each part of the range, None if
+                    any address of the range is not mapped
+        :rtype:     Optional[List[Tuple[int, int, Any]]]
+        """
+        pos = self.find(address)
+        if pos < 0:
+            return None
+
+        end = address + quantity
+        segments = list()
+
+        while True:
+            seg_end = self._ends[pos]
+            if seg_end > end:
+                seg_end = end
+            segments.append((address, seg_end, self._owners[pos]))
+
+            if seg_end >= end:
+                return segments
+
+            pos += 1
+            if pos >= len(self._starts) or self._starts[pos] != seg_end:
+                # gap of unmapped addresses
+                return None
+
+            address = seg_end
+
+    def add(self, start: int, end: int, owner: Any = None) -> None:
+        """
+        Add an interval.
+
+        Intervals with an owner must not overlap with any other interval.
+
+        :param      start:  The first address
+        :type       start:  int
+        :param      end:    The address after the last one
+        :type       end:    int
+        :param      owner:  The owner
+        :type       owner:  Any
+        """
+        pos = self._bisect(start) + 1
+
+        if owner is None:
+            # merge with the previous and following intervals without owner
+            if (pos > 0 and self._owners[pos - 1] is None and
+                    self._ends[pos - 1] >= start):
+                pos -= 1
+                start = self._starts[pos]
+                if self._ends[pos] > end:
+                    end = self._ends[pos]
+                self._remove_at(pos)
+
+            while (pos < len(self._starts) and
+                   self._owners[pos] is None and
+                   self._starts[pos] <= end):
+                if self._ends[pos] > end:
+                    end = self._ends[pos]
+                self._remove_at(pos)
+
+        self._starts.insert(pos, start)
+        self._ends.insert(pos, end)
+        self._owners.insert(pos, owner)
+
+    def remove(self, start: int, end: int) -> None:
+        """
+        Remove a range of addresses, splitting intervals if required.
+
+        :param      start:  The first address
+        :type       start:  int
+        :param      end:    The address after the last one
+        :type       end:    int
+        """
+        pos = self._bisect(start)
+        if pos < 0 or self._ends[pos] <= start:
+            pos += 1
+
+        while pos < len(self._starts) and self._starts[pos] < end:
+            seg_start = self._starts[pos]
+            seg_end = self._ends[pos]
+            owner = self._owners[pos]
+            self._remove_at(pos)
+
+            if seg_start < start:
+                self._starts.insert(pos, seg_start)
+                self._ends.insert(pos, start)
+                self._owners.insert(pos, owner)
+                pos += 1
+
+            if seg_end > end:
+                self._starts.insert(pos, end)
+                self._ends.insert(pos, seg_end)
+                self._owners.insert(pos, owner)
+                pos += 1
+
+    def _remove_at(self, pos: int) -> None:
+        """
+        Remove the interval at a position.
+
+        :param      pos:  The position
+        :type       pos:  int
+        """
+        self._starts.pop(pos)
+        self._ends.pop(pos)
+        self._owners.pop(pos)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Change journal of register values
+
+Record changes of register values in a ring buffer of fixed capacity. Each
+change gets a sequence number, consumers ask for all changes since the last
+sequence number they have seen. Changes overwritten before being fetched are
+reported as lost instead of growing the memory usage.
+"""
+
+# system packages
+from array import array
+import time
+
+# typing not natively supported on MicroPython
+from .typing import List, Optional, Tuple, Union
+
+#: Change made by the application, e.g. by ``set_hreg``
+SOURCE_LOCAL = 0
+#: Change made by a write request of a host
+SOURCE_REMOTE = 1
+
+_REG_TYPES = ('COILS', 'HREGS', 'IREGS', 'ISTS')
+_BIT_TYPES = (0, 3)
+
+
+class ChangeJournal(object):
+    """
+    Ring buffer of register changes
+
+    All entries are stored in preallocated arrays, the memory usage does not
+    depend on the number of changes.
+
+    :param      capacity:  The maximum number of stored changes
+    :type       capacity:  int
+
+    :raise      ValueError:  Capacity is less than one
+    """
+    def __init__(self, capacity: int = 64) -> None:
+        if capacity < 1:
+            raise ValueError('Invalid journal capacity {}'.format(capacity))
+
+        self._capacity = capacity
+        self._reg_types = bytearray(capacity)
+        self._addresses = array('H', bytearray(2 * capacity))
+        # signed, register values are recorded as returned by the registers
+        self._values = array('l', [0] * capacity)
+        self._ticks = array('L', [0] * capacity)
+        self._sources = bytearray(capacity)
+
+        # sequence number of the next change
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return min(self._sequence, self._capacity)
+
+    @property
+    def capacity(self) -> int:
+        """
+        Get the maximum number of stored changes.
+
+        :returns:   The capacity
+        :rtype:     int
+        """
+        return self._capacity
+
+    @property
+    def sequence(self) -> int:
+        """
+        Get the sequence number of the next change.
+
+        :returns:   The sequence number
+        :rtype:     int
+        """
+        return self._sequence
+
+    @property
+    def oldest(self) -> int:
+        """
+        Get the sequence number of the oldest stored change.
+
+        :returns:   The sequence number
+        :rtype:     int
+        """
+        return self._sequence - len(self)
+
+    def record(self,
+               reg_type: str,
+               address: Union[int, List[int]],
+               value: Union[bool, int, List[bool], List[int]],
+               source: int = SOURCE_LOCAL,
+               ticks: Optional[int] = None) -> int:
+        """
+        Record the change of one or several registers.
+
+        :param      reg_type:  The register type
+        :type       reg_type:  str
+        :param      address:   The address (ID) of the first of consecutive
+                               registers or the address of each value
+        :type       address:   Union[int, List[int]]
+        :param      value:     The new value(s)
+        :type       value:     Union[bool, int, List[bool], List[int]]
+        :param      source:    The source of the change
+        :type       source:    int
+        :param      ticks:     Time of the change in milliseconds, default now
+        :type       ticks:     Optional[int]
+
+        :raise      ValueError:  Invalid register type
+        :returns:   Sequence number of the (last) recorded change
+        :rtype:     int
+        """
+        type_idx = _REG_TYPES.index(reg_type)
+
+        if ticks is None:
+            ticks = time.ticks_ms()
+
+        if not isinstance(value, (list, tuple)):
+            value = (value, )
+
+        if isinstance(address, (list, tuple)):
+            addresses = address
+        else:
+            addresses = range(address, address + len(value))
+
+        capacity = self._capacity
+        slot = self._sequence % capacity
+
+        for this_addr, val in zip(addresses, value):
+            self._reg_types[slot] = type_idx
+            self._addresses[slot] = this_addr
+            self._values[slot] = int(val)
+            self._ticks[slot] = ticks
+            self._sources[slot] = source
+
+            slot += 1
+            if slot == capacity:
+                slot = 0
+
+        self._sequence += len(value)
+
+        return self._sequence - 1
+
+    def since(self, sequence: int) -> Tuple[List[tuple], int]:
+        """
+        Get all changes since a sequence number.
+
+        Each change is a tuple of sequence number, register type, address,
+        value, time in milliseconds and source. Fetch the next changes with
+        the sequence number following the last returned one, or with
+        :py:attr:`sequence`.
+
+        :param      sequence:  The sequence number of the first change
+        :type       sequence:  int
+
+        :returns:   The stored changes and the number of lost changes, which
+                    have been overwritten already
+        :rtype:     Tuple[List[tuple], int]
+        """
+        oldest = self.oldest
+        lost = 0
+
+        if sequence < oldest:
+            lost = oldest - sequence
+            sequence = oldest
+
+        changes = list()
+        for seq in range(sequence, self._sequence):
+            slot = seq % self._capacity
+            type_idx = self._reg_types[slot]
+            value = self._values[slot]
+
+            if type_idx in _BIT_TYPES:
+                value = bool(value)
+
+            changes.append((seq,
+                            _REG_TYPES[type_idx],
+                            self._addresses[slot],
+                            value,
+                            self._ticks[slot],
+                            self._sources[slot]))
+
+        return changes, lost
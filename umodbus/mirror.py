@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Mirror of remote slave registers
+
+Poll ranges of registers of remote slaves periodically into register banks of
+a local :py:class:`umodbus.modbus.Modbus` register store. The application and
+hosts of the local client read the latest values from memory instead of
+waiting for the remote slave. Ranges of the same slave, register type and
+period are read by combined requests.
+"""
+
+# system packages
+import time
+
+# custom packages
+from .planner import plan_reads, READ_LIMITS
+from .scheduler import PollJob, PollScheduler
+
+# typing not natively supported on MicroPython
+from .typing import List, Optional
+
+
+class MirrorRange(object):
+    """
+    Range of remote registers mirrored into the local register store
+
+    :param      slave_addr:     The slave address
+    :type       slave_addr:     int
+    :param      reg_type:       The register type
+    :type       reg_type:       str
+    :param      address:        The first remote address
+    :type       address:        int
+    :param      quantity:       The quantity of registers
+    :type       quantity:       int
+    :param      period:         The poll period in milliseconds
+    :type       period:         int
+    :param      local_address:  The first local address
+    :type       local_address:  int
+    """
+    def __init__(self,
+                 slave_addr: int,
+                 reg_type: str,
+                 address: int,
+                 quantity: int,
+                 period: int,
+                 local_address: int) -> None:
+        self.slave_addr = slave_addr
+        self.reg_type = reg_type
+        self.address = address
+        self.quantity = quantity
+        self.period = period
+        self.local_address = local_address
+
+        # time of the latest update, None until the first successful poll
+        self.updated = None
+        self._job = None
+
+    @property
+    def age(self) -> Optional[int]:
+        """
+        Get the time since the latest update.
+
+        :returns:   The age in milliseconds, None if never updated
+        :rtype:     Optional[int]
+        """
+        if self.updated is None:
+            return None
+
+        return time.ticks_diff(time.ticks_ms(), self.updated)
+
+    @property
+    def last_error(self) -> Optional[Exception]:
+        """
+        Get the error of the latest poll.
+
+        :returns:   The error, None if the latest poll succeeded
+        :rtype:     Optional[Exception]
+        """
+        if self._job is None:
+            return None
+
+        return self._job.last_error
+
+    def is_stale(self, max_age: int) -> bool:
+        """
+        Check if the values are older than a maximum age.
+
+        :param      max_age:  The maximum age in milliseconds
+        :type       max_age:  int
+
+        :returns:   True if never updated or older than the maximum age
+        :rtype:     bool
+        """
+        age = self.age
+
+        return age is None or age > max_age
+
+
+class ModbusMirror(object):
+    """
+    Mirror of remote slave registers in a local register store
+
+    :param      host:       The Modbus host, TCP or Serial
+    :type       host:       CommonModbusFunctions
+    :param      client:     The local register store, e.g. a ModbusRTU or
+                            ModbusTCP client
+    :type       client:     Modbus
+    :param      max_gap:    Maximum amount of not mirrored registers read to
+                            combine two ranges into one request
+    :type       max_gap:    int
+    :param      scheduler:  The scheduler polling the ranges, shared with
+                            other jobs of the same host. A new one is used by
+                            default
+    :type       scheduler:  Optional[PollScheduler]
+    """
+    def __init__(self,
+                 host,
+                 client,
+                 max_gap: int = 0,
+                 scheduler: Optional[PollScheduler] = None) -> None:
+        if scheduler is None:
+            scheduler = PollScheduler(host=host)
+
+        self._client = client
+        self._max_gap = max_gap
+        self._scheduler = scheduler
+        self._ranges = list()
+
+        # mirrored ranges read by each poll job
+        self._jobs = dict()
+        self._planned = True
+
+        self._setters = {
+            'COILS': client.set_coils,
+            'HREGS': client.set_hregs,
+            'ISTS': client.set_ists,
+            'IREGS': client.set_iregs,
+        }
+
+    @property
+    def ranges(self) -> List[MirrorRange]:
+        """
+        Get the mirrored ranges.
+
+        :returns:   The ranges
+        :rtype:     List[MirrorRange]
+        """
+        return self._ranges
+
+    @property
+    def scheduler(self) -> PollScheduler:
+        """
+        Get the scheduler polling the ranges.
+
+        :returns:   The scheduler
+        :rtype:     PollScheduler
+        """
+        return self._scheduler
+
+    def add_range(self,
+                  slave_addr: int,
+                  reg_type: str,
+                  address: int,
+                  quantity: int,
+                  period: int,
+                  local_address: Optional[int] = None) -> MirrorRange:
+        """
+        Add a range of remote registers to the mirror.
+
+        A register bank of the range is added to the local register store,
+        its registers keep their default value until the first poll.
+
+        :param      slave_addr:     The slave address
+        :type       slave_addr:     int
+        :param      reg_type:       The register type
+        :type       reg_type:       str
+        :param      address:        The first remote address
+        :type       address:        int
+        :param      quantity:       The quantity of registers
+        :type       quantity:       int
+        :param      period:         The poll period in milliseconds
+        :type       period:         int
+        :param      local_address:  The first local address, default the
+                                    remote address
+        :type       local_address:  Optional[int]
+
+        :raise      KeyError:    Invalid register type
+        :raise      ValueError:  Invalid quantity or local range overlaps with
+                                 an existing bank
+        :returns:   The range
+        :rtype:     MirrorRange
+        """
+        if not (1 <= quantity <= READ_LIMITS[reg_type]):
+            raise ValueError('Invalid quantity {} of {}'.
+                             format(quantity, reg_type))
+
+        if local_address is None:
+            local_address = address
+
+        self._client.add_bank(reg_type=reg_type,
+                              address=local_address,
+                              quantity=quantity)
+
+        mirror_range = MirrorRange(slave_addr=slave_addr,
+                                   reg_type=reg_type,
+                                   address=address,
+                                   quantity=quantity,
+                                   period=period,
+                                   local_address=local_address)
+        self._ranges.append(mirror_range)
+        self._planned = False
+
+        return mirror_range
+
+    def remove_range(self, mirror_range: MirrorRange) -> bool:
+        """
+        Remove a range and its register bank of the local register store.
+
+        :param      mirror_range:  The range
+        :type       mirror_range:  MirrorRange
+
+        :returns:   Result of operation
+        :rtype:     bool
+        """
+        if mirror_range not in self._ranges:
+            return False
+
+        self._ranges.remove(mirror_range)
+        self._client.remove_bank(reg_type=mirror_range.reg_type,
+                                 address=mirror_range.local_address)
+        self._planned = False
+
+        return True
+
+    def _plan(self) -> None:
+        """Replace the poll jobs by combined reads of all ranges"""
+        for job in self._jobs:
+            self._scheduler.remove_job(job)
+        self._jobs = dict()
+
+        periods = list()
+        for mirror_range in self._ranges:
+            if mirror_range.period not in periods:
+                periods.append(mirror_range.period)
+
+        for period in periods:
+            ranges = [r for r in self._ranges if r.period == period]
+            blocks = plan_reads(points=[(r.slave_addr,
+                                         r.reg_type,
+                                         r.address,
+                                         r.quantity) for r in ranges],
+                                max_gap=self._max_gap)
+
+            for block in blocks:
+                job = self._scheduler.add_job(slave_addr=block.slave_addr,
+                                              reg_type=block.reg_type,
+                                              address=block.address,
+                                              quantity=block.quantity,
+                                              period=period,
+                                              callback=self._update,
+                                              signed=False)
+                self._jobs[job] = [ranges[idx] for idx in block.points]
+                for mirror_range in self._jobs[job]:
+                    mirror_range._job = job
+
+        self._planned = True
+
+    def _update(self, job: PollJob, values: list) -> None:
+        """
+        Copy the values of a poll into the local register store.
+
+        :param      job:     The job
+        :type       job:     PollJob
+        :param      values:  The read values
+        :type       values:  list
+        """
+        now = time.ticks_ms()
+        setter = self._setters[job.reg_type]
+
+        for mirror_range in self._jobs[job]:
+            offset = mirror_range.address - job.address
+            setter(address=mirror_range.local_address,
+                   values=values[offset:offset + mirror_range.quantity])
+            mirror_range.updated = now
+
+    def run_once(self) -> Optional[int]:
+        """
+        Poll the next due range, if any.
+
+        :returns:   Time until the next poll is due in milliseconds, see
+                    :py:meth:`umodbus.scheduler.PollScheduler.run_once`
+        :rtype:     Optional[int]
+        """
+        if not self._planned:
+            self._plan()
+
+        return self._scheduler.run_once()
+
+    def run(self, duration: Optional[int] = None) -> None:
+        """
+        Poll all ranges until stopped.
+
+        :param      duration:  Time to run in milliseconds, forever if None
+        :type       duration:  Optional[int]
+        """
+        if not self._planned:
+            self._plan()
+
+        self._scheduler.run(duration=duration)
+
+    def stop(self) -> None:
+        """Stop polling by :py:meth:`run`"""
+        self._scheduler.stop()
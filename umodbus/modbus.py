@@ -13,12 +13,17 @@ This class is inherited by the Modbus client implementations
 """
 
 # system packages
+import struct
 import time
 
 # custom packages
 from . import functions
 from . import const as Const
+from .bank import BitBank, RegisterBank
+from .cache import ResponseCache
 from .common import Request
+from .index import IntervalIndex
+from .journal import ChangeJournal, SOURCE_LOCAL, SOURCE_REMOTE
 
 # typing not natively supported on MicroPython
 from .typing import Callable, dict_keys, List, Optional, Union
@@ -46,12 +51,38 @@ class Modbus(object):
         self._default_vals = dict(zip(self._available_register_types,
                                       [False, 0, 0, False]))
 
+        # optional contiguous register banks of each register type
+        self._banks = dict()
+        for reg_type in self._available_register_types:
+            self._banks[reg_type] = list()
+
+        # address ranges of all registers and banks of each register type
+        self._index = dict()
+        for reg_type in self._available_register_types:
+            self._index[reg_type] = IntervalIndex()
+
+        # optional cache of read responses, see enable_response_cache
+        self._response_cache = None
+
         # registers which can be set by remote device
         self._changeable_register_types = ['COILS', 'HREGS']
         self._changed_registers = dict()
         for reg_type in self._changeable_register_types:
             self._changed_registers[reg_type] = dict()
 
+        # ring buffer of register changes, see enable_journal
+        self._journal = ChangeJournal()
+
+        # queued callbacks, see enable_deferred_callbacks
+        self._callback_queue = None
+        self._coalesce_callbacks = False
+
+        # incremented on every change of a register value
+        self._revision = 0
+
+        # register stores of further unit addresses, see add_unit
+        self._units = dict()
+
     def process(self) -> bool:
         """
         Process the Modbus requests.
@@ -59,14 +90,41 @@ class Modbus(object):
         :returns:   Result of processing, True on success, False otherwise
         :rtype:     bool
         """
-        reg_type = None
-        req_type = None
-
         request = self._itf.get_request(unit_addr_list=self._addr_list,
                                         timeout=0)
         if request is None:
+            # no request pending, run the (coalesced) callbacks now
+            if self._callback_queue:
+                self.dispatch_callbacks()
+            for unit in self._units.values():
+                if unit._callback_queue:
+                    unit.dispatch_callbacks()
             return False
 
+        unit = self._units.get(request.unit_addr, self)
+        unit._process_request(request=request)
+
+        if unit._callback_queue and not unit._coalesce_callbacks:
+            unit.dispatch_callbacks()
+
+        return True
+
+    def _process_request(self, request: Request) -> None:
+        """
+        Process a received Modbus request and send the response.
+
+        :param      request:  The request
+        :type       request:  Request
+        """
+        if self._units:
+            unit = self._units.get(request.unit_addr)
+            if unit is not None:
+                unit._process_request(request=request)
+                return
+
+        reg_type = None
+        req_type = None
+
         if request.function == Const.READ_COILS:
             # Coils (setter+getter) [0, 1]
             # function 01 - read single register
@@ -101,6 +159,11 @@ class Modbus(object):
             # function 16 - write multiple holding register
             reg_type = 'HREGS'
             req_type = 'WRITE'
+        elif request.function == Const.READ_WRITE_MULTIPLE_REGISTERS:
+            # Hregs (setter+getter) [0, 65535]
+            # function 23 - read/write multiple holding register
+            reg_type = 'HREGS'
+            req_type = 'READ_WRITE'
         else:
             request.send_exception(Const.ILLEGAL_FUNCTION)
 
@@ -109,8 +172,9 @@ class Modbus(object):
                 self._process_read_access(request=request, reg_type=reg_type)
             elif req_type == 'WRITE':
                 self._process_write_access(request=request, reg_type=reg_type)
-
-        return True
+            elif req_type == 'READ_WRITE':
+                self._process_read_write_access(request=request,
+                                                reg_type=reg_type)
 
     def _create_response(self,
                          request: Request,
@@ -133,15 +197,45 @@ class Modbus(object):
         if reg_type in ['COILS', 'ISTS']:
             default_value = {'val': False}
 
-        for addr in range(request.register_addr,
-                          request.register_addr + request.quantity):
-            value = reg_dict.get(addr, default_value)['val']
+        segments = self._index[reg_type].segments(
+            address=request.register_addr,
+            quantity=request.quantity)
 
-            if isinstance(value, (list, tuple)):
-                data.extend(value)
-            else:
-                data.append(value)
+        if segments is None:
+            # unmapped registers are reported with their default value
+            segments = [(request.register_addr,
+                         request.register_addr + request.quantity,
+                         None)]
+
+        for start, end, bank in segments:
+            if bank is not None:
+                data.extend(bank.read(address=start, quantity=end - start))
+                continue
+
+            for addr in range(start, end):
+                value = reg_dict.get(addr, default_value)['val']
+
+                if isinstance(value, (list, tuple)):
+                    data.extend(value)
+                else:
+                    data.append(value)
+
+        if reg_type in ['COILS', 'ISTS']:
+            data = self._reorder_bits(data)
+
+        return data
+
+    @staticmethod
+    def _reorder_bits(data: List[bool]) -> List[bool]:
+        """
+        Reorder coil or discrete input states for packing into a response.
+
+        :param      data:  The states in address order
+        :type       data:  List[bool]
 
+        :returns:   The states in transmission order
+        :rtype:     List[bool]
+        """
         # caution LSB vs MSB
         # [
         #   1, 0, 1, 1, 0, 0, 1, 1,     # 0xB3
@@ -188,19 +282,98 @@ class Modbus(object):
         :type       reg_type:  str
         """
         address = request.register_addr
+        cache = self._response_cache
+
+        if cache is not None:
+            pdu = cache.get(function_code=request.function,
+                            address=address,
+                            quantity=request.quantity)
+            if pdu is not None:
+                request.send_pdu_response(pdu)
+                return
 
-        if address in self._register_dict[reg_type]:
+        segments = self._index[reg_type].segments(address=address,
+                                                  quantity=request.quantity)
 
-            if self._register_dict[reg_type][address].get('on_get_cb', 0):
-                vals = self._create_response(request=request,
+        if segments is None:
+            # at least one of the requested registers does not exist
+            request.send_exception(Const.ILLEGAL_DATA_ADDRESS)
+            return
+
+        bank = segments[0][2]
+        if bank is not None:
+            _cb = bank.on_get_cb
+        else:
+            _cb = self._register_dict[reg_type][address].get('on_get_cb')
+
+        if cache is not None and not _cb:
+            # responses of registers with a callback are never cached as the
+            # callback has to be called on every request
+            pdu = self._encode_read_response(request=request,
                                              reg_type=reg_type)
-                _cb = self._register_dict[reg_type][address]['on_get_cb']
+            cache.put(function_code=request.function,
+                      reg_type=reg_type,
+                      address=address,
+                      quantity=request.quantity,
+                      pdu=pdu)
+            request.send_pdu_response(pdu)
+        elif bank is not None and len(segments) == 1:
+            if _cb:
+                vals = bank.read(address=address, quantity=request.quantity)
+
+            if _cb and self._callback_queue is None:
                 _cb(reg_type=reg_type, address=address, val=vals)
 
+            request.send_bank_response(bank)
+
+            if _cb and self._callback_queue is not None:
+                self._queue_callback(_cb, reg_type, address, vals)
+        else:
             vals = self._create_response(request=request, reg_type=reg_type)
+
+            if _cb and self._callback_queue is None:
+                revision = self._revision
+                _cb(reg_type=reg_type, address=address, val=vals)
+
+                if self._revision != revision:
+                    # the callback changed register values, send them
+                    vals = self._create_response(request=request,
+                                                 reg_type=reg_type)
+
             request.send_response(vals)
-        else:
-            request.send_exception(Const.ILLEGAL_DATA_ADDRESS)
+
+            if _cb and self._callback_queue is not None:
+                self._queue_callback(_cb, reg_type, address, vals)
+
+    def _encode_read_response(self, request: Request, reg_type: str) -> bytes:
+        """
+        Encode the response PDU of a read request.
+
+        :param      request:   The request
+        :type       request:   Request
+        :param      reg_type:  The register type
+        :type       reg_type:  str
+
+        :returns:   The response Protocol Data Unit
+        :rtype:     bytes
+        """
+        vals = self._create_response(request=request, reg_type=reg_type)
+
+        if reg_type in ['COILS', 'ISTS']:
+            return functions.response(
+                function_code=request.function,
+                request_register_addr=request.register_addr,
+                request_register_qty=request.quantity,
+                request_data=request.data,
+                value_list=vals)
+
+        # negative values are sent as two's complement
+        return struct.pack(functions.register_format(quantity=len(vals),
+                                                     signed=False,
+                                                     prefix='>BB'),
+                           request.function,
+                           len(vals) * 2,
+                           *[val & 0xFFFF for val in vals])
 
     def _process_write_access(self, request: Request, reg_type: str) -> None:
         """
@@ -214,8 +387,13 @@ class Modbus(object):
         address = request.register_addr
         val = 0
         valid_register = False
+        segments = self._index[reg_type].segments(
+            address=address,
+            quantity=request.quantity or 1)
+
+        if segments is not None:
+            bank = segments[0][2]
 
-        if address in self._register_dict[reg_type]:
             if request.data is None:
                 request.send_exception(Const.ILLEGAL_DATA_VALUE)
                 return
@@ -237,7 +415,9 @@ class Modbus(object):
                     ]
 
                 if valid_register:
-                    self.set_coil(address=address, value=val)
+                    self._set_reg_in_dict(reg_type=reg_type,
+                                          address=address,
+                                          value=val)
             elif reg_type == 'HREGS':
                 valid_register = True
                 val = list(functions.to_short(byte_array=request.data,
@@ -245,7 +425,9 @@ class Modbus(object):
 
                 if request.function in [Const.WRITE_SINGLE_REGISTER,
                                         Const.WRITE_MULTIPLE_REGISTERS]:
-                    self.set_hreg(address=address, value=val)
+                    self._set_reg_in_dict(reg_type=reg_type,
+                                          address=address,
+                                          value=val)
             else:
                 # nothing except holding registers or coils can be set
                 request.send_exception(Const.ILLEGAL_FUNCTION)
@@ -255,12 +437,89 @@ class Modbus(object):
                 self._set_changed_register(reg_type=reg_type,
                                            address=address,
                                            value=val)
-                if self._register_dict[reg_type][address].get('on_set_cb', 0):
-                    _cb = self._register_dict[reg_type][address]['on_set_cb']
+                if bank is not None:
+                    _cb = bank.on_set_cb
+                else:
+                    _cb = self._register_dict[reg_type][address].get(
+                        'on_set_cb')
+
+                if _cb and self._callback_queue is not None:
+                    self._queue_callback(_cb, reg_type, address, val)
+                elif _cb:
                     _cb(reg_type=reg_type, address=address, val=val)
         else:
             request.send_exception(Const.ILLEGAL_DATA_ADDRESS)
 
+    def _process_read_write_access(self,
+                                   request: Request,
+                                   reg_type: str) -> None:
+        """
+        Process write access followed by read access to registers
+
+        Both address ranges are checked before any register is changed, so
+        an invalid request leaves all registers untouched. The registers are
+        written before they are read.
+
+        :param      request:   The request
+        :type       request:   Request
+        :param      reg_type:  The register type
+        :type       reg_type:  str
+        """
+        index = self._index[reg_type]
+        write_addr = request.write_register_addr
+        write_segments = index.segments(address=write_addr,
+                                        quantity=request.write_quantity)
+        read_segments = index.segments(address=request.register_addr,
+                                       quantity=request.quantity)
+
+        if write_segments is None or read_segments is None:
+            request.send_exception(Const.ILLEGAL_DATA_ADDRESS)
+            return
+
+        val = list(functions.to_short(byte_array=request.data, signed=False))
+        self._set_reg_in_dict(reg_type=reg_type,
+                              address=write_addr,
+                              value=val)
+        self._set_changed_register(reg_type=reg_type,
+                                   address=write_addr,
+                                   value=val)
+
+        bank = write_segments[0][2]
+        if bank is not None:
+            _cb = bank.on_set_cb
+        else:
+            _cb = self._register_dict[reg_type][write_addr].get('on_set_cb')
+
+        if _cb and self._callback_queue is not None:
+            self._queue_callback(_cb, reg_type, write_addr, val)
+        elif _cb:
+            _cb(reg_type=reg_type, address=write_addr, val=val)
+
+        address = request.register_addr
+        bank = read_segments[0][2]
+        if bank is not None:
+            _cb = bank.on_get_cb
+        else:
+            _cb = self._register_dict[reg_type][address].get('on_get_cb')
+
+        vals = self._create_response(request=request, reg_type=reg_type)
+
+        if _cb and self._callback_queue is None:
+            revision = self._revision
+            _cb(reg_type=reg_type, address=address, val=vals)
+
+            if self._revision != revision:
+                # the callback changed register values, send them
+                vals = self._create_response(request=request,
+                                             reg_type=reg_type)
+
+        # negative values are sent as two's complement
+        request.send_response(values=[value & 0xFFFF for value in vals],
+                              signed=False)
+
+        if _cb and self._callback_queue is not None:
+            self._queue_callback(_cb, reg_type, address, vals)
+
     def add_coil(self,
                  address: int,
                  value: Union[bool, List[bool]] = False,
@@ -318,6 +577,7 @@ class Modbus(object):
         self._set_reg_in_dict(reg_type='COILS',
                               address=address,
                               value=value)
+        self._record_change(reg_type='COILS', address=address, value=value)
 
     def get_coil(self, address: int) -> Union[bool, List[bool]]:
         """
@@ -389,6 +649,7 @@ class Modbus(object):
         self._set_reg_in_dict(reg_type='HREGS',
                               address=address,
                               value=value)
+        self._record_change(reg_type='HREGS', address=address, value=value)
 
     def get_hreg(self, address: int) -> Union[int, List[int]]:
         """
@@ -460,6 +721,7 @@ class Modbus(object):
         self._set_reg_in_dict(reg_type='ISTS',
                               address=address,
                               value=value)
+        self._record_change(reg_type='ISTS', address=address, value=value)
 
     def get_ist(self, address: int) -> Union[bool, List[bool]]:
         """
@@ -531,6 +793,7 @@ class Modbus(object):
         self._set_reg_in_dict(reg_type='IREGS',
                               address=address,
                               value=value)
+        self._record_change(reg_type='IREGS', address=address, value=value)
 
     def get_ireg(self, address: int) -> Union[int, List[int]]:
         """
@@ -555,6 +818,450 @@ class Modbus(object):
         """
         return self._get_regs_of_dict(reg_type='IREGS')
 
+    def set_coils(self,
+                  address: int,
+                  values: Union[List[bool], tuple]) -> None:
+        """
+        Set the states of consecutive coils at once.
+
+        :param      address:  The address (ID) of the first coil
+        :type       address:  int
+        :param      values:   The states
+        :type       values:   Union[List[bool], tuple]
+        """
+        self._set_regs_in_dict(reg_type='COILS',
+                               address=address,
+                               values=values)
+
+    def set_hregs(self,
+                  address: int,
+                  values: Union[List[int], tuple]) -> None:
+        """
+        Set the values of consecutive holding registers at once.
+
+        :param      address:  The address (ID) of the first register
+        :type       address:  int
+        :param      values:   The values
+        :type       values:   Union[List[int], tuple]
+        """
+        self._set_regs_in_dict(reg_type='HREGS',
+                               address=address,
+                               values=values)
+
+    def set_ists(self,
+                 address: int,
+                 values: Union[List[bool], tuple]) -> None:
+        """
+        Set the states of consecutive discrete inputs at once.
+
+        :param      address:  The address (ID) of the first discrete input
+        :type       address:  int
+        :param      values:   The states
+        :type       values:   Union[List[bool], tuple]
+        """
+        self._set_regs_in_dict(reg_type='ISTS',
+                               address=address,
+                               values=values)
+
+    def set_iregs(self,
+                  address: int,
+                  values: Union[List[int], tuple]) -> None:
+        """
+        Set the values of consecutive input registers at once.
+
+        :param      address:  The address (ID) of the first register
+        :type       address:  int
+        :param      values:   The values
+        :type       values:   Union[List[int], tuple]
+        """
+        self._set_regs_in_dict(reg_type='IREGS',
+                               address=address,
+                               values=values)
+
+    def update_registers(self, registers: dict) -> None:
+        """
+        Set the values of many registers of any type at once.
+
+        All register types are validated before any value is set. The
+        addresses of each register type are grouped into runs of consecutive
+        addresses, each run is set like by :py:meth:`set_iregs`. Cached
+        responses of the address range of a register type are dropped and
+        its changes are recorded once after all runs have been set.
+
+        :param      registers:  The values by address of each register type,
+                                e.g. ``{'IREGS': {10: 1, 11: 2}}``
+        :type       registers:  dict
+
+        :raise      KeyError:  Invalid register type
+        """
+        for reg_type in registers:
+            if not self._check_valid_register(reg_type=reg_type):
+                raise KeyError('{} is not a valid register type of {}'.
+                               format(reg_type,
+                                      self._available_register_types))
+
+        for reg_type, values in registers.items():
+            addresses = sorted(values)
+            if not addresses:
+                continue
+
+            run_start = 0
+            for idx in range(1, len(addresses) + 1):
+                if (idx < len(addresses) and
+                        addresses[idx] == addresses[idx - 1] + 1):
+                    continue
+
+                self._apply_regs_in_dict(reg_type=reg_type,
+                                         address=addresses[run_start],
+                                         values=[values[a] for a in
+                                                 addresses[run_start:idx]])
+                run_start = idx
+
+            self._invalidate_response(reg_type=reg_type,
+                                      address=addresses[0],
+                                      quantity=addresses[-1] - addresses[0] + 1)
+            self._record_change(reg_type=reg_type,
+                                address=addresses,
+                                value=[values[a] for a in addresses])
+
+    def add_bank(self,
+                 reg_type: str,
+                 address: int,
+                 quantity: int,
+                 value: Union[bool, int, List[bool], List[int]] = 0,
+                 on_set_cb: Callable[[str, int, Union[List[bool], List[int]]],
+                                     None] = None,
+                 on_get_cb: Callable[[str, int, Union[List[bool], List[int]]],
+                                     None] = None) -> None:
+        """
+        Add a contiguous bank of registers or coils.
+
+        A bank stores all its registers in one preallocated buffer, 2 bytes
+        per holding or input register and 1 bit per coil or discrete input.
+        Read requests covered by a bank are served as slice of this buffer.
+        The ``add_*``, ``set_*`` and ``get_*`` functions access the bank for
+        all addresses inside its range. Registers previously added at an
+        address of the bank range are moved into the bank.
+
+        :param      reg_type:   The register type
+        :type       reg_type:   str
+        :param      address:    The address (ID) of the first register
+        :type       address:    int
+        :param      quantity:   The amount of registers of this bank
+        :type       quantity:   int
+        :param      value:      The default value(s)
+        :type       value:      Union[bool, int, List[bool], List[int]]
+        :param      on_set_cb:  Callback on setting a register of the bank
+        :type       on_set_cb:  Callable[
+            [str, int, Union[List[bool], List[int]]],
+            None
+            ]
+        :param      on_get_cb:  Callback on getting a register of the bank
+        :type       on_get_cb:  Callable[
+            [str, int, Union[List[bool], List[int]]],
+            None
+            ]
+
+        :raise      KeyError:    Invalid register type
+        :raise      ValueError:  Bank overlaps with an existing bank
+        """
+        if not self._check_valid_register(reg_type=reg_type):
+            raise KeyError('{} is not a valid register type of {}'.
+                           format(reg_type, self._available_register_types))
+
+        for bank in self._banks[reg_type]:
+            if (address < bank.address + bank.quantity and
+                    bank.address < address + quantity):
+                raise ValueError('{} bank at {} overlaps with existing bank '
+                                 'at {}'.format(reg_type, address,
+                                                bank.address))
+
+        if reg_type in ['COILS', 'ISTS']:
+            bank = BitBank(address=address,
+                           quantity=quantity,
+                           value=value,
+                           on_set_cb=on_set_cb,
+                           on_get_cb=on_get_cb)
+        else:
+            bank = RegisterBank(address=address,
+                                quantity=quantity,
+                                value=value,
+                                on_set_cb=on_set_cb,
+                                on_get_cb=on_get_cb)
+
+        reg_dict = self._register_dict[reg_type]
+        for addr in [a for a in reg_dict if a in bank]:
+            bank.set(address=addr, value=reg_dict.pop(addr)['val'])
+
+        self._banks[reg_type].append(bank)
+
+        index = self._index[reg_type]
+        index.remove(start=address, end=address + quantity)
+        index.add(start=address, end=address + quantity, owner=bank)
+        self._invalidate_response(reg_type=reg_type,
+                                  address=address,
+                                  quantity=quantity)
+
+    def remove_bank(self, reg_type: str, address: int) -> bool:
+        """
+        Remove a contiguous bank of registers or coils.
+
+        :param      reg_type:  The register type
+        :type       reg_type:  str
+        :param      address:   The address (ID) of the first bank register
+        :type       address:   int
+
+        :raise      KeyError:  Invalid register type
+        :returns:   Result of removing the bank, False if no bank started at
+                    the given address
+        :rtype:     bool
+        """
+        if not self._check_valid_register(reg_type=reg_type):
+            raise KeyError('{} is not a valid register type of {}'.
+                           format(reg_type, self._available_register_types))
+
+        for bank in self._banks[reg_type]:
+            if bank.address == address:
+                self._banks[reg_type].remove(bank)
+                self._index[reg_type].remove(start=address,
+                                             end=address + bank.quantity)
+                self._invalidate_response(reg_type=reg_type,
+                                          address=address,
+                                          quantity=bank.quantity)
+                return True
+
+        return False
+
+    def enable_response_cache(self, max_entries: int = 16) -> None:
+        """
+        Enable the cache of read responses.
+
+        The encoded responses of the latest read requests are stored and sent
+        again on the same request as long as none of the contained registers
+        has changed. Responses of registers with an ``on_get_cb`` callback are
+        not cached.
+
+        :param      max_entries:  The maximum number of cached responses
+        :type       max_entries:  int
+        """
+        self._response_cache = ResponseCache(max_entries=max_entries)
+
+    def disable_response_cache(self) -> None:
+        """Disable the cache of read responses"""
+        self._response_cache = None
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """
+        Get the read response cache.
+
+        :returns:   The cache, None if not enabled
+        :rtype:     Optional[ResponseCache]
+        """
+        return self._response_cache
+
+    def add_unit(self, unit_addr: int) -> 'Modbus':
+        """
+        Add an independent register store for a unit address.
+
+        Requests with this unit address are processed with the registers and
+        callbacks of the returned store, all other requests with the
+        registers of this client. This way a single interface serves several
+        logical slaves.
+
+        :param      unit_addr:  The unit address
+        :type       unit_addr:  int
+
+        :raise      ValueError:  Unit address is used already
+        :returns:   The register store of the unit
+        :rtype:     Modbus
+        """
+        if (unit_addr in self._units or
+                (self._addr_list is not None and
+                 unit_addr in self._addr_list)):
+            raise ValueError('Unit {} exists already'.format(unit_addr))
+
+        unit = Modbus(itf=self._itf, addr_list=[unit_addr])
+        self._units[unit_addr] = unit
+
+        # the interface drops requests of not listed unit addresses, None
+        # accepts requests of any unit address
+        if self._addr_list is not None:
+            self._addr_list.append(unit_addr)
+
+        return unit
+
+    def remove_unit(self, unit_addr: int) -> bool:
+        """
+        Remove the register store of a unit address.
+
+        :param      unit_addr:  The unit address
+        :type       unit_addr:  int
+
+        :returns:   Result of removing the unit, False if no store existed
+        :rtype:     bool
+        """
+        unit = self._units.pop(unit_addr, None)
+        if unit is None:
+            return False
+
+        if self._addr_list is not None:
+            self._addr_list.remove(unit_addr)
+
+        return True
+
+    def get_unit(self, unit_addr: int) -> Optional['Modbus']:
+        """
+        Get the register store of a unit address.
+
+        :param      unit_addr:  The unit address
+        :type       unit_addr:  int
+
+        :returns:   The register store, None if not added
+        :rtype:     Optional[Modbus]
+        """
+        return self._units.get(unit_addr)
+
+    @property
+    def units(self) -> dict_keys:
+        """
+        Get the unit addresses with an independent register store.
+
+        :returns:   The unit addresses
+        :rtype:     dict_keys
+        """
+        return self._units.keys()
+
+    def enable_deferred_callbacks(self, coalesce: bool = False) -> None:
+        """
+        Invoke the ``on_set_cb`` and ``on_get_cb`` callbacks after sending
+        the response.
+
+        The callbacks of a request are queued and invoked by :py:meth:`process`
+        after the response has been sent, so slow callbacks do not delay the
+        response. A getter callback is thereby called with the values already
+        sent, changing register values inside of it affects the next request.
+
+        With ``coalesce`` the queued callbacks are invoked only if no request
+        is pending. Further requests of the same callback for the same
+        registers replace the queued values, so a burst of writes to the same
+        registers results in a single callback with the latest values.
+
+        :param      coalesce:  Flag to coalesce callbacks of the same registers
+        :type       coalesce:  bool
+        """
+        if self._callback_queue is None:
+            self._callback_queue = list()
+        self._coalesce_callbacks = coalesce
+
+    def disable_deferred_callbacks(self) -> None:
+        """Invoke all queued callbacks, further ones are not queued anymore"""
+        self.dispatch_callbacks()
+        self._callback_queue = None
+        self._coalesce_callbacks = False
+
+    def dispatch_callbacks(self) -> int:
+        """
+        Invoke all queued callbacks.
+
+        Call this function regularly if requests are not processed by
+        :py:meth:`process`, e.g. by the asynchronous TCP client.
+
+        :returns:   The number of invoked callbacks
+        :rtype:     int
+        """
+        queue = self._callback_queue
+        if not queue:
+            return 0
+
+        # callbacks processing requests add to a new queue
+        self._callback_queue = list()
+
+        for _cb, reg_type, address, val in queue:
+            _cb(reg_type=reg_type, address=address, val=val)
+
+        return len(queue)
+
+    def _queue_callback(self,
+                        _cb: Callable[[str, int, Union[List[bool],
+                                                       List[int]]], None],
+                        reg_type: str,
+                        address: int,
+                        val: Union[List[bool], List[int]]) -> None:
+        """
+        Queue a callback, replacing a queued one of the same registers if
+        callbacks are coalesced.
+
+        :param      _cb:       The callback
+        :type       _cb:       Callable[
+            [str, int, Union[List[bool], List[int]]],
+            None
+            ]
+        :param      reg_type:  The register type
+        :type       reg_type:  str
+        :param      address:   The address (ID) of the first register
+        :type       address:   int
+        :param      val:       The register values
+        :type       val:       Union[List[bool], List[int]]
+        """
+        queue = self._callback_queue
+
+        if self._coalesce_callbacks:
+            for idx, entry in enumerate(queue):
+                if (entry[0] is _cb and
+                        entry[1] == reg_type and
+                        entry[2] == address and
+                        len(entry[3]) == len(val)):
+                    queue[idx] = (_cb, reg_type, address, val)
+                    return
+
+        queue.append((_cb, reg_type, address, val))
+
+    def _invalidate_response(self,
+                             reg_type: str,
+                             address: int,
+                             quantity: int = 1) -> None:
+        """
+        Record a change of registers, dropping all cached responses
+        containing any of them.
+
+        :param      reg_type:  The register type
+        :type       reg_type:  str
+        :param      address:   The address (ID) of the first register
+        :type       address:   int
+        :param      quantity:  The amount of registers
+        :type       quantity:  int
+        """
+        self._revision += 1
+
+        if self._response_cache is not None:
+            self._response_cache.invalidate(reg_type=reg_type,
+                                            address=address,
+                                            quantity=quantity)
+
+    def _get_bank(self,
+                  reg_type: str,
+                  address: int,
+                  quantity: int = 1) -> Optional[Union[BitBank, RegisterBank]]:
+        """
+        Get the bank containing all the specified registers.
+
+        :param      reg_type:  The register type
+        :type       reg_type:  str
+        :param      address:   The address (ID) of the first register
+        :type       address:   int
+        :param      quantity:  The amount of registers
+        :type       quantity:  int
+
+        :returns:   The bank or None if the registers are not part of a bank
+        :rtype:     Optional[Union[BitBank, RegisterBank]]
+        """
+        if not self._banks[reg_type]:
+            return None
+
+        return self._index[reg_type].owner(address=address,
+                                           quantity=quantity)
+
     def _set_reg_in_dict(self,
                          reg_type: str,
                          address: int,
@@ -591,10 +1298,27 @@ class Modbus(object):
             raise KeyError('{} is not a valid register type of {}'.
                            format(reg_type, self._available_register_types))
 
+        quantity = len(value) if isinstance(value, (list, tuple)) else 1
+        self._invalidate_response(reg_type=reg_type,
+                                  address=address,
+                                  quantity=quantity)
+
+        if self._banks[reg_type]:
+            bank = self._get_bank(reg_type=reg_type,
+                                  address=address,
+                                  quantity=quantity)
+            if bank is not None:
+                bank.set(address=address, value=value)
+                return
+
         if isinstance(value, (list, tuple)):
             # flatten the list and add single registers only
             for idx, val in enumerate(value):
                 this_addr = address + idx
+                bank = self._get_bank(reg_type=reg_type, address=this_addr)
+                if bank is not None:
+                    bank.set(address=this_addr, value=val)
+                    continue
                 self._set_single_reg_in_dict(reg_type=reg_type,
                                              address=this_addr,
                                              value=val,
@@ -607,6 +1331,91 @@ class Modbus(object):
                                          on_set_cb=on_set_cb,
                                          on_get_cb=on_get_cb)
 
+    def _set_regs_in_dict(self,
+                          reg_type: str,
+                          address: int,
+                          values: Union[List[bool], List[int], tuple]) -> None:
+        """
+        Set the values of consecutive registers in one pass.
+
+        The register type is checked and cached responses are dropped once
+        for all registers. Registers of a bank are set by a single bank
+        update, existing registers of the dictionary are updated in place.
+        Not existing registers are added like by :py:meth:`_set_reg_in_dict`.
+
+        :param      reg_type:  The register type
+        :type       reg_type:  str
+        :param      address:   The address (ID) of the first register
+        :type       address:   int
+        :param      values:    The values of the registers
+        :type       values:    Union[List[bool], List[int], tuple]
+
+        :raise      KeyError:  Invalid register type
+        """
+        if not self._check_valid_register(reg_type=reg_type):
+            raise KeyError('{} is not a valid register type of {}'.
+                           format(reg_type, self._available_register_types))
+
+        quantity = len(values)
+        if not quantity:
+            return
+
+        self._invalidate_response(reg_type=reg_type,
+                                  address=address,
+                                  quantity=quantity)
+
+        self._record_change(reg_type=reg_type, address=address, value=values)
+
+        self._apply_regs_in_dict(reg_type=reg_type,
+                                 address=address,
+                                 values=values)
+
+    def _apply_regs_in_dict(self,
+                            reg_type: str,
+                            address: int,
+                            values: Union[List[bool], List[int], tuple]) -> None:
+        """
+        Set the values of consecutive registers without dropping cached
+        responses or recording the change.
+
+        :param      reg_type:  The register type
+        :type       reg_type:  str
+        :param      address:   The address (ID) of the first register
+        :type       address:   int
+        :param      values:    The values of the registers
+        :type       values:    Union[List[bool], List[int], tuple]
+        """
+        quantity = len(values)
+        reg_dict = self._register_dict[reg_type]
+        segments = self._index[reg_type].segments(address=address,
+                                                  quantity=quantity)
+
+        if segments is None:
+            # some registers do not exist yet, set them one by one
+            for idx, val in enumerate(values):
+                this_addr = address + idx
+                data = reg_dict.get(this_addr)
+                if data is not None:
+                    data['val'] = val
+                    continue
+
+                bank = self._get_bank(reg_type=reg_type, address=this_addr)
+                if bank is not None:
+                    bank.set(address=this_addr, value=val)
+                else:
+                    self._set_single_reg_in_dict(reg_type=reg_type,
+                                                 address=this_addr,
+                                                 value=val)
+            return
+
+        for start, end, bank in segments:
+            if bank is not None:
+                bank.set(address=start,
+                         value=values[start - address:end - address])
+            else:
+                for this_addr in range(start, end):
+                    reg_dict[this_addr]['val'] = values[this_addr - address]
+
     def _set_single_reg_in_dict(self,
                                 reg_type: str,
                                 address: int,
@@ -659,6 +1468,9 @@ class Modbus(object):
         if callable(on_get_cb):
             data['on_get_cb'] = on_get_cb
 
+        if address not in self._register_dict[reg_type]:
+            self._index[reg_type].add(start=address, end=address + 1)
+
         self._register_dict[reg_type][address] = data
 
     def _remove_reg_from_dict(self,
@@ -680,7 +1492,13 @@ class Modbus(object):
             raise KeyError('{} is not a valid register type of {}'.
                            format(reg_type, self._available_register_types))
 
-        return self._register_dict[reg_type].pop(address, None)
+        data = self._register_dict[reg_type].pop(address, None)
+
+        if data is not None:
+            self._index[reg_type].remove(start=address, end=address + 1)
+            self._invalidate_response(reg_type=reg_type, address=address)
+
+        return data
 
     def _get_reg_in_dict(self,
                          reg_type: str,
@@ -701,6 +1519,10 @@ class Modbus(object):
             raise KeyError('{} is not a valid register type of {}'.
                            format(reg_type, self._available_register_types))
 
+        bank = self._get_bank(reg_type=reg_type, address=address)
+        if bank is not None:
+            return bank.get(address=address)
+
         if address in self._register_dict[reg_type]:
             return self._register_dict[reg_type][address]['val']
         else:
@@ -722,6 +1544,12 @@ class Modbus(object):
             raise KeyError('{} is not a valid register type of {}'.
                            format(reg_type, self._available_register_types))
 
+        if self._banks[reg_type]:
+            regs = list(self._register_dict[reg_type].keys())
+            for bank in self._banks[reg_type]:
+                regs.extend(range(bank.address, bank.address + bank.quantity))
+            return regs
+
         return self._register_dict[reg_type].keys()
 
     def _check_valid_register(self, reg_type: str) -> bool:
@@ -742,9 +1570,13 @@ class Modbus(object):
     @property
     def changed_registers(self) -> dict:
         """
-        Get the changed registers.
+        Get the registers changed by a host.
+
+        The latest change of each register is kept independent of the change
+        journal until it is removed by :py:meth:`_remove_changed_register`.
 
-        :returns:   The changed registers.
+        :returns:   The latest value and time of each changed register by
+                    register type
         :rtype:     dict
         """
         return self._changed_registers
@@ -769,12 +1601,85 @@ class Modbus(object):
         """
         return self._changed_registers['HREGS']
 
+    def enable_journal(self, capacity: int = 64) -> None:
+        """
+        Enable the change journal with a new capacity.
+
+        The journal is enabled with a capacity of 64 changes by default. All
+        previously recorded changes are dropped.
+
+        :param      capacity:  The maximum number of stored changes
+        :type       capacity:  int
+        """
+        self._journal = ChangeJournal(capacity=capacity)
+
+    def disable_journal(self) -> None:
+        """Disable the change journal"""
+        self._journal = None
+
+    @property
+    def journal(self) -> Optional[ChangeJournal]:
+        """
+        Get the change journal.
+
+        :returns:   The journal, None if not enabled
+        :rtype:     Optional[ChangeJournal]
+        """
+        return self._journal
+
+    def _record_change(self,
+                       reg_type: str,
+                       address: Union[int, List[int]],
+                       value: Union[bool, int, List[bool], List[int]],
+                       source: int = SOURCE_LOCAL) -> None:
+        """
+        Record the change of registers in the journal, if enabled.
+
+        Values are recorded as returned by the registers, registers of a
+        bank are returned unsigned.
+
+        :param      reg_type:  The register type
+        :type       reg_type:  str
+        :param      address:   The address (ID) of the first of consecutive
+                               registers or the address of each value
+        :type       address:   Union[int, List[int]]
+        :param      value:     The new value(s)
+        :type       value:     Union[bool, int, List[bool], List[int]]
+        :param      source:    The source of the change
+        :type       source:    int
+        """
+        if self._journal is None:
+            return
+
+        if self._banks[reg_type] and reg_type in ('HREGS', 'IREGS'):
+            if not isinstance(value, (list, tuple)):
+                value = (value, )
+
+            if isinstance(address, (list, tuple)):
+                addresses = address
+            else:
+                addresses = range(address, address + len(value))
+
+            stored = list()
+            for this_addr, val in zip(addresses, value):
+                bank = self._get_bank(reg_type=reg_type, address=this_addr)
+                if bank is not None:
+                    val &= 0xFFFF
+                stored.append(val)
+            value = stored
+
+        self._journal.record(reg_type=reg_type,
+                             address=address,
+                             value=value,
+                             source=source)
+
     def _set_changed_register(self,
                               reg_type: str,
                               address: int,
                               value: Union[bool, int, List[bool], List[int]]) -> None:
         """
-        Set the register value in the dictionary of changed registers.
+        Set the register value changed by a host in the dictionary of changed
+        registers and record it in the journal.
 
         :param      reg_type:  The register type
         :type       reg_type:  str
@@ -786,13 +1691,19 @@ class Modbus(object):
         :raise      KeyError:  Register can not be changed externally
         """
         if reg_type in self._changeable_register_types:
+            ticks = time.ticks_ms()
             if isinstance(value, (list, tuple)):
                 for idx, val in enumerate(value):
-                    content = {'val': val, 'time': time.ticks_ms()}
+                    content = {'val': val, 'time': ticks}
                     self._changed_registers[reg_type][address + idx] = content
             else:
-                content = {'val': value, 'time': time.ticks_ms()}
+                content = {'val': value, 'time': ticks}
                 self._changed_registers[reg_type][address] = content
+
+            self._record_change(reg_type=reg_type,
+                                address=address,
+                                value=value,
+                                source=SOURCE_REMOTE)
         else:
             raise KeyError('{} can not be changed externally'.format(reg_type))
 
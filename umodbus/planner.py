@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Read request planner
+
+Combine many scattered read requests into the fewest possible requests
+allowed by the protocol limits, execute them and return the result of each
+requested point. Useful for long poll lists, especially on slow RTU busses.
+"""
+
+# custom packages
+from . import const as Const
+
+# typing not natively supported on MicroPython
+from .typing import List, Tuple, Union
+
+#: Function code used to read each register type
+READ_FUNCTION_CODES = {
+    'COILS': Const.READ_COILS,
+    'ISTS': Const.READ_DISCRETE_INPUTS,
+    'HREGS': Const.READ_HOLDING_REGISTERS,
+    'IREGS': Const.READ_INPUT_REGISTER,
+}
+
+#: Maximum quantity of a single read request of each register type
+READ_LIMITS = {
+    'COILS': 2000,
+    'ISTS': 2000,
+    'HREGS': 125,
+    'IREGS': 125,
+}
+
+
+class ReadBlock(object):
+    """
+    Contiguous range read by a single request
+
+    :param      slave_addr:  The slave address
+    :type       slave_addr:  int
+    :param      reg_type:    The register type
+    :type       reg_type:    str
+    :param      address:     The starting address
+    :type       address:     int
+    :param      quantity:    The quantity of registers
+    :type       quantity:    int
+    """
+    def __init__(self,
+                 slave_addr: int,
+                 reg_type: str,
+                 address: int,
+                 quantity: int) -> None:
+        self.slave_addr = slave_addr
+        self.reg_type = reg_type
+        self.address = address
+        self.quantity = quantity
+        # indices of the points served by this block
+        self.points = list()
+
+    @property
+    def function_code(self) -> int:
+        """
+        Get the function code to read this block.
+
+        :returns:   The function code
+        :rtype:     int
+        """
+        return READ_FUNCTION_CODES[self.reg_type]
+
+
+def read_registers(host,
+                   slave_addr: int,
+                   reg_type: str,
+                   address: int,
+                   quantity: int,
+                   signed: bool = True) -> Union[List[bool], Tuple[int, ...]]:
+    """
+    Read a range of registers of any type with the matching host function.
+
+    :param      host:        The Modbus host, TCP or Serial
+    :type       host:        CommonModbusFunctions
+    :param      slave_addr:  The slave address
+    :type       slave_addr:  int
+    :param      reg_type:    The register type
+    :type       reg_type:    str
+    :param      address:     The starting address
+    :type       address:     int
+    :param      quantity:    The quantity of registers
+    :type       quantity:    int
+    :param      signed:      Indicates if register values are signed
+    :type       signed:      bool
+
+    :returns:   The read coil states or register values
+    :rtype:     Union[List[bool], Tuple[int, ...]]
+
+    :raise      KeyError:  Invalid register type
+    """
+    if reg_type == 'COILS':
+        return host.read_coils(slave_addr=slave_addr,
+                               starting_addr=address,
+                               coil_qty=quantity)
+    elif reg_type == 'ISTS':
+        return host.read_discrete_inputs(slave_addr=slave_addr,
+                                         starting_addr=address,
+                                         input_qty=quantity)
+    elif reg_type == 'HREGS':
+        return host.read_holding_registers(slave_addr=slave_addr,
+                                           starting_addr=address,
+                                           register_qty=quantity,
+                                           signed=signed)
+    elif reg_type == 'IREGS':
+        return host.read_input_registers(slave_addr=slave_addr,
+                                         starting_addr=address,
+                                         register_qty=quantity,
+                                         signed=signed)
+
+    raise KeyError(reg_type)
+
+
+def plan_reads(points: List[Tuple[int, str, int, int]],
+               max_gap: int = 0) -> List[ReadBlock]:
+    """
+    Merge the points into the fewest read requests.
+
+    Points of the same slave and register type are merged into one block if
+    the amount of unrequested registers between them is not more than
+    ``max_gap`` and the block does not exceed the protocol limit of 125
+    registers or 2000 coils/discrete inputs.
+
+    :param      points:   The points as tuples of slave address, register
+                          type, starting address and quantity
+    :type       points:   List[Tuple[int, str, int, int]]
+    :param      max_gap:  Maximum amount of unrequested registers read to
+                          merge two points
+    :type       max_gap:  int
+
+    :returns:   The read blocks
+    :rtype:     List[ReadBlock]
+
+    :raise      KeyError:    Invalid register type
+    :raise      ValueError:  Quantity of a point exceeds the protocol limit
+    """
+    order = sorted(range(len(points)),
+                   key=lambda idx: (points[idx][0],
+                                    points[idx][1],
+                                    points[idx][2]))
+    blocks = list()
+    block = None
+    block_end = 0
+
+    for idx in order:
+        slave_addr, reg_type, address, quantity = points[idx]
+        limit = READ_LIMITS[reg_type]
+
+        if not (1 <= quantity <= limit):
+            raise ValueError('Invalid quantity {} of {} at {}'.
+                             format(quantity, reg_type, address))
+
+        end = address + quantity
+
+        if (block is not None and
+                block.slave_addr == slave_addr and
+                block.reg_type == reg_type and
+                address <= block_end + max_gap and
+                max(block_end, end) - block.address <= limit):
+            block_end = max(block_end, end)
+            block.quantity = block_end - block.address
+        else:
+            block = ReadBlock(slave_addr=slave_addr,
+                              reg_type=reg_type,
+                              address=address,
+                              quantity=quantity)
+            block_end = end
+            blocks.append(block)
+
+        block.points.append(idx)
+
+    return blocks
+
+
+class ReadPlanner(object):
+    """
+    Read many points of one or several slaves with merged requests
+
+    If the host supports pipelining (:py:meth:`umodbus.tcp.TCP.read_many`) all
+    merged requests are sent pipelined, otherwise one after the other.
+
+    :param      host:     The Modbus host, TCP or Serial
+    :type       host:     CommonModbusFunctions
+    :param      points:   The points as tuples of slave address, register
+                          type, starting address and quantity
+    :type       points:   List[Tuple[int, str, int, int]]
+    :param      max_gap:  Maximum amount of unrequested registers read to
+                          merge two points
+    :type       max_gap:  int
+    :param      signed:   Indicates if register values are signed
+    :type       signed:   bool
+    """
+    def __init__(self,
+                 host,
+                 points: List[Tuple[int, str, int, int]],
+                 max_gap: int = 0,
+                 signed: bool = True) -> None:
+        self._host = host
+        self._points = list(points)
+        self._signed = signed
+        self._blocks = plan_reads(points=self._points, max_gap=max_gap)
+
+    @property
+    def blocks(self) -> List[ReadBlock]:
+        """
+        Get the planned read blocks.
+
+        :returns:   The read blocks
+        :rtype:     List[ReadBlock]
+        """
+        return self._blocks
+
+    def _read_block(self,
+                    block: ReadBlock) -> Union[List[bool], Tuple[int, ...]]:
+        """
+        Read a single block.
+
+        :param      block:  The block
+        :type       block:  ReadBlock
+
+        :returns:   The read coil states or register values
+        :rtype:     Union[List[bool], Tuple[int, ...]]
+        """
+        return read_registers(host=self._host,
+                              slave_addr=block.slave_addr,
+                              reg_type=block.reg_type,
+                              address=block.address,
+                              quantity=block.quantity,
+                              signed=self._signed)
+
+    def execute(self) -> List[Union[List[bool], Tuple[int, ...]]]:
+        """
+        Read all blocks and scatter the content to the points.
+
+        :returns:   The read coil states or register values of each point, in
+                    the order of the points
+        :rtype:     List[Union[List[bool], Tuple[int, ...]]]
+        """
+        if hasattr(self._host, 'read_many'):
+            block_results = self._host.read_many(
+                [(block.slave_addr, block.function_code,
+                  block.address, block.quantity) for block in self._blocks],
+                signed=self._signed)
+        else:
+            block_results = [self._read_block(block)
+                             for block in self._blocks]
+
+        results = [None] * len(self._points)
+
+        for block, block_result in zip(self._blocks, block_results):
+            for idx in block.points:
+                offset = self._points[idx][2] - block.address
+                results[idx] = block_result[offset:offset +
+                                            self._points[idx][3]]
+
+        return results
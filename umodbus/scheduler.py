@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Poll scheduler of a Modbus host
+
+Poll registers of many slaves periodically over a single bus. Jobs are polled
+by priority and deadline, slaves not responding are backed off so they do not
+stall the bus for the other slaves.
+"""
+
+# system packages
+import time
+
+# custom packages
+from .planner import read_registers, READ_LIMITS
+
+# typing not natively supported on MicroPython
+from .typing import Callable, List, Optional, Union
+
+
+class PollJob(object):
+    """
+    Periodic read request of a scheduler
+
+    :param      slave_addr:  The slave address
+    :type       slave_addr:  int
+    :param      reg_type:    The register type
+    :type       reg_type:    str
+    :param      address:     The starting address
+    :type       address:     int
+    :param      quantity:    The quantity of registers
+    :type       quantity:    int
+    :param      period:      The poll period in milliseconds
+    :type       period:      int
+    :param      priority:    The priority, lower values are polled first
+    :type       priority:    int
+    :param      deadline:    Maximum delay of a poll after it became due in
+                             milliseconds, default the period
+    :type       deadline:    Optional[int]
+    :param      callback:    Callback on new values, called with the job and
+                             the read values
+    :type       callback:    Callable[[PollJob, list], None]
+    :param      signed:      Indicates if register values are signed
+    :type       signed:      bool
+    """
+    def __init__(self,
+                 slave_addr: int,
+                 reg_type: str,
+                 address: int,
+                 quantity: int,
+                 period: int,
+                 priority: int = 0,
+                 deadline: Optional[int] = None,
+                 callback: Optional[Callable] = None,
+                 signed: bool = True) -> None:
+        if not (1 <= quantity <= READ_LIMITS[reg_type]):
+            raise ValueError('Invalid quantity {} of {}'.
+                             format(quantity, reg_type))
+
+        self.slave_addr = slave_addr
+        self.reg_type = reg_type
+        self.address = address
+        self.quantity = quantity
+        self.period = period
+        self.priority = priority
+        self.deadline = period if deadline is None else deadline
+        self.callback = callback
+        self.signed = signed
+
+        # latest result
+        self.values = None
+        self.last_error = None
+
+        # statistics
+        self.polls = 0
+        self.errors = 0
+        self.missed = 0
+        self.next_due = time.ticks_ms()
+        self._first_poll = None
+        self._last_poll = None
+
+    @property
+    def requested_rate(self) -> float:
+        """
+        Get the requested poll rate.
+
+        :returns:   Polls per second
+        :rtype:     float
+        """
+        return 1000 / self.period
+
+    @property
+    def achieved_rate(self) -> float:
+        """
+        Get the achieved poll rate since the first poll.
+
+        :returns:   Polls per second
+        :rtype:     float
+        """
+        if self.polls < 2:
+            return 0.0
+
+        duration = time.ticks_diff(self._last_poll, self._first_poll)
+        if duration <= 0:
+            return 0.0
+
+        return (self.polls - 1) * 1000 / duration
+
+
+class PollScheduler(object):
+    """
+    Poll scheduler of a Modbus host
+
+    The due job of the highest priority is polled first, jobs of the same
+    priority by their deadline. Between two requests the bus is idle for at
+    least the turnaround time. If a slave does not respond or its response can
+    not be parsed, all its jobs are suspended for the backoff time, doubled
+    on every further failure up to ``max_backoff``.
+
+    :param      host:         The Modbus host, TCP or Serial
+    :type       host:         CommonModbusFunctions
+    :param      cache:        Shared register cache, updated with the values
+                              of each register by the key of slave address,
+                              register type and address
+    :type       cache:        Optional[dict]
+    :param      backoff:      Initial backoff time in milliseconds
+    :type       backoff:      int
+    :param      max_backoff:  Maximum backoff time in milliseconds
+    :type       max_backoff:  int
+    :param      turnaround:   Minimum idle time between two requests in
+                              microseconds, default the inter-frame delay of
+                              a Serial host
+    :type       turnaround:   Optional[int]
+    """
+    def __init__(self,
+                 host,
+                 cache: Optional[dict] = None,
+                 backoff: int = 1000,
+                 max_backoff: int = 30000,
+                 turnaround: Optional[int] = None) -> None:
+        self._host = host
+        self._jobs = list()
+        self.cache = cache
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+
+        if turnaround is None:
+            turnaround = getattr(host, '_inter_frame_delay', 0)
+        self._turnaround = turnaround
+
+        # failure count and suspension end of each backed off slave
+        self._suspended = dict()
+        self._last_end_us = time.ticks_us()
+        self._running = False
+
+    @property
+    def jobs(self) -> List[PollJob]:
+        """
+        Get the scheduled jobs.
+
+        :returns:   The jobs
+        :rtype:     List[PollJob]
+        """
+        return self._jobs
+
+    def add_job(self,
+                slave_addr: int,
+                reg_type: str,
+                address: int,
+                quantity: int,
+                period: int,
+                priority: int = 0,
+                deadline: Optional[int] = None,
+                callback: Optional[Callable] = None,
+                signed: bool = True) -> PollJob:
+        """
+        Add a job, it is due immediately.
+
+        :param      slave_addr:  The slave address
+        :type       slave_addr:  int
+        :param      reg_type:    The register type
+        :type       reg_type:    str
+        :param      address:     The starting address
+        :type       address:     int
+        :param      quantity:    The quantity of registers
+        :type       quantity:    int
+        :param      period:      The poll period in milliseconds
+        :type       period:      int
+        :param      priority:    The priority, lower values are polled first
+        :type       priority:    int
+        :param      deadline:    Maximum delay of a poll after it became due
+                                 in milliseconds, default the period
+        :type       deadline:    Optional[int]
+        :param      callback:    Callback on new values, called with the job
+                                 and the read values
+        :type       callback:    Callable[[PollJob, list], None]
+        :param      signed:      Indicates if register values are signed
+        :type       signed:      bool
+
+        :returns:   The job
+        :rtype:     PollJob
+        """
+        job = PollJob(slave_addr=slave_addr,
+                      reg_type=reg_type,
+                      address=address,
+                      quantity=quantity,
+                      period=period,
+                      priority=priority,
+                      deadline=deadline,
+                      callback=callback,
+                      signed=signed)
+        self._jobs.append(job)
+
+        return job
+
+    def remove_job(self, job: PollJob) -> bool:
+        """
+        Remove a job.
+
+        :param      job:  The job
+        :type       job:  PollJob
+
+        :returns:   Result of operation
+        :rtype:     bool
+        """
+        if job in self._jobs:
+            self._jobs.remove(job)
+            return True
+
+        return False
+
+    def _due_time(self, job: PollJob) -> int:
+        """
+        Get the time a job can be polled next, including the backoff time.
+
+        :param      job:  The job
+        :type       job:  PollJob
+
+        :returns:   The due time in milliseconds
+        :rtype:     int
+        """
+        suspended = self._suspended.get(job.slave_addr)
+
+        if (suspended is not None and
+                time.ticks_diff(suspended[1], job.next_due) > 0):
+            return suspended[1]
+
+        return job.next_due
+
+    def _next_job(self, now: int) -> Optional[PollJob]:
+        """
+        Get the due job to be polled next.
+
+        :param      now:  The current time in milliseconds
+        :type       now:  int
+
+        :returns:   The job, None if no job is due
+        :rtype:     Optional[PollJob]
+        """
+        next_job = None
+        next_deadline = 0
+
+        for job in self._jobs:
+            due = self._due_time(job)
+            if time.ticks_diff(now, due) < 0:
+                continue
+
+            deadline = time.ticks_add(due, job.deadline)
+            if (next_job is None or
+                    job.priority < next_job.priority or
+                    (job.priority == next_job.priority and
+                     time.ticks_diff(deadline, next_deadline) < 0)):
+                next_job = job
+                next_deadline = deadline
+
+        return next_job
+
+    def _poll(self, job: PollJob, now: int) -> None:
+        """
+        Poll a job and update its statistics.
+
+        :param      job:  The job
+        :type       job:  PollJob
+        :param      now:  The time the job has been selected in milliseconds
+        :type       now:  int
+        """
+        if time.ticks_diff(now, time.ticks_add(job.next_due,
+                                               job.deadline)) > 0:
+            job.missed += 1
+
+        # keep the bus idle for the turnaround time after the last request
+        idle = time.ticks_diff(time.ticks_us(), self._last_end_us)
+        if idle < self._turnaround:
+            time.sleep_us(self._turnaround - idle)
+
+        error = None
+        try:
+            values = read_registers(host=self._host,
+                                    slave_addr=job.slave_addr,
+                                    reg_type=job.reg_type,
+                                    address=job.address,
+                                    quantity=job.quantity,
+                                    signed=job.signed)
+        except Exception as e:
+            # e.g. an IndexError of a malformed response must not stop run()
+            error = e
+
+        # the backoff and the next period start at the end of this poll, not
+        # before a response timeout
+        now = time.ticks_ms()
+        self._last_end_us = time.ticks_us()
+
+        try:
+            if isinstance(error, ValueError):
+                # the slave is responding with an exception
+                self._suspended.pop(job.slave_addr, None)
+                self._failed(job=job, error=error)
+            elif error is not None:
+                # no or an invalid response, suspend all jobs of this slave
+                self._suspend(slave_addr=job.slave_addr, now=now)
+                self._failed(job=job, error=error)
+            else:
+                self._suspended.pop(job.slave_addr, None)
+                self._publish(job=job, values=values)
+        finally:
+            self._reschedule(job=job, now=now)
+
+    def _suspend(self, slave_addr: int, now: int) -> None:
+        """
+        Suspend all jobs of a slave for the backoff time.
+
+        :param      slave_addr:  The slave address
+        :type       slave_addr:  int
+        :param      now:         The current time in milliseconds
+        :type       now:         int
+        """
+        failures = self._suspended.get(slave_addr, (0, now))[0] + 1
+        backoff = self._backoff * (1 << min(failures - 1, 15))
+        if backoff > self._max_backoff:
+            backoff = self._max_backoff
+
+        self._suspended[slave_addr] = (failures, time.ticks_add(now, backoff))
+
+    def _failed(self, job: PollJob, error: Exception) -> None:
+        """
+        Record a failed poll of a job.
+
+        :param      job:    The job
+        :type       job:    PollJob
+        :param      error:  The error
+        :type       error:  Exception
+        """
+        job.errors += 1
+        job.last_error = error
+
+    def _publish(self, job: PollJob, values: Union[list, tuple]) -> None:
+        """
+        Publish the values of a successful poll.
+
+        :param      job:     The job
+        :type       job:     PollJob
+        :param      values:  The read values
+        :type       values:  Union[list, tuple]
+        """
+        now = time.ticks_ms()
+        if job._first_poll is None:
+            job._first_poll = now
+        job._last_poll = now
+        job.polls += 1
+        job.values = values
+        job.last_error = None
+
+        if self.cache is not None:
+            for idx, value in enumerate(values):
+                self.cache[(job.slave_addr,
+                            job.reg_type,
+                            job.address + idx)] = value
+
+        if job.callback:
+            job.callback(job, values)
+
+    def _reschedule(self, job: PollJob, now: int) -> None:
+        """
+        Set the next due time of a job.
+
+        If polls have been delayed by more than a period, the missed polls
+        are skipped instead of being caught up with a burst of requests.
+
+        :param      job:  The job
+        :type       job:  PollJob
+        :param      now:  The current time in milliseconds
+        :type       now:  int
+        """
+        job.next_due = time.ticks_add(job.next_due, job.period)
+
+        if time.ticks_diff(job.next_due, now) <= 0:
+            job.next_due = time.ticks_add(now, job.period)
+
+    def run_once(self) -> Optional[int]:
+        """
+        Poll the next due job, if any.
+
+        :returns:   Time until the next job is due in milliseconds, 0 if a
+                    job is due, None if no job is scheduled
+        :rtype:     Optional[int]
+        """
+        now = time.ticks_ms()
+        job = self._next_job(now=now)
+
+        if job is not None:
+            self._poll(job=job, now=now)
+            now = time.ticks_ms()
+
+        wait = None
+        for job in self._jobs:
+            remaining = time.ticks_diff(self._due_time(job), now)
+            if wait is None or remaining < wait:
+                wait = remaining
+
+        if wait is not None and wait < 0:
+            wait = 0
+
+        return wait
+
+    def run(self, duration: Optional[int] = None) -> None:
+        """
+        Poll all jobs until stopped.
+
+        :param      duration:  Time to run in milliseconds, forever if None
+        :type       duration:  Optional[int]
+        """
+        start = time.ticks_ms()
+        self._running = True
+
+        while self._running:
+            wait = self.run_once()
+
+            if duration is not None:
+                remaining = duration - time.ticks_diff(time.ticks_ms(), start)
+                if remaining <= 0:
+                    break
+                if wait is None or wait > remaining:
+                    wait = remaining
+
+            if wait is None:
+                break
+            elif wait:
+                time.sleep_ms(wait)
+
+        self._running = False
+
+    def stop(self) -> None:
+        """Stop polling by :py:meth:`run`"""
+        self._running = False
+
+    def statistics(self) -> List[dict]:
+        """
+        Get the statistics of all jobs.
+
+        :returns:   The poll statistics of each job
+        :rtype:     List[dict]
+        """
+        return [{
+            'slave_addr': job.slave_addr,
+            'reg_type': job.reg_type,
+            'address': job.address,
+            'polls': job.polls,
+            'errors': job.errors,
+            'missed': job.missed,
+            'requested_rate': job.requested_rate,
+            'achieved_rate': job.achieved_rate,
+        } for job in self._jobs]
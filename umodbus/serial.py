@@ -17,8 +17,11 @@ import time
 # custom packages
 from . import const as Const
 from . import functions
+from .crc import CRC16, crc16
 from .common import Request, CommonModbusFunctions
 from .common import ModbusException
+from .common import ResponseTimeoutError, CRCError
+from .common import ResponseMismatchError, SlaveExceptionError
 from .modbus import Modbus
 
 # typing not natively supported on MicroPython
@@ -113,6 +116,20 @@ class Serial(CommonModbusFunctions):
         else:
             self._ctrlPin = None
 
+        # preallocated frame buffer for slave address, PDU and CRC
+        self._tx_buf = bytearray(1 + Const.MAX_PDU_LENGTH + Const.CRC_LENGTH)
+        self._tx_view = memoryview(self._tx_buf)
+
+        # preallocated receive buffer of a response
+        self._rx_buf = bytearray(1 + Const.MAX_PDU_LENGTH + Const.CRC_LENGTH)
+        self._rx_view = memoryview(self._rx_buf)
+
+        # CRC of the request received by _uart_read_frame
+        self._rx_crc = CRC16()
+
+        # request reused for each received frame
+        self._rx_request = Request(interface=self)
+
         # timing of 1 character in microseconds (us)
         self._t1char = (1000000 * (data_bits + stop_bits + 2)) // baudrate
 
@@ -124,6 +141,9 @@ class Serial(CommonModbusFunctions):
         else:
             self._inter_frame_delay = 1750
 
+        # maximum time to wait for a response in microseconds (us)
+        self._resp_timeout = 120 * self._inter_frame_delay
+
     def _calculate_crc16(self, data: bytearray) -> bytes:
         """
         Calculates the CRC16.
@@ -134,12 +154,7 @@ class Serial(CommonModbusFunctions):
         :returns:   The crc 16.
         :rtype:     bytes
         """
-        crc = 0xFFFF
-
-        for char in data:
-            crc = (crc >> 8) ^ Const.CRC16_TABLE[((crc) ^ char) & 0xFF]
-
-        return struct.pack('<H', crc)
+        return struct.pack('<H', crc16(data))
 
     def _exit_read(self, response: bytearray) -> bool:
         """
@@ -156,7 +171,8 @@ class Serial(CommonModbusFunctions):
         if response_len >= 2 and response[1] >= Const.ERROR_BIAS:
             if response_len < Const.ERROR_RESP_LEN:
                 return False
-        elif response_len >= 3 and (Const.READ_COILS <= response[1] <= Const.READ_INPUT_REGISTER):
+        elif response_len >= 3 and (Const.READ_COILS <= response[1] <= Const.READ_INPUT_REGISTER or
+                                    response[1] == Const.READ_WRITE_MULTIPLE_REGISTERS):
             expected_len = Const.RESPONSE_HDR_LENGTH + 1 + response[2] + Const.CRC_LENGTH
             if response_len < expected_len:
                 return False
@@ -165,43 +181,126 @@ class Serial(CommonModbusFunctions):
 
         return True
 
-    def _uart_read(self) -> bytearray:
+    def _expected_resp_len(self, modbus_pdu: bytes) -> Optional[int]:
+        """
+        Get the length of the response to a request
+
+        :param      modbus_pdu:  The modbus Protocol Data Unit of the request
+        :type       modbus_pdu:  bytes
+
+        :returns:   Response length including slave address and CRC, None if
+                    unknown for this function code
+        :rtype:     Optional[int]
+        """
+        function_code = modbus_pdu[0]
+
+        if function_code in (Const.READ_COILS, Const.READ_DISCRETE_INPUTS):
+            quantity = (modbus_pdu[3] << 8) | modbus_pdu[4]
+            byte_count = (quantity + 7) // 8
+        elif function_code in (Const.READ_HOLDING_REGISTERS,
+                               Const.READ_INPUT_REGISTER,
+                               Const.READ_WRITE_MULTIPLE_REGISTERS):
+            quantity = (modbus_pdu[3] << 8) | modbus_pdu[4]
+            byte_count = quantity * 2
+        elif function_code in (Const.WRITE_SINGLE_COIL,
+                               Const.WRITE_SINGLE_REGISTER,
+                               Const.WRITE_MULTIPLE_COILS,
+                               Const.WRITE_MULTIPLE_REGISTERS):
+            return Const.FIXED_RESP_LEN
+        else:
+            return None
+
+        return Const.RESPONSE_HDR_LENGTH + 1 + byte_count + Const.CRC_LENGTH
+
+    def _uart_read(self,
+                   expected_len: Optional[int] = None,
+                   timeout: Optional[int] = None) -> bytearray:
         """
         Read incoming slave response from UART
 
+        The response is read into the preallocated receive buffer until the
+        expected amount of bytes or an exception response has been received.
+        If the length is unknown, the response is complete as soon as it is
+        valid according to :py:meth:`_exit_read` or no further byte has been
+        received within the inter-frame delay.
+
+        :param      expected_len:  The expected response length, see
+                                   :py:meth:`_expected_resp_len`
+        :type       expected_len:  Optional[int]
+        :param      timeout:       The response timeout in microseconds,
+                                   default the response timeout of the host
+        :type       timeout:       Optional[int]
+
         :returns:   Read content
         :rtype:     bytearray
         """
-        response = bytearray()
+        buf = self._rx_buf
+        view = self._rx_view
+        size = 0
+
+        if timeout is None:
+            timeout = self._resp_timeout
+
+        start_us = time.ticks_us()
+        last_byte_us = start_us
+
+        while True:
+            now_us = time.ticks_us()
 
-        # TODO: use some kind of hint or user-configurable delay
-        #       to determine this loop counter
-        for x in range(1, 120):
             if self._uart.any():
-                # WiPy only
-                # response.extend(self._uart.readall())
-                response.extend(self._uart.read())
+                count = self._uart.readinto(view[size:])
 
-                # variable length function codes may require multiple reads
-                if self._exit_read(response):
+                if count:
+                    size += count
+                    last_byte_us = time.ticks_us()
+
+                    if size >= 2 and buf[1] >= Const.ERROR_BIAS:
+                        expected_len = Const.ERROR_RESP_LEN
+
+                    if expected_len is not None:
+                        if size >= expected_len:
+                            break
+                    elif self._exit_read(view[:size]):
+                        break
+
+                    if size >= len(buf):
+                        break
+
+                    continue
+
+            if size == 0:
+                if time.ticks_diff(now_us, start_us) > timeout:
+                    break
+            elif expected_len is None:
+                # the frame ends after a silent interval of 3.5 characters
+                if time.ticks_diff(now_us, last_byte_us) > \
+                        self._inter_frame_delay:
                     break
+            elif time.ticks_diff(now_us, start_us) > timeout:
+                break
 
-            # wait for the maximum time between two frames
-            time.sleep_us(self._inter_frame_delay)
+            time.sleep_us(self._t1char)
 
-        return response
+        return buf[:size]
 
-    def _uart_read_frame(self, timeout: Optional[int] = None) -> bytearray:
+    def _uart_read_frame(self, timeout: Optional[int] = None) -> memoryview:
         """
         Read a Modbus frame
 
+        The frame is read into the preallocated receive buffer, the returned
+        memoryview is valid until the next frame is read.
+
         :param      timeout:  The timeout
         :type       timeout:  Optional[int]
 
         :returns:   Received message
-        :rtype:     bytearray
+        :rtype:     memoryview
         """
-        received_bytes = bytearray()
+        buf_len = len(self._rx_buf)
+        view = self._rx_view
+        size = 0
+        overflow = False
+        self._rx_crc.reset()
 
         # set default timeout to at twice the inter-frame delay
         if timeout == 0 or timeout is None:
@@ -219,25 +318,33 @@ class Serial(CommonModbusFunctions):
                 # do not stop reading and appending the result to the buffer
                 # until the time between two frames elapsed
                 while time.ticks_diff(time.ticks_us(), last_byte_ts) <= self._inter_frame_delay:
-                    # WiPy only
-                    # r = self._uart.readall()
-                    r = self._uart.read()
+                    if size < buf_len:
+                        count = self._uart.readinto(view[size:])
+                    else:
+                        # longer than any valid frame, drop the rest
+                        dropped = self._uart.read()
+                        count = None
+                        if dropped is not None:
+                            overflow = True
+                            last_byte_ts = time.ticks_us()
 
                     # if something has been read after the first iteration of
                     # this inner while loop (within self._inter_frame_delay)
-                    if r is not None:
-                        # append the new read stuff to the buffer
-                        received_bytes.extend(r)
+                    if count:
+                        self._rx_crc.update(view, size, size + count)
+                        size += count
 
                         # update the timestamp of the last byte being read
                         last_byte_ts = time.ticks_us()
 
             # if something has been read before the overall timeout is reached
-            if len(received_bytes) > 0:
-                return received_bytes
+            if overflow:
+                return view[:0]
+            if size > 0:
+                return view[:size]
 
         # return the result in case the overall timeout has been reached
-        return received_bytes
+        return view[:0]
 
     def _send(self, modbus_pdu: bytes, slave_addr: int) -> None:
         """
@@ -252,10 +359,25 @@ class Serial(CommonModbusFunctions):
         """
         # modbus_adu: Modbus Application Data Unit
         # consists of the Modbus PDU, with slave address prepended and checksum appended
-        modbus_adu = bytearray()
-        modbus_adu.append(slave_addr)
-        modbus_adu.extend(modbus_pdu)
-        modbus_adu.extend(self._calculate_crc16(modbus_adu))
+        size = len(modbus_pdu)
+        self._tx_buf[0] = slave_addr
+        self._tx_buf[1:1 + size] = modbus_pdu
+        self._send_adu(length=1 + size)
+
+    def _send_adu(self, length: int) -> None:
+        """
+        Append the checksum to the frame buffer content and send it via UART
+
+        If a flow control pin has been setup, it will be controlled accordingly
+
+        :param      length:  The length of the frame without checksum
+        :type       length:  int
+        """
+        buf = self._tx_buf
+        crc = crc16(buf, 0, length)
+        buf[length] = crc & 0xFF
+        buf[length + 1] = crc >> 8
+        modbus_adu = self._tx_view[:length + Const.CRC_LENGTH]
 
         if self._ctrlPin:
             self._ctrlPin.on()
@@ -292,7 +414,8 @@ class Serial(CommonModbusFunctions):
     def _send_receive(self,
                       modbus_pdu: bytes,
                       slave_addr: int,
-                      count: bool) -> bytes:
+                      count: bool,
+                      timeout: Optional[int] = None) -> bytes:
         """
         Send a modbus message and receive the reponse.
 
@@ -302,20 +425,66 @@ class Serial(CommonModbusFunctions):
         :type       slave_addr:  int
         :param      count:       The count
         :type       count:       bool
+        :param      timeout:     Maximum response timeout in milliseconds,
+                                 default the response timeout of the host
+        :type       timeout:     Optional[int]
 
         :returns:   Validated response content
         :rtype:     bytes
         """
+        if timeout is not None:
+            timeout = min(self._resp_timeout, timeout * 1000)
+
         # flush the Rx FIFO buffer
         self._uart.read()
 
         self._send(modbus_pdu=modbus_pdu, slave_addr=slave_addr)
 
-        return self._validate_resp_hdr(response=self._uart_read(),
+        response = self._uart_read(
+            expected_len=self._expected_resp_len(modbus_pdu=modbus_pdu),
+            timeout=timeout)
+
+        return self._validate_resp_hdr(response=response,
                                        slave_addr=slave_addr,
                                        function_code=modbus_pdu[0],
                                        count=count)
 
+    def send_receive_pdu(self, slave_addr: int, modbus_pdu: bytes) -> bytes:
+        """
+        Send a request and receive the response PDU as it is.
+
+        Exception responses of the slave are returned as well, e.g. to be
+        passed on by a gateway.
+
+        :param      slave_addr:  The slave address
+        :type       slave_addr:  int
+        :param      modbus_pdu:  The modbus Protocol Data Unit
+        :type       modbus_pdu:  bytes
+
+        :raise      OSError:     No or invalid response received
+        :raise      ValueError:  Response of a wrong slave
+        :returns:   The response Protocol Data Unit
+        :rtype:     bytes
+        """
+        # flush the Rx FIFO buffer
+        self._uart.read()
+
+        self._send(modbus_pdu=modbus_pdu, slave_addr=slave_addr)
+
+        response = self._uart_read(
+            expected_len=self._expected_resp_len(modbus_pdu=modbus_pdu))
+
+        if len(response) < Const.ERROR_RESP_LEN:
+            raise ResponseTimeoutError('no data received from slave')
+
+        if crc16(response) != 0:
+            raise CRCError('invalid response CRC')
+
+        if response[0] != slave_addr:
+            raise ResponseMismatchError('wrong slave address')
+
+        return bytes(response[1:len(response) - Const.CRC_LENGTH])
+
     def _validate_resp_hdr(self,
                            response: bytearray,
                            slave_addr: int,
@@ -337,23 +506,17 @@ class Serial(CommonModbusFunctions):
         :rtype:     bytes
         """
         if len(response) == 0:
-            raise OSError('no data received from slave')
-
-        resp_crc = response[-Const.CRC_LENGTH:]
-        expected_crc = self._calculate_crc16(
-            response[0:len(response) - Const.CRC_LENGTH]
-        )
+            raise ResponseTimeoutError('no data received from slave')
 
-        if ((resp_crc[0] is not expected_crc[0]) or
-                (resp_crc[1] is not expected_crc[1])):
-            raise OSError('invalid response CRC')
+        # the CRC over the response including its CRC is 0 if valid
+        if crc16(response) != 0:
+            raise CRCError('invalid response CRC')
 
         if (response[0] != slave_addr):
-            raise ValueError('wrong slave address')
+            raise ResponseMismatchError('wrong slave address')
 
         if (response[1] == (function_code + Const.ERROR_BIAS)):
-            raise ValueError('slave returned exception code: {:d}'.
-                             format(response[2]))
+            raise SlaveExceptionError(exception_code=response[2])
 
         hdr_length = (Const.RESPONSE_HDR_LENGTH + 1) if count else \
             Const.RESPONSE_HDR_LENGTH
@@ -396,6 +559,49 @@ class Serial(CommonModbusFunctions):
         )
         self._send(modbus_pdu=modbus_pdu, slave_addr=slave_addr)
 
+    def send_bank_response(self,
+                           slave_addr: int,
+                           function_code: int,
+                           request_register_addr: int,
+                           request_register_qty: int,
+                           bank) -> None:
+        """
+        Send a read response encoded directly from a register bank.
+
+        Header and register content are written into the preallocated frame
+        buffer without creating intermediate lists or bytes.
+
+        :param      slave_addr:             The slave address
+        :type       slave_addr:             int
+        :param      function_code:          The function code
+        :type       function_code:          int
+        :param      request_register_addr:  The request register address
+        :type       request_register_addr:  int
+        :param      request_register_qty:   The request register qty
+        :type       request_register_qty:   int
+        :param      bank:                   The bank containing the registers
+        :type       bank:                   Union[BitBank, RegisterBank]
+        """
+        byte_count = bank.encode_into(self._tx_buf,
+                                      3,
+                                      request_register_addr,
+                                      request_register_qty)
+        self._tx_buf[0] = slave_addr
+        self._tx_buf[1] = function_code
+        self._tx_buf[2] = byte_count
+        self._send_adu(length=3 + byte_count)
+
+    def send_pdu_response(self, slave_addr: int, modbus_pdu: bytes) -> None:
+        """
+        Send an already encoded response to a client.
+
+        :param      slave_addr:  The slave address
+        :type       slave_addr:  int
+        :param      modbus_pdu:  The response Protocol Data Unit
+        :type       modbus_pdu:  bytes
+        """
+        self._send(modbus_pdu=modbus_pdu, slave_addr=slave_addr)
+
     def send_exception_response(self,
                                 slave_addr: int,
                                 function_code: int,
@@ -437,15 +643,14 @@ class Serial(CommonModbusFunctions):
         if req[0] not in unit_addr_list:
             return None
 
-        req_crc = req[-Const.CRC_LENGTH:]
-        req_no_crc = req[:-Const.CRC_LENGTH]
-        expected_crc = self._calculate_crc16(req_no_crc)
-
-        if (req_crc[0] != expected_crc[0]) or (req_crc[1] != expected_crc[1]):
+        # calculated by _uart_read_frame while receiving the request
+        if not self._rx_crc.valid:
             return None
 
+        req_no_crc = req[:-Const.CRC_LENGTH]
+
         try:
-            request = Request(interface=self, data=req_no_crc)
+            request = self._rx_request.parse(req_no_crc)
         except ModbusException as e:
             self.send_exception_response(
                 slave_addr=req[0],
@@ -10,6 +10,8 @@
 
 # system packages
 # import random
+import errno
+import select
 import struct
 import socket
 import time
@@ -19,10 +21,12 @@ from . import functions
 from . import const as Const
 from .common import Request, CommonModbusFunctions
 from .common import ModbusException
+from .common import ResponseTimeoutError
+from .common import ResponseMismatchError, SlaveExceptionError
 from .modbus import Modbus
 
 # typing not natively supported on MicroPython
-from .typing import Optional, Tuple, Union
+from .typing import Any, List, Optional, Tuple, Union
 
 
 class ModbusTCP(Modbus):
@@ -37,7 +41,8 @@ class ModbusTCP(Modbus):
     def bind(self,
              local_ip: str,
              local_port: int = 502,
-             max_connections: int = 10) -> None:
+             max_connections: int = 10,
+             multi_client: bool = False) -> None:
         """
         Bind IP and port for incomming requests
 
@@ -47,8 +52,10 @@ class ModbusTCP(Modbus):
         :type       local_port:       int
         :param      max_connections:  Number of maximum connections
         :type       max_connections:  int
+        :param      multi_client:     Flag to serve several clients at once
+        :type       multi_client:     bool
         """
-        self._itf.bind(local_ip, local_port, max_connections)
+        self._itf.bind(local_ip, local_port, max_connections, multi_client)
 
     def get_bound_status(self) -> bool:
         """
@@ -63,29 +70,329 @@ class ModbusTCP(Modbus):
             return False
 
 
+class MBAPBuffer(object):
+    """
+    Receive buffer of a stream socket, reassembling Modbus TCP frames
+
+    A single ``recv`` may return a partial frame or several concatenated
+    frames. The received data is collected and complete Modbus Application
+    Data Units are extracted by the length field of their MBAP header, any
+    remaining data is kept for the next frame.
+    """
+    def __init__(self) -> None:
+        self._data = b''
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        """Drop all received data"""
+        self._data = b''
+
+    def feed(self, data: bytes) -> None:
+        """
+        Append received data to the buffer.
+
+        :param      data:  The received data
+        :type       data:  bytes
+        """
+        self._data += data
+
+    def _adu_length(self) -> int:
+        """
+        Get the length of the first ADU in the buffer.
+
+        :returns:   The ADU length, 0 if the MBAP header is not complete yet
+        :rtype:     int
+
+        :raise      ValueError:  Invalid length field of the MBAP header
+        """
+        if len(self._data) < Const.MBAP_HDR_LENGTH - 1:
+            return 0
+
+        length = struct.unpack_from('>H', self._data, 4)[0]
+
+        # the length field counts the unit identifier and the PDU
+        if not (2 <= length <= Const.MAX_PDU_LENGTH + 1):
+            raise ValueError('Invalid MBAP length {}'.format(length))
+
+        return Const.MBAP_HDR_LENGTH - 1 + length
+
+    def has_adu(self) -> bool:
+        """
+        Check whether a complete ADU has been received.
+
+        An invalid MBAP header is reported as well, :py:meth:`pop_adu` raises
+        the error in this case.
+
+        :returns:   True if a complete ADU or an invalid header is in the
+                    buffer
+        :rtype:     bool
+        """
+        try:
+            adu_length = self._adu_length()
+        except ValueError:
+            return True
+
+        return adu_length > 0 and len(self._data) >= adu_length
+
+    def pop_adu(self) -> Optional[bytes]:
+        """
+        Remove the first complete ADU from the buffer.
+
+        :returns:   The ADU, None if no complete ADU has been received yet
+        :rtype:     Optional[bytes]
+
+        :raise      ValueError:  Invalid length field of the MBAP header
+        """
+        adu_length = self._adu_length()
+
+        if adu_length == 0 or len(self._data) < adu_length:
+            return None
+
+        adu = self._data[:adu_length]
+        self._data = self._data[adu_length:]
+
+        return adu
+
+
+class TCPRequest(object):
+    """
+    Handle of a request sent by the TCP host
+
+    :param      host:           The TCP host which sent the request
+    :type       host:           TCP
+    :param      trans_id:       The transaction ID
+    :type       trans_id:       int
+    :param      slave_addr:     The slave address
+    :type       slave_addr:     int
+    :param      function_code:  The function code
+    :type       function_code:  int
+    :param      count:          Flag whether the response contains a count
+    :type       count:          bool
+    :param      quantity:       Quantity of requested registers, None to
+                                return the raw response content
+    :type       quantity:       Optional[int]
+    :param      signed:         Indicates if signed
+    :type       signed:         bool
+    """
+    def __init__(self,
+                 host: 'TCP',
+                 trans_id: int,
+                 slave_addr: int,
+                 function_code: int,
+                 count: bool,
+                 quantity: Optional[int] = None,
+                 signed: bool = True) -> None:
+        self._host = host
+        self.trans_id = trans_id
+        self.slave_addr = slave_addr
+        self.function_code = function_code
+        self.count = count
+        self.quantity = quantity
+        self.signed = signed
+        self.done = False
+        self._value = None
+        self._error = None
+
+    def _complete(self, response: bytes) -> None:
+        """
+        Validate and decode the response of this request
+
+        :param      response:  The complete response ADU
+        :type       response:  bytes
+        """
+        try:
+            data = self._host._validate_resp_hdr(
+                response=response,
+                trans_id=self.trans_id,
+                slave_addr=self.slave_addr,
+                function_code=self.function_code,
+                count=self.count)
+
+            if self.quantity is None:
+                self._value = data
+            elif self.function_code in [Const.READ_COILS,
+                                        Const.READ_DISCRETE_INPUTS]:
+                self._value = functions.bytes_to_bool(byte_list=data,
+                                                      bit_qty=self.quantity)
+            else:
+                self._value = functions.to_short(byte_array=data,
+                                                 signed=self.signed)
+        except Exception as e:
+            self._error = e
+
+        self.done = True
+
+    def result(self) -> Any:
+        """
+        Get the result of the request, wait for the response if necessary
+
+        :returns:   The decoded response
+        :rtype:     Any
+
+        :raise      ValueError:  Invalid response or slave exception
+        :raise      OSError:     No response within the socket timeout
+        """
+        try:
+            while not self.done:
+                self._host._receive()
+        except Exception as e:
+            self._host._pending.pop(self.trans_id, None)
+            self._error = e
+            self.done = True
+
+        if self._error is not None:
+            raise self._error
+
+        return self._value
+
+
 class TCP(CommonModbusFunctions):
     """
     TCP class handling socket connections and parsing the Modbus data
 
-    :param      slave_ip:    IP of this device listening for requests
-    :type       slave_ip:    str
-    :param      slave_port:  Port of this device
-    :type       slave_port:  int
-    :param      timeout:     Socket timeout in seconds
-    :type       timeout:     float
+    Requests can be pipelined by :py:meth:`submit` and :py:meth:`read_many`,
+    sending up to ``max_in_flight`` requests before the first response is
+    received. Responses are matched to their requests by the transaction ID.
+
+    A connection closed by the slave or failing with any other error than a
+    timeout is closed and connected again on the next request. After a failed
+    connection attempt, further attempts fail immediately for the backoff
+    time, doubled on every further failure up to ``max_backoff``.
+
+    :param      slave_ip:       IP of this device listening for requests
+    :type       slave_ip:       str
+    :param      slave_port:     Port of this device
+    :type       slave_port:     int
+    :param      timeout:        Socket timeout in seconds
+    :type       timeout:        float
+    :param      max_in_flight:  Maximum number of unanswered requests
+    :type       max_in_flight:  int
+    :param      lazy:           Flag to connect on the first request instead
+                                of connecting immediately
+    :type       lazy:           bool
+    :param      backoff:        Initial reconnect backoff time in milliseconds
+    :type       backoff:        int
+    :param      max_backoff:    Maximum reconnect backoff time in milliseconds
+    :type       max_backoff:    int
     """
     def __init__(self,
                  slave_ip: str,
                  slave_port: int = 502,
-                 timeout: float = 5.0):
-        self._sock = socket.socket()
+                 timeout: float = 5.0,
+                 max_in_flight: int = 1,
+                 lazy: bool = False,
+                 backoff: int = 1000,
+                 max_backoff: int = 30000):
+        self._sock = None
+        self._slave_ip = slave_ip
+        self._slave_port = slave_port
+        self._sock_addr = None
+        self._timeout = timeout
         self.trans_id_ctr = 0
+        self.max_in_flight = max_in_flight
 
-        # print(socket.getaddrinfo(slave_ip, slave_port))
-        # [(2, 1, 0, '192.168.178.47', ('192.168.178.47', 502))]
-        self._sock.connect(socket.getaddrinfo(slave_ip, slave_port)[0][-1])
+        # outstanding requests by transaction ID
+        self._pending = dict()
+        self._rx_buffer = MBAPBuffer()
+
+        # failed connection attempts and time of the next attempt
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._failures = 0
+        self._retry_at = 0
+        self.connects = 0
+
+        if not lazy:
+            self.connect()
+
+    @property
+    def is_connected(self) -> bool:
+        """
+        Get the connection status.
+
+        :returns:   True if connected, False otherwise
+        :rtype:     bool
+        """
+        return self._sock is not None
+
+    def connect(self) -> None:
+        """
+        Connect to the slave, if not connected already.
+
+        :raise      OSError:  Connection failed or reconnect backoff time not
+                              elapsed yet
+        """
+        if self._sock is not None:
+            return
+
+        now = time.ticks_ms()
+        if self._failures and time.ticks_diff(self._retry_at, now) > 0:
+            raise OSError('{}:{} unreachable, next attempt in {} ms'.format(
+                self._slave_ip,
+                self._slave_port,
+                time.ticks_diff(self._retry_at, now)))
 
-        self._sock.settimeout(timeout)
+        sock = socket.socket()
+        try:
+            if self._sock_addr is None:
+                # print(socket.getaddrinfo(slave_ip, slave_port))
+                # [(2, 1, 0, '192.168.178.47', ('192.168.178.47', 502))]
+                self._sock_addr = socket.getaddrinfo(self._slave_ip,
+                                                     self._slave_port)[0][-1]
+            sock.settimeout(self._timeout)
+            sock.connect(self._sock_addr)
+        except OSError as e:
+            sock.close()
+            self._failures += 1
+            backoff = self._backoff * (1 << min(self._failures - 1, 15))
+            if backoff > self._max_backoff:
+                backoff = self._max_backoff
+            self._retry_at = time.ticks_add(now, backoff)
+            raise e
+
+        self._sock = sock
+        self._failures = 0
+        self._rx_buffer.clear()
+        self.connects += 1
+
+    def close(self, error: Optional[Exception] = None) -> None:
+        """
+        Close the connection, all unanswered requests fail.
+
+        :param      error:  The error of the unanswered requests
+        :type       error:  Optional[Exception]
+        """
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+        self._rx_buffer.clear()
+
+        if error is None:
+            error = OSError('connection closed')
+
+        pending = self._pending
+        self._pending = dict()
+        for request in pending.values():
+            request._error = error
+            request.done = True
+
+    @staticmethod
+    def _is_timeout(error: OSError) -> bool:
+        """
+        Check if a socket error is a timeout.
+
+        :param      error:  The error
+        :type       error:  OSError
+
+        :returns:   True if the error is a timeout
+        :rtype:     bool
+        """
+        return (isinstance(error, getattr(socket, 'timeout', ())) or
+                (len(error.args) > 0 and
+                 error.args[0] in (errno.ETIMEDOUT, errno.EAGAIN)))
 
     def _create_mbap_hdr(self,
                          slave_addr: int,
@@ -107,7 +414,7 @@ class TCP(CommonModbusFunctions):
         # trans_id = random.getrandbits(24) & 0xFFFF
         # use incrementing counter as it's faster
         trans_id = self.trans_id_ctr
-        self.trans_id_ctr += 1
+        self.trans_id_ctr = (self.trans_id_ctr + 1) & 0xFFFF
 
         mbap_hdr = struct.pack(
             '>HHHB', trans_id, 0, len(modbus_pdu) + 1, slave_addr)
@@ -141,17 +448,17 @@ class TCP(CommonModbusFunctions):
             '>HHHBB', response[:Const.MBAP_HDR_LENGTH + 1])
 
         if (trans_id != rec_tid):
-            raise ValueError('wrong transaction ID')
+            raise ResponseMismatchError('wrong transaction ID')
 
         if (rec_pid != 0):
-            raise ValueError('invalid protocol ID')
+            raise ResponseMismatchError('invalid protocol ID')
 
         if (slave_addr != rec_uid):
-            raise ValueError('wrong slave ID')
+            raise ResponseMismatchError('wrong slave ID')
 
         if (rec_fc == (function_code + Const.ERROR_BIAS)):
-            raise ValueError('slave returned exception code: {:d}'.
-                             format(rec_fc))
+            raise SlaveExceptionError(
+                exception_code=response[Const.MBAP_HDR_LENGTH + 1])
 
         hdr_length = (Const.MBAP_HDR_LENGTH + 2) if count else \
             (Const.MBAP_HDR_LENGTH + 1)
@@ -161,7 +468,8 @@ class TCP(CommonModbusFunctions):
     def _send_receive(self,
                       slave_addr: int,
                       modbus_pdu: bytes,
-                      count: bool) -> bytes:
+                      count: bool,
+                      timeout: Optional[int] = None) -> bytes:
         """
         Send a modbus message and receive the reponse.
 
@@ -171,31 +479,450 @@ class TCP(CommonModbusFunctions):
         :type       modbus_pdu:  bytes
         :param      count:       The count
         :type       count:       bool
+        :param      timeout:     Maximum response timeout in milliseconds,
+                                 default the socket timeout
+        :type       timeout:     Optional[int]
 
         :returns:   Modbus data
         :rtype:     bytes
         """
+        request = self._submit(slave_addr=slave_addr,
+                               modbus_pdu=modbus_pdu,
+                               count=count)
+
+        return self._wait(request=request, timeout=timeout)
+
+    def _wait(self, request: TCPRequest, timeout: Optional[int] = None) -> Any:
+        """
+        Wait for the result of a sent request.
+
+        :param      request:  The request
+        :type       request:  TCPRequest
+        :param      timeout:  Maximum response timeout in milliseconds,
+                              default the socket timeout
+        :type       timeout:  Optional[int]
+
+        :returns:   The result of the request
+        :rtype:     Any
+        """
+        if timeout is None or self._sock is None or request.done:
+            return request.result()
+
+        self._sock.settimeout(min(self._timeout, timeout / 1000))
+        try:
+            return request.result()
+        finally:
+            if self._sock is not None:
+                self._sock.settimeout(self._timeout)
+
+    def _submit(self,
+                slave_addr: int,
+                modbus_pdu: bytes,
+                count: bool,
+                quantity: Optional[int] = None,
+                signed: bool = True) -> TCPRequest:
+        """
+        Send a modbus message without waiting for the response.
+
+        If the maximum number of unanswered requests is reached, responses
+        are received until a slot is available again.
+
+        :param      slave_addr:  The slave identifier
+        :type       slave_addr:  int
+        :param      modbus_pdu:  The modbus PDU
+        :type       modbus_pdu:  bytes
+        :param      count:       The count
+        :type       count:       bool
+        :param      quantity:    Quantity of requested registers, None to
+                                 return the raw response content
+        :type       quantity:    Optional[int]
+        :param      signed:      Indicates if signed
+        :type       signed:      bool
+
+        :returns:   Handle of the sent request
+        :rtype:     TCPRequest
+        """
+        while len(self._pending) >= max(1, self.max_in_flight):
+            pending = next(iter(self._pending.values()))
+            try:
+                pending.result()
+            except Exception:
+                # the error is raised again on getting the result
+                pass
+
         mbap_hdr, trans_id = self._create_mbap_hdr(slave_addr=slave_addr,
                                                    modbus_pdu=modbus_pdu)
-        self._sock.send(mbap_hdr + modbus_pdu)
+        request = TCPRequest(host=self,
+                             trans_id=trans_id,
+                             slave_addr=slave_addr,
+                             function_code=modbus_pdu[0],
+                             count=count,
+                             quantity=quantity,
+                             signed=signed)
+        self.connect()
+        self._pending[trans_id] = request
+
+        try:
+            self._sock.send(mbap_hdr + modbus_pdu)
+        except OSError as e:
+            # connection is dead, reconnect on the next request
+            self.close(error=e)
 
-        response = self._sock.recv(256)
-        modbus_data = self._validate_resp_hdr(response=response,
-                                              trans_id=trans_id,
-                                              slave_addr=slave_addr,
-                                              function_code=modbus_pdu[0],
-                                              count=count)
+        return request
 
-        return modbus_data
+    def _receive(self) -> None:
+        """
+        Receive data and complete all requests with a complete response
+
+        :raise      OSError:  Connection closed or socket timeout
+        """
+        if self._sock is None:
+            raise OSError('not connected')
+
+        try:
+            data = self._sock.recv(256)
+        except OSError as e:
+            if self._is_timeout(e):
+                raise ResponseTimeoutError('no response received from slave')
+            self.close(error=e)
+            raise e
+
+        if not data:
+            error = OSError('connection closed by slave')
+            self.close(error=error)
+            raise error
+
+        self._rx_buffer.feed(data)
+
+        while True:
+            try:
+                response = self._rx_buffer.pop_adu()
+            except ValueError as e:
+                self._rx_buffer.clear()
+                raise e
+
+            if response is None:
+                break
+
+            trans_id = struct.unpack_from('>H', response, 0)[0]
+            request = self._pending.pop(trans_id, None)
+            if request is not None:
+                request._complete(response)
+
+    def submit(self,
+               slave_addr: int,
+               function_code: int,
+               starting_addr: int,
+               quantity: int,
+               signed: bool = True) -> TCPRequest:
+        """
+        Send a read request without waiting for the response.
+
+        :param      slave_addr:     The slave address
+        :type       slave_addr:     int
+        :param      function_code:  The read function code, 0x01 to 0x04
+        :type       function_code:  int
+        :param      starting_addr:  The starting address
+        :type       starting_addr:  int
+        :param      quantity:       The amount of coils or registers to read
+        :type       quantity:       int
+        :param      signed:         Indicates if signed, registers only
+        :type       signed:         bool
+
+        :returns:   Handle of the request, use its ``result`` function to get
+                    the read coil states or register values
+        :rtype:     TCPRequest
+
+        :raise      ValueError:  Function code is not a read function code
+        """
+        if function_code == Const.READ_COILS:
+            modbus_pdu = functions.read_coils(
+                starting_address=starting_addr,
+                quantity=quantity)
+        elif function_code == Const.READ_DISCRETE_INPUTS:
+            modbus_pdu = functions.read_discrete_inputs(
+                starting_address=starting_addr,
+                quantity=quantity)
+        elif function_code == Const.READ_HOLDING_REGISTERS:
+            modbus_pdu = functions.read_holding_registers(
+                starting_address=starting_addr,
+                quantity=quantity)
+        elif function_code == Const.READ_INPUT_REGISTER:
+            modbus_pdu = functions.read_input_registers(
+                starting_address=starting_addr,
+                quantity=quantity)
+        else:
+            raise ValueError('Function code {} can not be submitted'.
+                             format(function_code))
+
+        return self._submit(slave_addr=slave_addr,
+                            modbus_pdu=modbus_pdu,
+                            count=True,
+                            quantity=quantity,
+                            signed=signed)
+
+    def read_many(self,
+                  requests: List[Tuple[int, int, int, int]],
+                  signed: bool = True) -> list:
+        """
+        Send several read requests pipelined and collect their results.
+
+        The retry policy of the host applies to each request as to a single
+        read, failed requests are sent again one after the other. The
+        deadline of the policy starts with sending all requests and limits
+        the response timeout of each further attempt.
+
+        :param      requests:  The requests as tuples of slave address,
+                               function code, starting address and quantity
+        :type       requests:  List[Tuple[int, int, int, int]]
+        :param      signed:    Indicates if signed, registers only
+        :type       signed:    bool
+
+        :returns:   The read coil states or register values of each request
+        :rtype:     list
+
+        :raise      ValueError:  Invalid response or slave exception
+        :raise      OSError:     No response within the socket timeout
+        """
+        policy = self._retry_policy
+        start = time.ticks_ms()
+        handles = list()
+
+        for slave_addr, function_code, starting_addr, quantity in requests:
+            if policy is not None:
+                policy.start_attempt(start=start)
+            handles.append(self.submit(slave_addr=slave_addr,
+                                       function_code=function_code,
+                                       starting_addr=starting_addr,
+                                       quantity=quantity,
+                                       signed=signed))
+
+        if policy is None:
+            return [handle.result() for handle in handles]
+
+        results = list()
+        for handle, request in zip(handles, requests):
+            retry = 0
+            # the pipelined attempt waits for the socket timeout
+            timeout = None
+
+            while True:
+                try:
+                    results.append(self._wait(request=handle,
+                                              timeout=timeout))
+                    break
+                except Exception as e:
+                    retry += 1
+                    delay = policy.retry_delay(error=e,
+                                               retry=retry,
+                                               start=start)
+
+                if delay:
+                    time.sleep_ms(delay)
+
+                timeout = policy.start_attempt(start=start)
+                handle = self.submit(slave_addr=request[0],
+                                     function_code=request[1],
+                                     starting_addr=request[2],
+                                     quantity=request[3],
+                                     signed=signed)
+
+        return results
+
+
+class TCPConnectionPool(object):
+    """
+    Shared connections of TCP hosts by IP and port
+
+    All slaves behind the same IP and port, e.g. several unit identifiers of
+    a gateway, are requested by the same lazily connected :py:class:`TCP`
+    host, which connects again after the connection failed.
+
+    :param      timeout:        Socket timeout in seconds
+    :type       timeout:        float
+    :param      max_in_flight:  Maximum number of unanswered requests of each
+                                connection
+    :type       max_in_flight:  int
+    :param      backoff:        Initial reconnect backoff time in milliseconds
+    :type       backoff:        int
+    :param      max_backoff:    Maximum reconnect backoff time in milliseconds
+    :type       max_backoff:    int
+    """
+    def __init__(self,
+                 timeout: float = 5.0,
+                 max_in_flight: int = 1,
+                 backoff: int = 1000,
+                 max_backoff: int = 30000) -> None:
+        self._timeout = timeout
+        self._max_in_flight = max_in_flight
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+
+        # TCP host by IP and port
+        self._hosts = dict()
+
+    def __len__(self) -> int:
+        return len(self._hosts)
+
+    def get(self, slave_ip: str, slave_port: int = 502) -> TCP:
+        """
+        Get the host of an IP and port, created on the first call.
+
+        The host connects on its first request.
+
+        :param      slave_ip:    IP of the slave
+        :type       slave_ip:    str
+        :param      slave_port:  Port of the slave
+        :type       slave_port:  int
+
+        :returns:   The host
+        :rtype:     TCP
+        """
+        key = (slave_ip, slave_port)
+        host = self._hosts.get(key)
+
+        if host is None:
+            host = TCP(slave_ip=slave_ip,
+                       slave_port=slave_port,
+                       timeout=self._timeout,
+                       max_in_flight=self._max_in_flight,
+                       lazy=True,
+                       backoff=self._backoff,
+                       max_backoff=self._max_backoff)
+            self._hosts[key] = host
+
+        return host
+
+    def close(self,
+              slave_ip: Optional[str] = None,
+              slave_port: int = 502) -> None:
+        """
+        Close and remove the host of an IP and port, or all hosts.
+
+        :param      slave_ip:    IP of the slave, None to close all hosts
+        :type       slave_ip:    Optional[str]
+        :param      slave_port:  Port of the slave
+        :type       slave_port:  int
+        """
+        if slave_ip is None:
+            keys = list(self._hosts.keys())
+        else:
+            keys = [(slave_ip, slave_port)]
+
+        for key in keys:
+            host = self._hosts.pop(key, None)
+            if host is not None:
+                host.close()
+
+
+class TCPConnection(object):
+    """
+    Client connection of a Modbus TCP host
+
+    Each connection reuses its own request for the frames of its client, a
+    request stays valid while requests of other clients are received. The
+    responses to a request are sent to its client with the transaction ID of
+    the request.
+
+    :param      server:   The host which accepted the connection
+    :type       server:   TCPServer
+    :param      sock:     The client socket, the stream writer of an
+                          asynchronous host
+    :type       sock:     socket.socket
+    :param      address:  The client address
+    :type       address:  tuple
+    """
+    def __init__(self,
+                 server: 'TCPServer',
+                 sock: socket.socket,
+                 address: tuple) -> None:
+        self._server = server
+        self.sock = sock
+        self.address = address
+        # transaction ID of the latest request of this client
+        self.tid = 0
+        # received data not processed yet
+        self.rx_buffer = MBAPBuffer()
+        # request reused for each received frame of this client
+        self.request = Request(self)
+
+    def send_response(self,
+                      slave_addr: int,
+                      function_code: int,
+                      request_register_addr: int,
+                      request_register_qty: int,
+                      request_data: list,
+                      values: Optional[list] = None,
+                      signed: bool = True) -> None:
+        """
+        Send a response to this client, see :py:meth:`TCPServer.send_response`
+        """
+        self._server.send_response(slave_addr,
+                                   function_code,
+                                   request_register_addr,
+                                   request_register_qty,
+                                   request_data,
+                                   values,
+                                   signed,
+                                   connection=self)
+
+    def send_bank_response(self,
+                           slave_addr: int,
+                           function_code: int,
+                           request_register_addr: int,
+                           request_register_qty: int,
+                           bank) -> None:
+        """
+        Send a read response encoded directly from a register bank to this
+        client, see :py:meth:`TCPServer.send_bank_response`
+        """
+        self._server.send_bank_response(slave_addr,
+                                        function_code,
+                                        request_register_addr,
+                                        request_register_qty,
+                                        bank,
+                                        connection=self)
+
+    def send_pdu_response(self, slave_addr: int, modbus_pdu: bytes) -> None:
+        """
+        Send an already encoded response to this client, see
+        :py:meth:`TCPServer.send_pdu_response`
+        """
+        self._server.send_pdu_response(slave_addr,
+                                       modbus_pdu,
+                                       connection=self)
+
+    def send_exception_response(self,
+                                slave_addr: int,
+                                function_code: int,
+                                exception_code: int) -> None:
+        """
+        Send an exception response to this client, see
+        :py:meth:`TCPServer.send_exception_response`
+        """
+        self._server.send_exception_response(slave_addr,
+                                             function_code,
+                                             exception_code,
+                                             connection=self)
 
 
 class TCPServer(object):
     """Modbus TCP host class"""
     def __init__(self):
         self._sock = None
-        self._client_sock = None
+        # connection of the latest received request
+        self._connection = None
         self._is_bound = False
 
+        # multi client mode, see bind
+        self._poll = None
+        self._connections = dict()
+        self._max_connections = 0
+
+        # preallocated response buffer for MBAP header and PDU
+        self._tx_buf = bytearray(Const.MBAP_HDR_LENGTH + Const.MAX_PDU_LENGTH)
+        self._tx_view = memoryview(self._tx_buf)
+
     @property
     def is_bound(self) -> bool:
         """
@@ -218,19 +945,32 @@ class TCPServer(object):
     def bind(self,
              local_ip: str,
              local_port: int = 502,
-             max_connections: int = 10):
+             max_connections: int = 10,
+             multi_client: bool = False):
         """
         Bind IP and port for incomming requests
 
+        By default only the latest connected client is served, a new client
+        connection closes the previous one. In multi client mode up to
+        ``max_connections`` clients stay connected and all their sockets are
+        polled for requests.
+
         :param      local_ip:         IP of this device listening for requests
         :type       local_ip:         str
         :param      local_port:       Port of this device
         :type       local_port:       int
         :param      max_connections:  Number of maximum connections
         :type       max_connections:  int
+        :param      multi_client:     Flag to serve several clients at once
+        :type       multi_client:     bool
         """
-        if self._client_sock:
-            self._client_sock.close()
+        if self._connection is not None:
+            self._connection.sock.close()
+            self._connection = None
+
+        for connection in self._connections.values():
+            connection.sock.close()
+        self._connections = dict()
 
         if self._sock:
             self._sock.close()
@@ -243,9 +983,19 @@ class TCPServer(object):
 
         self._sock.listen(max_connections)
 
+        if multi_client:
+            self._max_connections = max_connections
+            self._poll = select.poll()
+            self._poll.register(self._sock, select.POLLIN)
+        else:
+            self._poll = None
+
         self._is_bound = True
 
-    def _send(self, modbus_pdu: bytes, slave_addr: int) -> None:
+    def _send(self,
+              modbus_pdu: bytes,
+              slave_addr: int,
+              connection: Optional[TCPConnection] = None) -> None:
         """
         Send Modbus Protocol Data Unit to slave
 
@@ -253,11 +1003,31 @@ class TCPServer(object):
         :type       modbus_pdu:  bytes
         :param      slave_addr:  The slave address
         :type       slave_addr:  int
+        :param      connection:  The connection of the request, default the
+                                 connection of the latest request
+        :type       connection:  Optional[TCPConnection]
         """
+        if connection is None:
+            connection = self._connection
+
         size = len(modbus_pdu)
-        fmt = 'B' * size
-        adu = struct.pack('>HHHB' + fmt, self._req_tid, 0, size + 1, slave_addr, *modbus_pdu)
-        self._client_sock.send(adu)
+        struct.pack_into('>HHHB', self._tx_buf, 0,
+                         connection.tid, 0, size + 1, slave_addr)
+        self._tx_buf[Const.MBAP_HDR_LENGTH:Const.MBAP_HDR_LENGTH + size] = \
+            modbus_pdu
+        self._send_adu(length=Const.MBAP_HDR_LENGTH + size,
+                       connection=connection)
+
+    def _send_adu(self, length: int, connection: TCPConnection) -> None:
+        """
+        Send the Modbus Application Data Unit of the frame buffer to the client
+
+        :param      length:      The length of the ADU
+        :type       length:      int
+        :param      connection:  The connection of the client
+        :type       connection:  TCPConnection
+        """
+        connection.sock.send(self._tx_view[:length])
 
     def send_response(self,
                       slave_addr: int,
@@ -266,7 +1036,8 @@ class TCPServer(object):
                       request_register_qty: int,
                       request_data: list,
                       values: Optional[list] = None,
-                      signed: bool = True) -> None:
+                      signed: bool = True,
+                      connection: Optional[TCPConnection] = None) -> None:
         """
         Send a response to a client.
 
@@ -284,6 +1055,10 @@ class TCPServer(object):
         :type       values:                 Optional[list]
         :param      signed:                 Indicates if signed
         :type       signed:                 bool
+        :param      connection:             The connection of the request,
+                                            default the connection of the
+                                            latest request
+        :type       connection:             Optional[TCPConnection]
         """
         modbus_pdu = functions.response(function_code,
                                         request_register_addr,
@@ -291,12 +1066,72 @@ class TCPServer(object):
                                         request_data,
                                         values,
                                         signed)
-        self._send(modbus_pdu, slave_addr)
+        self._send(modbus_pdu, slave_addr, connection)
+
+    def send_bank_response(self,
+                           slave_addr: int,
+                           function_code: int,
+                           request_register_addr: int,
+                           request_register_qty: int,
+                           bank,
+                           connection: Optional[TCPConnection] = None) -> None:
+        """
+        Send a read response encoded directly from a register bank.
+
+        Header and register content are written into the preallocated
+        response buffer without creating intermediate lists or bytes.
+
+        :param      slave_addr:             The slave address
+        :type       slave_addr:             int
+        :param      function_code:          The function code
+        :type       function_code:          int
+        :param      request_register_addr:  The request register address
+        :type       request_register_addr:  int
+        :param      request_register_qty:   The request register qty
+        :type       request_register_qty:   int
+        :param      bank:                   The bank containing the registers
+        :type       bank:                   Union[BitBank, RegisterBank]
+        :param      connection:             The connection of the request,
+                                            default the connection of the
+                                            latest request
+        :type       connection:             Optional[TCPConnection]
+        """
+        if connection is None:
+            connection = self._connection
+
+        byte_count = bank.encode_into(self._tx_buf,
+                                      Const.MBAP_HDR_LENGTH + 2,
+                                      request_register_addr,
+                                      request_register_qty)
+        struct.pack_into('>HHHBBB', self._tx_buf, 0,
+                         connection.tid, 0, byte_count + 3, slave_addr,
+                         function_code, byte_count)
+        self._send_adu(length=Const.MBAP_HDR_LENGTH + 2 + byte_count,
+                       connection=connection)
+
+    def send_pdu_response(self,
+                          slave_addr: int,
+                          modbus_pdu: bytes,
+                          connection: Optional[TCPConnection] = None) -> None:
+        """
+        Send an already encoded response to a client.
+
+        :param      slave_addr:  The slave address
+        :type       slave_addr:  int
+        :param      modbus_pdu:  The response Protocol Data Unit
+        :type       modbus_pdu:  bytes
+        :param      connection:  The connection of the request, default the
+                                 connection of the latest request
+        :type       connection:  Optional[TCPConnection]
+        """
+        self._send(modbus_pdu, slave_addr, connection)
 
     def send_exception_response(self,
                                 slave_addr: int,
                                 function_code: int,
-                                exception_code: int) -> None:
+                                exception_code: int,
+                                connection: Optional[TCPConnection] = None
+                                ) -> None:
         """
         Send an exception response to a client.
 
@@ -306,10 +1141,13 @@ class TCPServer(object):
         :type       function_code:   int
         :param      exception_code:  The exception code
         :type       exception_code:  int
+        :param      connection:      The connection of the request, default
+                                     the connection of the latest request
+        :type       connection:      Optional[TCPConnection]
         """
         modbus_pdu = functions.exception_response(function_code,
                                                   exception_code)
-        self._send(modbus_pdu, slave_addr)
+        self._send(modbus_pdu, slave_addr, connection)
 
     def _accept_request(self,
                         accept_timeout: float,
@@ -322,6 +1160,11 @@ class TCPServer(object):
         :param      unit_addr_list:  The unit address list
         :type       unit_addr_list:  list
         """
+        if (self._connection is not None and
+                self._connection.rx_buffer.has_adu()):
+            # process further requests received with the previous one first
+            return self._recv_request(unit_addr_list)
+
         self._sock.settimeout(accept_timeout)
         new_client_sock = None
 
@@ -332,52 +1175,172 @@ class TCPServer(object):
                 raise e
 
         if new_client_sock is not None:
-            if self._client_sock is not None:
-                self._client_sock.close()
+            if self._connection is not None:
+                self._connection.sock.close()
 
-            self._client_sock = new_client_sock
+            self._connection = TCPConnection(server=self,
+                                             sock=new_client_sock,
+                                             address=client_address)
 
             # recv() timeout, setting to 0 might lead to the following error
             # "Modbus request error: [Errno 11] EAGAIN"
             # This is a socket timeout error
-            self._client_sock.settimeout(0.5)
+            new_client_sock.settimeout(0.5)
 
-        if self._client_sock is not None:
-            try:
-                req = self._client_sock.recv(128)
+        if self._connection is not None:
+            return self._recv_request(unit_addr_list)
+
+    def _recv_request(self, unit_addr_list: list) -> Union[Request, None]:
+        """
+        Read and decode a request of the current client connection
 
-                if len(req) == 0:
+        :param      unit_addr_list:  The unit address list
+        :type       unit_addr_list:  list
+
+        :returns:   A request object or None.
+        :rtype:     Union[Request, None]
+        """
+        connection = self._connection
+        rx_buffer = connection.rx_buffer
+
+        try:
+            if not rx_buffer.has_adu():
+                data = connection.sock.recv(256)
+
+                if len(data) == 0:
+                    if self._poll is not None:
+                        # closed by the client
+                        self._close_client()
                     return None
 
-                req_header_no_uid = req[:Const.MBAP_HDR_LENGTH - 1]
-                self._req_tid, req_pid, req_len = struct.unpack('>HHH', req_header_no_uid)
-                req_uid_and_pdu = req[Const.MBAP_HDR_LENGTH - 1:Const.MBAP_HDR_LENGTH + req_len - 1]
-            except OSError:
-                # MicroPython raises an OSError instead of socket.timeout
-                # print("Socket OSError aka TimeoutError: {}".format(e))
-                return None
-            except Exception:
-                # print("Modbus request error:", e)
-                self._client_sock.close()
-                self._client_sock = None
-                return None
+                rx_buffer.feed(data)
 
-            if (req_pid != 0):
-                # print("Modbus request error: PID not 0")
-                self._client_sock.close()
-                self._client_sock = None
+            req = rx_buffer.pop_adu()
+            if req is None:
+                # wait for the rest of the request
                 return None
 
-            if ((unit_addr_list is not None) and (req_uid_and_pdu[0] not in unit_addr_list)):
-                return None
+            req_tid, req_pid, req_len = struct.unpack_from('>HHH', req, 0)
+            req_uid_and_pdu = memoryview(req)[Const.MBAP_HDR_LENGTH - 1:Const.MBAP_HDR_LENGTH + req_len - 1]
+        except OSError:
+            # MicroPython raises an OSError instead of socket.timeout
+            # print("Socket OSError aka TimeoutError: {}".format(e))
+            return None
+        except Exception:
+            # print("Modbus request error:", e)
+            self._close_client()
+            return None
 
-            try:
-                return Request(self, req_uid_and_pdu)
-            except ModbusException as e:
-                self.send_exception_response(req[0],
-                                             e.function_code,
-                                             e.exception_code)
-                return None
+        if (req_pid != 0):
+            # print("Modbus request error: PID not 0")
+            self._close_client()
+            return None
+
+        connection.tid = req_tid
+
+        if ((unit_addr_list is not None) and (req_uid_and_pdu[0] not in unit_addr_list)):
+            return None
+
+        try:
+            return connection.request.parse(req_uid_and_pdu)
+        except ModbusException as e:
+            connection.send_exception_response(req_uid_and_pdu[0],
+                                               e.function_code,
+                                               e.exception_code)
+            return None
+
+    def _close_client(self) -> None:
+        """Close the current client connection"""
+        sock = self._connection.sock
+
+        if self._poll is not None:
+            self._poll.unregister(sock)
+            self._connections.pop(sock, None)
+
+        sock.close()
+        self._connection = None
+
+    def _poll_request(self,
+                      timeout: int,
+                      unit_addr_list: list) -> Union[Request, None]:
+        """
+        Poll the listening and all client sockets and decode a request
+
+        New clients are accepted as long as less than the maximum number of
+        connections are open, otherwise the new connection is closed again.
+
+        :param      timeout:         The poll timeout in milliseconds
+        :type       timeout:         int
+        :param      unit_addr_list:  The unit address list
+        :type       unit_addr_list:  list
+
+        :returns:   A request object or None.
+        :rtype:     Union[Request, None]
+        """
+        # process further requests received with a previous one first
+        for sock, connection in list(self._connections.items()):
+            if connection.rx_buffer.has_adu():
+                self._connection = connection
+                req = self._recv_request(unit_addr_list)
+                if req is not None:
+                    return req
+
+        for obj, event in self._poll.poll(timeout):
+            sock = self._poll_socket(obj)
+
+            if sock is self._sock:
+                new_client_sock, client_address = self._sock.accept()
+
+                if len(self._connections) >= self._max_connections:
+                    new_client_sock.close()
+                    continue
+
+                new_client_sock.settimeout(0)
+                self._connections[new_client_sock] = TCPConnection(
+                    server=self,
+                    sock=new_client_sock,
+                    address=client_address)
+                self._poll.register(new_client_sock, select.POLLIN)
+                continue
+
+            if sock not in self._connections:
+                continue
+
+            self._connection = self._connections[sock]
+
+            if event & (select.POLLHUP | select.POLLERR):
+                self._close_client()
+                continue
+
+            req = self._recv_request(unit_addr_list)
+            if req is not None:
+                return req
+
+        return None
+
+    def _poll_socket(self, obj) -> socket.socket:
+        """
+        Get the socket of a poll result.
+
+        MicroPython returns the registered socket, CPython its file descriptor
+
+        :param      obj:  The object returned by poll
+        :type       obj:  Union[socket.socket, int]
+
+        :returns:   The socket
+        :rtype:     socket.socket
+        """
+        if not isinstance(obj, int):
+            return obj
+
+        if obj == self._sock.fileno():
+            return self._sock
+
+        for sock in self._connections:
+            if sock.fileno() == obj:
+                return sock
+
+        return None
 
     def get_request(self,
                     unit_addr_list: Optional[list] = None,
@@ -398,11 +1361,15 @@ class TCPServer(object):
         if self._sock is None:
             raise Exception('Modbus TCP server not bound')
 
+        if self._poll is not None:
+            return self._poll_request(-1 if timeout is None else timeout,
+                                      unit_addr_list)
+
         if timeout > 0:
             start_ms = time.ticks_ms()
             elapsed = 0
             while True:
-                if self._client_sock is None:
+                if self._connection is None:
                     accept_timeout = None if timeout is None else (timeout - elapsed) / 1000
                 else:
                     accept_timeout = 0